@@ -12,11 +12,11 @@ Example:
 """
 
 import argparse
-import json
 import sys
 import time
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -28,6 +28,7 @@ from experiments.validation import EconomicPhenomenaValidator
 from src.environment.simulation import Simulation
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
+from src.utils.serialization import dumps
 
 
 def parse_args():
@@ -202,11 +203,13 @@ def run_simulation(config, steps: int, output_dir: Path, checkpoint_interval: in
     logger.info("\nSaving results...")
 
     # simulation.state.historyから食料支出比率と価格・需要データをマージ
-    history["food_expenditure_ratios"] = sim.state.history.get(
+    # HistoryMatrixはJSONに直接書き出せないためhistory_to_dict()でlistに変換
+    state_history = sim.state.history_to_dict()
+    history["food_expenditure_ratios"] = state_history.get(
         "food_expenditure_ratios", []
     )
-    history["prices"] = sim.state.history.get("prices", {})
-    history["demands"] = sim.state.history.get("demands", {})
+    history["prices"] = state_history.get("prices", {})
+    history["demands"] = state_history.get("demands", {})
 
     results = {
         "history": history,
@@ -221,28 +224,29 @@ def run_simulation(config, steps: int, output_dir: Path, checkpoint_interval: in
 
     # 結果をJSONで保存
     results_file = output_dir / "results.json"
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    results_file.write_bytes(dumps(results, indent=True))
     logger.info(f"Results saved: {results_file}")
 
-    # サマリーの保存
+    # サマリーの保存（系列ごとに配列へ変換し、NumPyで集計）
+    gdp = np.asarray(history["gdp"], dtype=np.float64)
+    unemployment = np.asarray(history["unemployment_rate"], dtype=np.float64)
+    inflation = np.asarray(history["inflation"], dtype=np.float64)
+    gini = np.asarray(history["gini"], dtype=np.float64)
     summary = {
-        "final_gdp": history["gdp"][-1],
-        "final_unemployment": history["unemployment_rate"][-1],
-        "final_inflation": history["inflation"][-1],
-        "final_gini": history["gini"][-1],
-        "avg_gdp": sum(history["gdp"]) / len(history["gdp"]),
-        "avg_unemployment": sum(history["unemployment_rate"])
-        / len(history["unemployment_rate"]),
-        "avg_inflation": sum(history["inflation"]) / len(history["inflation"]),
-        "avg_gini": sum(history["gini"]) / len(history["gini"]),
+        "final_gdp": float(gdp[-1]),
+        "final_unemployment": float(unemployment[-1]),
+        "final_inflation": float(inflation[-1]),
+        "final_gini": float(gini[-1]),
+        "avg_gdp": float(gdp.mean()),
+        "avg_unemployment": float(unemployment.mean()),
+        "avg_inflation": float(inflation.mean()),
+        "avg_gini": float(gini.mean()),
         "execution_time": total_time,
         "steps": steps,
     }
 
     summary_file = output_dir / "summary.json"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    summary_file.write_bytes(dumps(summary, indent=True))
     logger.info(f"Summary saved: {summary_file}")
 
     return results
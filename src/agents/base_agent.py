@@ -4,6 +4,8 @@ Base Agent class for SimCity
 全てのエージェント（家計、企業、政府、中央銀行）の基底クラス
 """
 
+import functools
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -176,48 +178,76 @@ Consider your profile, past actions, and current observation to make a rational
 
         # LLM呼び出し
         try:
+            # 同じエージェント種別はシステムプロンプト・関数定義が共通のため
+            # 種別単位でプロンプトキャッシュをグループ化
             response = self.llm.function_call(
                 system_prompt=self.system_prompt,
                 user_prompt=user_prompt,
                 functions=functions,
+                prompt_cache_key=self.prompt_cache_key,
             )
-
-            # 検証
-            is_valid, error_msg = self.llm.validate_response(
-                response, [f["name"] for f in functions]
-            )
-
-            if not is_valid:
-                logger.warning(
-                    f"Agent {self.agent_id} generated invalid action: {error_msg}"
-                )
-                # フォールバック行動
-                return self._get_fallback_action(observation)
-
-            # メモリに追加
-            action_record = {
-                "step": step,
-                "action": response["function_name"],
-                "arguments": response["arguments"],
-                "observation": observation,
-            }
-            self.memory.append(action_record)
-
-            # メモリサイズを制限
-            if len(self.memory) > self.memory_size * 2:
-                self.memory = self.memory[-self.memory_size :]
-
-            logger.debug(f"Agent {self.agent_id} decided: {response['function_name']}")
-
-            return {
-                "function_name": response["function_name"],
-                "arguments": response["arguments"],
-            }
+            return self._finalize_decision(response, functions, observation, step)
 
         except Exception as e:
             logger.error(f"Agent {self.agent_id} failed to decide action: {e}")
             return self._get_fallback_action(observation)
 
+    @property
+    def prompt_cache_key(self) -> str:
+        """プロンプトキャッシュのグループ名（エージェント種別単位）"""
+        return f"simcity-{self.agent_type}"
+
+    def _finalize_decision(
+        self,
+        response: dict[str, Any],
+        functions: list[dict[str, Any]],
+        observation: dict[str, Any],
+        step: int,
+    ) -> dict[str, Any]:
+        """
+        LLMレスポンスを検証し、メモリに記録して行動を返す
+
+        Args:
+            response: function_call()形式のレスポンス
+            functions: 利用可能な関数定義リスト
+            observation: 環境からの観察情報
+            step: 現在のステップ数
+
+        Returns:
+            選択された行動と引数（不正な場合はフォールバック行動）
+        """
+        # 検証
+        is_valid, error_msg = self.llm.validate_response(
+            response, [f["name"] for f in functions]
+        )
+
+        if not is_valid:
+            logger.warning(
+                f"Agent {self.agent_id} generated invalid action: {error_msg}"
+            )
+            # フォールバック行動
+            return self._get_fallback_action(observation)
+
+        # メモリに追加
+        action_record = {
+            "step": step,
+            "action": response["function_name"],
+            "arguments": response["arguments"],
+            "observation": observation,
+        }
+        self.memory.append(action_record)
+
+        # メモリサイズを制限
+        if len(self.memory) > self.memory_size * 2:
+            self.memory = self.memory[-self.memory_size :]
+
+        logger.debug(f"Agent {self.agent_id} decided: {response['function_name']}")
+
+        return {
+            "function_name": response["function_name"],
+            "arguments": response["arguments"],
+        }
+
     @abstractmethod
     def _get_fallback_action(self, observation: dict[str, Any]) -> dict[str, Any]:
         """
@@ -310,5 +340,133 @@ def load_prompt_template(template_path: str | Path) -> str:
     if not path.exists():
         raise FileNotFoundError(f"Prompt template not found: {template_path}")
 
-    with open(path, encoding="utf-8") as f:
+    # 全エージェントで同じ文字列を共有（エージェント生成ごとのファイル読み込みを省略）
+    return _read_prompt_template(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_prompt_template(resolved_path: str, mtime_ns: int) -> str:
+    """
+    テンプレートファイルの内容を読み込む（パスと更新時刻でキャッシュ）
+
+    Args:
+        resolved_path: 絶対パス
+        mtime_ns: 更新時刻（ファイル変更時にキャッシュを無効化するためのキー）
+
+    Returns:
+        テンプレート文字列
+    """
+    with open(resolved_path, encoding="utf-8") as f:
         return f.read()
+
+
+def decide_actions_batch(
+    agents: list[BaseAgent],
+    observations: list[dict[str, Any]],
+    step: int,
+) -> list[dict[str, Any]]:
+    """
+    複数エージェントの意思決定を1回のLLM呼び出しにまとめて行う（クエリ連結）
+
+    システムプロンプト・関数定義が共通のエージェントをグループ化し、
+    LLMInterface.batch_function_call()で一括して決定する。
+    バッチ呼び出しが失敗した場合は各エージェントのフォールバック行動を返す。
+
+    Args:
+        agents: エージェントのリスト（同じLLMインターフェースを共有）
+        observations: agentsと同じ順の観察情報
+        step: 現在のステップ数
+
+    Returns:
+        agentsと同じ順の行動と引数のリスト
+    """
+    decisions: list[dict[str, Any] | None] = [None] * len(agents)
+
+    groups: dict[tuple[str, str], list[int]] = {}
+    functions_by_group: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for i, agent in enumerate(agents):
+        functions = agent.get_available_actions()
+        group_key = (agent.system_prompt, json.dumps(functions, sort_keys=True))
+        groups.setdefault(group_key, []).append(i)
+        functions_by_group.setdefault(group_key, functions)
+
+    for group_key, indices in groups.items():
+        functions = functions_by_group[group_key]
+        lead = agents[indices[0]]
+        try:
+            responses = lead.llm.batch_function_call(
+                system_prompt=lead.system_prompt,
+                user_prompts=[
+                    agents[i].build_user_prompt(observations[i]) for i in indices
+                ],
+                functions=functions,
+                prompt_cache_key=lead.prompt_cache_key,
+            )
+        except Exception as e:
+            logger.error(f"Batch decision for {len(indices)} agents failed: {e}")
+            for i in indices:
+                decisions[i] = agents[i]._get_fallback_action(observations[i])
+            continue
+
+        for i, response in zip(indices, responses, strict=True):
+            decisions[i] = agents[i]._finalize_decision(
+                response, functions, observations[i], step
+            )
+
+    return decisions
+
+
+def decide_actions_concurrent(
+    agents: list[BaseAgent],
+    observations: list[dict[str, Any]],
+    step: int,
+    max_concurrency: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    複数エージェントの意思決定をエージェントごとのLLM呼び出しで並行に行う
+
+    decide_action()と同じリクエストを非同期に同時実行し、ネットワーク待ちを重ねる。
+    失敗・不正なレスポンスのエージェントはフォールバック行動を返す。
+
+    Args:
+        agents: エージェントのリスト（同じLLMインターフェースを共有）
+        observations: agentsと同じ順の観察情報
+        step: 現在のステップ数
+        max_concurrency: 同時に実行するLLM呼び出し数の上限
+
+    Returns:
+        agentsと同じ順の行動と引数のリスト
+    """
+    if not agents:
+        return []
+
+    functions_list = [agent.get_available_actions() for agent in agents]
+    requests = [
+        {
+            "system_prompt": agent.system_prompt,
+            "user_prompt": agent.build_user_prompt(observation),
+            "functions": functions,
+            "prompt_cache_key": agent.prompt_cache_key,
+        }
+        for agent, observation, functions in zip(
+            agents, observations, functions_list, strict=True
+        )
+    ]
+
+    try:
+        responses = agents[0].llm.run_function_calls(
+            requests, max_concurrency=max_concurrency
+        )
+    except Exception as e:
+        logger.error(f"Concurrent decision for {len(agents)} agents failed: {e}")
+        return [
+            agent._get_fallback_action(observation)
+            for agent, observation in zip(agents, observations, strict=True)
+        ]
+
+    return [
+        agent._finalize_decision(response, functions, observation, step)
+        for agent, response, functions, observation in zip(
+            agents, responses, functions_list, observations, strict=True
+        )
+    ]
@@ -7,7 +7,6 @@ Firm Agent for SimCity Simulation
 3. 投資決定（借入/資本購入）
 """
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +16,7 @@ from src.agents.base_agent import BaseAgent, load_prompt_template
 from src.llm.llm_interface import LLMInterface
 from src.models.data_models import FirmProfile, GoodCategory
 from src.models.economic_models import ProductionFunction
+from src.utils.serialization import loads
 
 if TYPE_CHECKING:
     from src.agents.household import HouseholdAgent
@@ -269,17 +269,45 @@ Location: {self.profile.location}
         }
 
     def calculate_production_capacity(
-        self, households: list["HouseholdAgent"]
+        self,
+        households: list["HouseholdAgent"],
+        households_by_id: dict[int, "HouseholdAgent"] | None = None,
     ) -> float:
         """
         現在の生産能力を計算（Cobb-Douglas）
 
         Args:
             households: 全世帯エージェントのリスト
+            households_by_id: ID→世帯の索引（指定時は従業員を辞書参照で探す）
 
         Returns:
             生産能力（最大生産量）
         """
+        effective_labor = self.calculate_effective_labor(households, households_by_id)
+        if effective_labor == 0:
+            return 0.0
+
+        return self.production_function.calculate_output(
+            labor=effective_labor,
+            capital=self.profile.capital,
+            tfp=self.profile.total_factor_productivity,
+        )
+
+    def calculate_effective_labor(
+        self,
+        households: list["HouseholdAgent"],
+        households_by_id: dict[int, "HouseholdAgent"] | None = None,
+    ) -> float:
+        """
+        スキルマッチングを考慮した実効労働量を計算
+
+        Args:
+            households: 全世帯エージェントのリスト
+            households_by_id: ID→世帯の索引（指定時は従業員を辞書参照で探す）
+
+        Returns:
+            実効労働量（従業員数 × 平均スキル効率、従業員がいない場合は0）
+        """
         labor = len(self.profile.employees)
         if labor == 0:
             return 0.0
@@ -291,10 +319,13 @@ Location: {self.profile.location}
         for employee_id in self.profile.employees:
             # 従業員を探す
             employee = None
-            for h in households:
-                if h.profile.id == employee_id:
-                    employee = h
-                    break
+            if households_by_id is not None:
+                employee = households_by_id.get(employee_id)
+            else:
+                for h in households:
+                    if h.profile.id == employee_id:
+                        employee = h
+                        break
 
             if employee is None:
                 # 従業員が見つからない場合は効率0.5を仮定
@@ -336,13 +367,7 @@ Location: {self.profile.location}
         else:
             avg_efficiency = 0.8  # フォールバック値
 
-        effective_labor = labor * avg_efficiency
-
-        return self.production_function.calculate_output(
-            labor=effective_labor,
-            capital=self.profile.capital,
-            tfp=self.profile.total_factor_productivity,
-        )
+        return labor * avg_efficiency
 
     def check_bankruptcy(self) -> bool:
         """
@@ -403,8 +428,7 @@ class FirmTemplateLoader:
         if not template_path.exists():
             raise FileNotFoundError(f"Firm templates not found: {template_path}")
 
-        with open(template_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads(template_path.read_bytes())
 
         templates = {}
         for firm_data in data.get("firms", []):
@@ -10,6 +10,7 @@ Government Agent for SimCity Simulation
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from src.agents.base_agent import BaseAgent, load_prompt_template
@@ -251,6 +252,18 @@ Macroeconomic Indicators:
         """
         return self.taxation.calculate_income_tax(income)
 
+    def collect_income_tax_batch(self, incomes: np.ndarray) -> np.ndarray:
+        """
+        全世帯の所得税を一括で徴収
+
+        Args:
+            incomes: 世帯ごとの所得
+
+        Returns:
+            世帯ごとの税額
+        """
+        return self.taxation.calculate_income_tax_batch(incomes)
+
     def collect_vat(self, transaction_value: float) -> float:
         """
         付加価値税を徴収
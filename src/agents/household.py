@@ -8,7 +8,6 @@ Household Agent for SimCity Simulation
 4. 金融意思決定（貯蓄/借入/投資）
 """
 
-import random
 from pathlib import Path
 from typing import Any
 
@@ -16,7 +15,8 @@ import numpy as np
 from loguru import logger
 
 from src.agents.base_agent import BaseAgent, load_prompt_template
-from src.data.skill_types import calculate_wage_multiplier, get_all_skill_ids
+from src.data.goods_types import FOOD_GOOD_IDS
+from src.data.skill_types import get_all_skill_ids
 from src.llm.llm_interface import LLMInterface
 from src.models.data_models import (
     EducationLevel,
@@ -37,6 +37,9 @@ class HouseholdAgent(BaseAgent):
     - 金融: 貯蓄、借入、投資の判断
     """
 
+    # 取引ステージで毎取引更新される支出属性はスロットで保持（__dict__参照を回避）
+    __slots__ = ("consumption", "food_spending", "total_spending")
+
     def __init__(
         self,
         household_id: str | None = None,
@@ -665,8 +668,8 @@ Consumption Preferences:
         cost = quantity * price
         self.total_spending += cost
 
-        # 食料財の判定（good_idに"food"が含まれる場合）
-        if "food" in good_id.lower():
+        # 食料財の判定（FOODカテゴリの財IDの集合で判定）
+        if good_id in FOOD_GOOD_IDS:
             self.food_spending += cost
 
         # 購入数量を記録
@@ -676,6 +679,18 @@ Consumption Preferences:
             self.purchased_goods[good_id] = quantity
 
 
+# プロファイル生成用の教育レベル別パラメータ（以下の配列は_EDUCATION_LEVELSと同じ並び）
+_EDUCATION_LEVELS = (
+    EducationLevel.HIGH_SCHOOL,
+    EducationLevel.COLLEGE,
+    EducationLevel.GRADUATE,
+)
+# 年齢層ごとの教育レベルの重み（若い世代は大卒が多い）
+_EDUCATION_WEIGHTS = np.array([[0.2, 0.5, 0.3], [0.3, 0.5, 0.2], [0.4, 0.4, 0.2]])
+_SKILL_COUNT_MIN = np.array([2, 3, 4])  # スキル数の下限（上限は+1）
+_SKILL_BASE_LEVEL = np.array([0.4, 0.6, 0.7])  # スキルレベルの平均
+
+
 class HouseholdProfileGenerator:
     """
     世帯プロファイル生成器
@@ -704,136 +719,138 @@ class HouseholdProfileGenerator:
         self.age_mean = age_mean
         self.age_std = age_std
 
-        if random_seed is not None:
-            np.random.seed(random_seed)
-            random.seed(random_seed)
+        # 生成器専用の乱数生成器（グローバルな乱数状態は変更しない）
+        self._rng = np.random.default_rng(random_seed)
 
         self.next_id = 1
 
-    def generate(self, count: int = 1) -> list[HouseholdProfile]:
+    def generate(
+        self, count: int = 1, seed: int | None = None
+    ) -> list[HouseholdProfile]:
         """
         世帯プロファイルを生成
 
         Args:
             count: 生成する世帯数
+            seed: 指定した場合、この呼び出しだけそのシードの乱数生成器を使用
+                （同じ生成器を使い回しつつ呼び出しごとに再現性を確保）
 
         Returns:
             世帯プロファイルのリスト
         """
-        profiles = []
+        rng = self._rng if seed is None else np.random.default_rng(seed)
 
-        for _ in range(count):
-            profile = self._generate_single()
-            profiles.append(profile)
-            self.next_id += 1
+        profiles = self._generate_batch(count, rng)
+        self.next_id += count
 
         logger.info(f"Generated {count} household profiles")
         return profiles
 
-    def _generate_single(self) -> HouseholdProfile:
-        """単一の世帯プロファイルを生成"""
-        # ID
-        household_id = self.next_id
+    def _generate_batch(
+        self, count: int, rng: np.random.Generator
+    ) -> list[HouseholdProfile]:
+        """
+        count世帯分のプロファイルをまとめて生成
 
-        # 名前
-        name = f"Household_{household_id}"
+        確率的な属性は属性ごとにNumPyで一括サンプリングし、
+        Pythonレベルで行うのはプロファイルの組み立てのみとする
+
+        Args:
+            count: 生成する世帯数
+            rng: 乱数生成器
+
+        Returns:
+            世帯プロファイルのリスト（IDはnext_idから連番）
+        """
+        if count <= 0:
+            return []
 
         # 年齢（正規分布、20-70歳に制限）
-        age = int(np.clip(np.random.normal(self.age_mean, self.age_std), 20, 70))
+        ages = np.clip(rng.normal(self.age_mean, self.age_std, count), 20, 70)
+        ages = ages.astype(np.int64)
 
         # 教育レベル（年齢に応じて決定）
-        if age < 25:
-            # 若い世代は大卒が多い
-            education_weights = [0.2, 0.5, 0.3]  # high_school, college, graduate
-        elif age < 40:
-            education_weights = [0.3, 0.5, 0.2]
-        else:
-            education_weights = [0.4, 0.4, 0.2]
-
-        education_level = random.choices(
-            [
-                EducationLevel.HIGH_SCHOOL,
-                EducationLevel.COLLEGE,
-                EducationLevel.GRADUATE,
-            ],
-            weights=education_weights,
-        )[0]
+        # 年齢層（25歳未満・40歳未満・それ以上）ごとの重み
+        age_bracket = (ages >= 25).astype(np.int64) + (ages >= 40)
+        education_weights = _EDUCATION_WEIGHTS[age_bracket]
+        education_index = (
+            rng.random((count, 1)) >= np.cumsum(education_weights, axis=1)
+        ).sum(axis=1)
+        education_index = np.minimum(education_index, len(_EDUCATION_LEVELS) - 1)
 
         # スキル（教育レベルに応じて2-5個）
-        skill_count = {
-            EducationLevel.HIGH_SCHOOL: random.randint(2, 3),
-            EducationLevel.COLLEGE: random.randint(3, 4),
-            EducationLevel.GRADUATE: random.randint(4, 5),
-        }[education_level]
-
+        skill_counts = _SKILL_COUNT_MIN[education_index] + rng.integers(0, 2, count)
         all_skill_ids = get_all_skill_ids()
-        selected_skills = random.sample(all_skill_ids, skill_count)
-
-        skills = {}
-        for skill_id in selected_skills:
-            # スキルレベル（教育レベルに応じて調整）
-            base_level = {
-                EducationLevel.HIGH_SCHOOL: 0.4,
-                EducationLevel.COLLEGE: 0.6,
-                EducationLevel.GRADUATE: 0.7,
-            }[education_level]
-
-            level = np.clip(np.random.normal(base_level, 0.15), 0.2, 1.0)
-            skills[skill_id] = level
+        # 行ごとのランダムな並べ替えの先頭skill_count個を重複なしで選ぶ
+        skill_order = np.argsort(rng.random((count, len(all_skill_ids))), axis=1)
+        # スキルレベル（教育レベルに応じて調整）
+        skill_levels = np.clip(
+            rng.normal(
+                _SKILL_BASE_LEVEL[education_index][:, None],
+                0.15,
+                (count, skill_counts.max()),
+            ),
+            0.2,
+            1.0,
+        )
 
         # 初期所得（Lognormal分布）
-        log_income = np.random.normal(self.income_mean, self.income_std)
-        initial_cash = np.exp(log_income)
+        initial_cash = np.exp(rng.normal(self.income_mean, self.income_std, count))
 
         # 貯蓄（所得の0-20%）
-        savings = initial_cash * random.uniform(0, 0.2)
-
-        # 月収（スキルベースで計算）
-        base_monthly_income = 2000.0
-        wage_multiplier = calculate_wage_multiplier(skills)
-        monthly_income = base_monthly_income * wage_multiplier
-
-        # 雇用状態（Phase 9.9.4修正: Enum使用に統一）
-        # 全員失業状態で開始し、労働市場でマッチング
-        employment_status = EmploymentStatus.UNEMPLOYED
-        employer_id = None
-        wage = 0.0
-        monthly_income = (
-            0.0  # 失業中は収入なし（reservation_wage計算で最低希望賃金1000になる）
+        savings = initial_cash * rng.uniform(0, 0.2, count)
+
+        # 負債（30%の確率で負債あり）
+        debt = np.where(
+            rng.random(count) < 0.3,
+            initial_cash * rng.uniform(0, 0.5, count),
+            0.0,
         )
 
         # 消費嗜好（ランダム、合計が1になるように正規化）
-        preferences = {}
-        for category in GoodCategory:
-            preferences[category.value] = random.uniform(0.5, 1.5)
-
-        total = sum(preferences.values())
-        preferences = {k: v / total for k, v in preferences.items()}
+        categories = [category.value for category in GoodCategory]
+        preferences = rng.uniform(0.5, 1.5, (count, len(categories)))
+        preferences /= preferences.sum(axis=1, keepdims=True)
 
         # 住居（ランダムな位置）
-        location = (random.randint(0, 99), random.randint(0, 99))
-        housing_cost = monthly_income * random.uniform(0.2, 0.3)  # 収入の20-30%
+        locations = rng.integers(0, 100, (count, 2))
 
-        # 負債（30%の確率で負債あり）
-        debt = initial_cash * random.uniform(0, 0.5) if random.random() < 0.3 else 0.0
-
-        profile = HouseholdProfile(
-            id=household_id,
-            name=name,
-            age=age,
-            education_level=education_level,
-            skills=skills,
-            cash=initial_cash,
-            savings=savings,
-            debt=debt,
-            monthly_income=monthly_income,
-            employment_status=employment_status,
-            employer_id=employer_id,
-            wage=wage,
-            consumption_preferences=preferences,
-            location=location,
-            housing_cost=housing_cost,
-            stock_holdings={},
-        )
+        profiles = []
+        for i, household_id in enumerate(range(self.next_id, self.next_id + count)):
+            skill_count = int(skill_counts[i])
+            skills = dict(
+                zip(
+                    [all_skill_ids[j] for j in skill_order[i, :skill_count]],
+                    skill_levels[i, :skill_count].tolist(),
+                    strict=True,
+                )
+            )
 
-        return profile
+            # 雇用状態（Phase 9.9.4修正: Enum使用に統一）
+            # 全員失業状態で開始し、労働市場でマッチング
+            # 失業中は収入なし（reservation_wage計算で最低希望賃金1000になる）
+            # そのため住居費（収入の20-30%）も0
+            profiles.append(
+                HouseholdProfile(
+                    id=household_id,
+                    name=f"Household_{household_id}",
+                    age=int(ages[i]),
+                    education_level=_EDUCATION_LEVELS[education_index[i]],
+                    skills=skills,
+                    cash=float(initial_cash[i]),
+                    savings=float(savings[i]),
+                    debt=float(debt[i]),
+                    monthly_income=0.0,
+                    employment_status=EmploymentStatus.UNEMPLOYED,
+                    employer_id=None,
+                    wage=0.0,
+                    consumption_preferences=dict(
+                        zip(categories, preferences[i].tolist(), strict=True)
+                    ),
+                    location=(int(locations[i, 0]), int(locations[i, 1])),
+                    housing_cost=0.0,
+                    stock_holdings={},
+                )
+            )
+
+        return profiles
@@ -442,6 +442,9 @@ GOODS_BY_CATEGORY = {
     for category in GoodCategory
 }
 
+# 食料財IDの集合（取引ごとの食料支出判定用）
+FOOD_GOOD_IDS = frozenset(good.good_id for good in GOODS_BY_CATEGORY[GoodCategory.FOOD])
+
 # 必需品リスト
 NECESSITY_GOODS = [good for good in GOODS if good.is_necessity]
 
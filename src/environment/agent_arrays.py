@@ -0,0 +1,131 @@
+"""
+Structure-of-arrays mirror of agent scalars
+
+家計・企業のスカラー属性をSoA（Structure of Arrays）形式のNumPy配列に保持し、
+指標計算・履歴記録・メトリクス集計でのgetattrループを1回の同期パスに集約する
+"""
+
+import numpy as np
+
+from src.models.data_models import EmploymentStatus
+
+# SoAで保持する家計属性（行インデックス）
+HOUSEHOLD_FIELDS = (
+    "monthly_income",
+    "consumption",
+    "food_spending",
+    "total_spending",
+    "employed",
+)
+
+# SoAで保持する企業属性（行インデックス）
+FIRM_FIELDS = (
+    "capital",
+    "investment",
+    "job_openings",
+)
+
+
+class AgentArrays:
+    """
+    エージェントのスカラー属性のSoAミラー
+
+    各属性は事前確保した連続配列（属性ごとに1行）に格納され、
+    sync_households()/sync_firms()の1パスでまとめて更新される。
+    集計はhousehold()/firm()が返す配列ビューに対してNumPyで行う。
+    """
+
+    def __init__(self, household_capacity: int = 0, firm_capacity: int = 0):
+        """
+        Args:
+            household_capacity: 事前確保する家計数
+            firm_capacity: 事前確保する企業数
+        """
+        self._households = np.zeros((len(HOUSEHOLD_FIELDS), max(household_capacity, 1)))
+        self._firms = np.zeros((len(FIRM_FIELDS), max(firm_capacity, 1)))
+        self._household_rows = {name: i for i, name in enumerate(HOUSEHOLD_FIELDS)}
+        self._firm_rows = {name: i for i, name in enumerate(FIRM_FIELDS)}
+        self.num_households = 0
+        self.num_firms = 0
+
+    @staticmethod
+    def _ensure_capacity(table: np.ndarray, size: int) -> np.ndarray:
+        """容量が不足している場合は2倍以上に拡張した配列を返す"""
+        capacity = table.shape[1]
+        if size <= capacity:
+            return table
+        grown = np.zeros((table.shape[0], max(size, 2 * capacity)))
+        grown[:, :capacity] = table
+        return grown
+
+    def sync_households(self, households: list) -> int:
+        """
+        家計エージェントの属性を1パスで配列に反映
+
+        Args:
+            households: HouseholdAgentのリスト
+
+        Returns:
+            家計数
+        """
+        n = len(households)
+        self._households = self._ensure_capacity(self._households, n)
+        employed = EmploymentStatus.EMPLOYED
+        rows = [
+            (
+                h.profile.monthly_income,
+                h.consumption,
+                h.food_spending,
+                h.total_spending,
+                h.profile.employment_status == employed,
+            )
+            for h in households
+        ]
+        if n:
+            self._households[:, :n] = np.array(rows, dtype=np.float64).T
+        self.num_households = n
+        return n
+
+    def sync_firms(self, firms: list) -> int:
+        """
+        企業エージェントの属性を1パスで配列に反映
+
+        Args:
+            firms: FirmAgentのリスト
+
+        Returns:
+            企業数
+        """
+        n = len(firms)
+        self._firms = self._ensure_capacity(self._firms, n)
+        rows = [
+            (f.profile.capital, f.investment, f.profile.job_openings) for f in firms
+        ]
+        if n:
+            self._firms[:, :n] = np.array(rows, dtype=np.float64).T
+        self.num_firms = n
+        return n
+
+    def household(self, name: str) -> np.ndarray:
+        """
+        家計属性の配列ビューを取得
+
+        Args:
+            name: HOUSEHOLD_FIELDSのいずれか
+
+        Returns:
+            長さnum_householdsの配列ビュー
+        """
+        return self._households[self._household_rows[name], : self.num_households]
+
+    def firm(self, name: str) -> np.ndarray:
+        """
+        企業属性の配列ビューを取得
+
+        Args:
+            name: FIRM_FIELDSのいずれか
+
+        Returns:
+            長さnum_firmsの配列ビュー
+        """
+        return self._firms[self._firm_rows[name], : self.num_firms]
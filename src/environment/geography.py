@@ -7,6 +7,7 @@ Geography System for SimCity Simulation
 - 距離計算（通勤距離等）
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -64,6 +65,31 @@ class Building:
             return True
         return False
 
+    def add_occupants(self, occupant_ids: Iterable[int]) -> int:
+        """
+        複数の居住者/従業員を一括追加
+
+        add_occupant()を順に呼んだ場合と同じく、既にいるIDと定員を超える分は追加しない
+
+        Args:
+            occupant_ids: 追加するIDの列
+
+        Returns:
+            追加した人数
+        """
+        occupants = self.occupants
+        present = set(occupants)
+        vacancy = self.capacity - len(occupants)
+        added = 0
+        for occupant_id in occupant_ids:
+            if added >= vacancy:
+                break
+            if occupant_id not in present:
+                present.add(occupant_id)
+                occupants.append(occupant_id)
+                added += 1
+        return added
+
     def remove_occupant(self, occupant_id: int) -> bool:
         """居住者/従業員を削除"""
         if occupant_id in self.occupants:
@@ -0,0 +1,106 @@
+"""
+Auction Assignment for SimCity Markets
+
+Bertsekasのオークションアルゴリズムによる割当:
+- 全ての未割当者が同時に入札するJacobi型（入札をNumPyで一括計算）
+- 最小入札増分εで総利得の最適性を保証（最適値から入札者数×ε以内）
+- 割当しない選択肢（価値0）を許容する非対称割当
+"""
+
+import numpy as np
+
+
+def auction_assign(
+    benefit: np.ndarray,
+    eps: float | None = None,
+    max_iterations: int = 100_000,
+) -> np.ndarray:
+    """
+    利得行列に対する最大重み割当をオークションで求める
+
+    各行（入札者）は高々1列（対象）、各列は高々1行に割り当てられる。
+    利得が0以下または-infの組は割当しない（割当なしの価値を0とする）。
+    価格0から開始するため、結果の総利得は最適値から行数×ε以内となる。
+
+    Args:
+        benefit: (入札者数, 対象数)の利得行列（-infは割当不可）
+        eps: 最小入札増分（Noneの場合は利得の最大値の1/1000）
+        max_iterations: 入札ラウンドの上限
+
+    Returns:
+        各行の割当先の列インデックス（割当なしは-1）
+    """
+    benefit = np.asarray(benefit, dtype=np.float64)
+    num_bidders, num_objects = benefit.shape
+    if num_bidders == 0 or num_objects == 0:
+        return np.full(num_bidders, -1, dtype=np.int64)
+
+    finite = np.isfinite(benefit)
+    max_benefit = float(benefit[finite].max()) if finite.any() else 0.0
+    if max_benefit <= 0:
+        return np.full(num_bidders, -1, dtype=np.int64)
+
+    if eps is None:
+        eps = max_benefit * 1e-3
+    return _run_auction(benefit, np.zeros(num_objects), eps, max_iterations)
+
+
+def _run_auction(
+    benefit: np.ndarray,
+    prices: np.ndarray,
+    eps: float,
+    max_iterations: int,
+) -> np.ndarray:
+    """
+    固定εでのオークション（pricesはその場で更新）
+
+    Returns:
+        各行の割当先の列インデックス（割当なしは-1）
+    """
+    num_bidders, num_objects = benefit.shape
+    assignment = np.full(num_bidders, -1, dtype=np.int64)
+    owner = np.full(num_objects, -1, dtype=np.int64)
+    # 割当なしを選んだ入札者（価格は下がらないため以後も入札しない）
+    withdrawn = np.zeros(num_bidders, dtype=bool)
+
+    for _ in range(max_iterations):
+        bidders = np.flatnonzero((assignment < 0) & ~withdrawn)
+        if len(bidders) == 0:
+            break
+
+        # 各入札者の純利得（利得 - 価格）の最良・次点
+        values = benefit[bidders] - prices
+        best = np.argmax(values, axis=1)
+        rows = np.arange(len(bidders))
+        best_values = values[rows, best]
+        if num_objects > 1:
+            values[rows, best] = -np.inf
+            second_values = np.maximum(values.max(axis=1), 0.0)
+        else:
+            second_values = np.zeros(len(bidders))
+
+        # 純利得が割当なし（0）以下なら撤退
+        active = best_values > 0
+        withdrawn[bidders[~active]] = True
+        bidders = bidders[active]
+        if len(bidders) == 0:
+            continue
+        targets = best[active]
+        bids = prices[targets] + best_values[active] - second_values[active] + eps
+
+        # 対象ごとの最高入札を採用（同額は先の入札者）
+        order = np.lexsort((-bids, targets))
+        targets_sorted = targets[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = targets_sorted[1:] != targets_sorted[:-1]
+        winners = bidders[order[first]]
+        won = targets_sorted[first]
+
+        # 以前の落札者を未割当に戻し、落札者を割り当てる
+        previous = owner[won]
+        assignment[previous[previous >= 0]] = -1
+        owner[won] = winners
+        assignment[winners] = won
+        prices[won] = bids[order[first]]
+
+    return assignment
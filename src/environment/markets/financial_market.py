@@ -12,7 +12,7 @@ from typing import Any
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositRequest:
     """預金申請"""
 
@@ -20,7 +20,7 @@ class DepositRequest:
     amount: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LoanRequest:
     """貸出申請"""
 
@@ -29,7 +29,7 @@ class LoanRequest:
     purpose: str  # "capital_investment", "working_capital"
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialTransaction:
     """金融取引結果"""
 
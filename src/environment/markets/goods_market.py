@@ -10,10 +10,11 @@ Goods Market for SimCity Simulation
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class GoodListing:
     """
     財の出品情報
@@ -31,7 +32,7 @@ class GoodListing:
     price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GoodOrder:
     """
     財の注文情報
@@ -49,7 +50,7 @@ class GoodOrder:
     max_price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     取引結果
@@ -102,6 +103,9 @@ class GoodsMarket:
         ] = {}  # 財IDごとの直近取引価格リスト
         self.recent_demands: dict[str, float] = {}  # 財IDごとの直近需要量
 
+        # 市場価格の配列キャッシュ（財ID配列, 価格配列）。取引価格が変わると破棄
+        self._price_arrays: tuple[np.ndarray, np.ndarray] | None = None
+
         logger.info(
             f"GoodsMarket initialized: price_adjustment={enable_price_adjustment}"
         )
@@ -158,6 +162,7 @@ class GoodsMarket:
                 self.recent_transactions[good_id] = self.recent_transactions[good_id][
                     -10:
                 ]
+                self._price_arrays = None
 
             # 未充足需要と未売却在庫を記録（マッチング前の値を使用）
             total_supplied = total_supplied_before
@@ -253,12 +258,36 @@ class GoodsMarket:
         Returns:
             財IDをキーとした価格辞書
         """
-        prices = {}
-        for good_id, price_list in self.recent_transactions.items():
-            if price_list:
-                # 直近の取引価格の平均
-                prices[good_id] = sum(price_list) / len(price_list)
-        return prices
+        good_ids, prices = self.get_market_prices_array()
+        return dict(zip(good_ids.tolist(), prices.tolist(), strict=True))
+
+    def get_market_prices_array(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        各財の市場価格を配列で取得（直近の取引価格の平均）
+
+        取引価格が更新されるまでは同じ配列オブジェクトを返すため、
+        呼び出し側は財IDの並びが変わったかを同一性で判定できる。
+        返す配列は読み取り専用。
+
+        Returns:
+            (財ID配列, 価格配列) のタプル（同じ並び）
+        """
+        if self._price_arrays is None:
+            good_ids = []
+            prices = []
+            for good_id, price_list in self.recent_transactions.items():
+                if price_list:
+                    good_ids.append(good_id)
+                    # 直近の取引価格の平均
+                    prices.append(sum(price_list) / len(price_list))
+
+            good_ids_array = np.array(good_ids, dtype=object)
+            prices_array = np.array(prices, dtype=np.float64)
+            good_ids_array.flags.writeable = False
+            prices_array.flags.writeable = False
+            self._price_arrays = (good_ids_array, prices_array)
+
+        return self._price_arrays
 
     def get_market_demands(self) -> dict[str, float]:
         """
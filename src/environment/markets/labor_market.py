@@ -5,6 +5,7 @@ Labor Market for SimCity Simulation
 - 求人と求職者のマッチング
 - スキルベースの適合度計算
 - 確率的マッチングアルゴリズム
+- 大規模時のオークション割当（auction.py）
 """
 
 import random
@@ -14,8 +15,10 @@ from typing import Any
 import numpy as np
 from loguru import logger
 
+from src.environment.markets.auction import auction_assign
 
-@dataclass
+
+@dataclass(slots=True)
 class JobPosting:
     """
     求人情報
@@ -35,7 +38,7 @@ class JobPosting:
     location: tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class JobSeeker:
     """
     求職者情報
@@ -55,7 +58,7 @@ class JobSeeker:
     currently_employed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class JobMatch:
     """
     マッチング結果
@@ -88,16 +91,20 @@ class LaborMarket:
         matching_probability: float = 0.7,
         consider_distance: bool = False,
         max_commute_distance: float = 50.0,
+        auction_threshold: int | None = None,
     ):
         """
         Args:
             matching_probability: マッチング成功確率（0.0-1.0）
             consider_distance: 距離を考慮するか
             max_commute_distance: 最大通勤距離
+            auction_threshold: 求人枠数と求職者数の小さい方がこれを超えた場合、
+                オークション割当でマッチング（Noneの場合は常に逐次マッチング）
         """
         self.matching_probability = matching_probability
         self.consider_distance = consider_distance
         self.max_commute_distance = max_commute_distance
+        self.auction_threshold = auction_threshold
 
         # 統計情報
         self.total_postings = 0
@@ -134,9 +141,16 @@ class LaborMarket:
             マッチング結果のリスト
         """
         # 求人枠の総数をカウント
-        self.total_postings += sum(p.num_openings for p in job_postings)
+        total_openings = sum(p.num_openings for p in job_postings)
+        self.total_postings += total_openings
         self.total_seekers += len(job_seekers)
 
+        if (
+            self.auction_threshold is not None
+            and min(total_openings, len(job_seekers)) > self.auction_threshold
+        ):
+            return self._match_by_auction(job_postings, job_seekers)
+
         matches: list[JobMatch] = []
         matched_seekers = set()
 
@@ -269,6 +283,77 @@ class LaborMarket:
 
         return matches
 
+    def _match_by_auction(
+        self,
+        job_postings: list[JobPosting],
+        job_seekers: list[JobSeeker],
+    ) -> list[JobMatch]:
+        """
+        求人と求職者をオークション割当でマッチング（大規模向け）
+
+        逐次マッチングと同じスコア・賃金条件・距離条件・確率判定で候補を絞り、
+        求人枠を列に展開した利得行列に対して総スコア最大の割当を一括で求める。
+
+        Args:
+            job_postings: 求人リスト
+            job_seekers: 求職者リスト
+
+        Returns:
+            マッチング結果のリスト
+        """
+        open_postings = [p for p in job_postings if p.num_openings > 0]
+
+        # 求職者×求人の利得（割当不可の組は-inf）
+        pair_benefit = np.full((len(job_seekers), len(open_postings)), -np.inf)
+        for i, seeker in enumerate(job_seekers):
+            for j, (score, posting) in enumerate(
+                self._score_job_postings(seeker, open_postings)
+            ):
+                if posting.wage_offered < seeker.reservation_wage:
+                    self.rejected_by_wage += 1
+                    continue
+                if self.consider_distance and (
+                    self._calculate_distance(seeker.location, posting.location)
+                    > self.max_commute_distance
+                ):
+                    self.rejected_by_distance += 1
+                    continue
+                if random.random() > self.matching_probability:
+                    self.rejected_by_probability += 1
+                    continue
+                pair_benefit[i, j] = score
+
+        # 求人枠を列に展開（1求人あたり最大で求職者数まで）
+        slot_postings = np.repeat(
+            np.arange(len(open_postings)),
+            [min(p.num_openings, len(job_seekers)) for p in open_postings],
+        )
+        assignment = auction_assign(pair_benefit[:, slot_postings])
+
+        matches: list[JobMatch] = []
+        for i, slot in enumerate(assignment.tolist()):
+            if slot < 0:
+                continue
+            posting_index = slot_postings[slot]
+            posting = open_postings[posting_index]
+            matches.append(
+                JobMatch(
+                    firm_id=posting.firm_id,
+                    household_id=job_seekers[i].household_id,
+                    wage=posting.wage_offered,
+                    skill_match_score=float(pair_benefit[i, posting_index]),
+                )
+            )
+            posting.num_openings -= 1
+            self.total_matches += 1
+
+        logger.info(
+            f"Labor market auction matching: {len(matches)} matches "
+            f"from {len(job_postings)} postings and {len(job_seekers)} seekers"
+        )
+
+        return matches
+
     def _score_job_postings(
         self, seeker: JobSeeker, postings: list[JobPosting]
     ) -> list[tuple[float, JobPosting]]:
@@ -4,21 +4,29 @@ Simulation engine for SimCity
 シミュレーションのメインループと状態管理を提供
 """
 
-import json
+import functools
 import random
+from operator import attrgetter
 from pathlib import Path
 
+import numpy as np
 from loguru import logger
 
+from src.agents.base_agent import decide_actions_batch, decide_actions_concurrent
 from src.agents.central_bank import CentralBankAgent
 from src.agents.firm import FirmAgent, FirmTemplateLoader
 from src.agents.government import GovernmentAgent
 from src.agents.household import HouseholdAgent, HouseholdProfileGenerator
+from src.environment._kernels import gini_price_index, warmup_kernels
+from src.environment.agent_arrays import AgentArrays
 from src.environment.markets.financial_market import FinancialMarket
 from src.environment.markets.goods_market import GoodListing, GoodOrder, GoodsMarket
 from src.environment.markets.labor_market import JobPosting, JobSeeker, LaborMarket
+from src.llm.cache import LLMResponseCache
 from src.llm.llm_interface import LLMInterface
 from src.models.data_models import (
+    HOUSEHOLD_HISTORY_KEYS,
+    SCALAR_HISTORY_KEYS,
     CentralBankState,
     FirmProfile,
     GovernmentState,
@@ -26,8 +34,62 @@ from src.models.data_models import (
     MarketState,
     SimulationState,
 )
-from src.models.economic_models import MacroeconomicIndicators
+from src.models.economic_models import cobb_douglas_output
 from src.utils.config import SimCityConfig, get_api_key
+from src.utils.serialization import ParquetChunkWriter, dumps, loads
+
+# HouseholdAgentは__init__でconsumptionを必ず設定するため既定値は不要
+_get_consumption = attrgetter("consumption")
+
+
+def _step_cached(method):
+    """
+    引数なしメソッドの結果を現在ステップの間だけメモ化するデコレータ
+
+    self.state.stepが変わるか_step_cacheがクリアされるまで前回の結果を再利用する。
+    呼び出し側が変更しても影響しないよう、辞書のコピーを返す。
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._step_cache
+        if cache.get("_step") != self.state.step:
+            cache.clear()
+            cache["_step"] = self.state.step
+        if name not in cache:
+            cache[name] = method(self)
+        return dict(cache[name])
+
+    return wrapper
+
+
+def _sample_rows_without_replacement(
+    rng: np.random.Generator, population: int, rows: int, k: int
+) -> np.ndarray:
+    """
+    行ごとにrange(population)からk個を非復元抽出
+
+    全行の順列（rows×population）を作らず、k回の一様抽出で(rows, k)の結果を得る。
+    j回目はpopulation-j個の未選択要素から選び、選択済みの値を昇順に飛ばして
+    元のインデックスに戻す。各行の先頭m列は一様な非復元抽出になる。
+
+    Args:
+        rng: 乱数生成器
+        population: 母集団の大きさ
+        rows: 行数
+        k: 行ごとの抽出数（population以下）
+
+    Returns:
+        (rows, k)のインデックス配列
+    """
+    chosen = np.empty((rows, k), dtype=np.int64)
+    for j in range(k):
+        draw = rng.integers(0, population - j, size=rows)
+        for previous in np.sort(chosen[:, :j], axis=1).T:
+            draw += draw >= previous
+        chosen[:, j] = draw
+    return chosen
 
 
 class Simulation:
@@ -41,12 +103,15 @@ class Simulation:
     4. Revision Stage (LLMによる意思決定)
     """
 
-    def __init__(self, config: SimCityConfig):
+    def __init__(self, config: SimCityConfig, history_dir: str | Path | None = None):
         """
         Args:
             config: シミュレーション設定
+            history_dir: 指定した場合、スカラー指標の履歴を<key>.npyに
+                メモリマップしてステップごとに書き込む
         """
         self.config = config
+        self.history_dir = Path(history_dir) if history_dir is not None else None
         self.state = SimulationState()
 
         # 初期化
@@ -64,41 +129,38 @@ class Simulation:
 
         # LLMインターフェースの初期化（環境変数から直接取得）
         api_key = get_api_key("OPENAI_API_KEY")
+        cache_config = self.config.llm_cache
         self.llm_interface = LLMInterface(
             api_key=api_key,
             model="gpt-4o-mini",
             temperature=0.7,
             max_tokens=2000,
+            response_cache=(
+                LLMResponseCache(**cache_config.model_dump(exclude={"enabled"}))
+                if cache_config.enabled
+                else None
+            ),
         )
 
         # Phase 8.4: 前期の資本ストック（投資計算用）
         # エージェント初期化前に必要（企業作成時に使用）
         self.prev_capital_stocks = {}
 
+        # 流入世帯のプロファイル生成器（_get_household_generator()で初回に生成）
+        self._household_generator: HouseholdProfileGenerator | None = None
+
         # エージェントの初期化
         self._initialize_agents()
 
         # 市場の初期化
         self._initialize_markets()
 
-        # 履歴の初期化
-        self.state.history = {
-            "gdp": [],
-            "real_gdp": [],
-            "inflation": [],
-            "unemployment_rate": [],
-            "gini": [],
-            "policy_rate": [],
-            "num_households": [],
-            "num_firms": [],
-            "vacancy_rate": [],
-            "consumption": [],
-            "investment": [],
-            "household_incomes": [],
-            "food_expenditure_ratios": [],
-            "prices": {},
-            "demands": {},
-        }
+        # 履歴の初期化（max_steps・最大世帯数分を事前確保）
+        self.state.init_history(
+            capacity=self.config.simulation.max_steps,
+            household_capacity=self.config.agents.households.max,
+            mmap_dir=self.history_dir,
+        )
 
         # 基準年価格（ステップ0で設定）
         self.base_year_prices = None
@@ -106,9 +168,40 @@ class Simulation:
         # 前期の価格指数（インフレ率計算用）
         self.prev_price_index = None
 
+        # 家計・企業スカラー属性のSoAミラー（指標集計用）
+        self._agent_arrays = AgentArrays(
+            household_capacity=self.config.agents.households.max,
+            firm_capacity=self.config.agents.firms.max,
+        )
+
+        # 企業ごとの月次賃金総額（_refresh_firm_wage_bills()で更新）
+        self._firm_wage_bills = np.zeros(0)
+
+        # 財ID→配列インデックスの対応と基準年価格配列（価格指数計算用）
+        self._good_index: dict[str, int] = {}
+        self._base_price_array = np.zeros(0)
+        self._base_price_mask = np.zeros(0, dtype=bool)
+        self._price_layout_cache: tuple[np.ndarray, np.ndarray, np.ndarray] | None = (
+            None
+        )
+
+        # ステージ内の確率的処理で共有する乱数生成器（各ステージで配列単位に一括抽選）
+        self._rng = np.random.default_rng(self.config.simulation.random_seed)
+
+        # 指標カーネルのJITコンパイルを初期化時に済ませる（Numba使用時）
+        warmup_kernels()
+
         # 問題4修正: 指標計算のキャッシュ（ログ重複解消）
         self._cached_indicators = None
 
+        # 財市場の価格・需要スナップショット（_market_snapshot()参照）
+        self._market_snapshot_cache: (
+            tuple[dict[str, float], dict[str, float]] | None
+        ) = None
+
+        # _step_cachedのメモ（"_step"キーにステップ番号、他はメソッド名→結果）
+        self._step_cache: dict[str, object] = {}
+
         logger.info("State initialized")
 
     def _initialize_agents(self):
@@ -118,10 +211,9 @@ class Simulation:
         # 世帯エージェントの初期化
         household_data_file = Path("data/initial_households.json")
         if household_data_file.exists():
-            # データファイルから読み込み
-            with open(household_data_file, encoding="utf-8") as f:
-                household_data = json.load(f)
-                household_profiles = household_data.get("households", [])
+            # データファイルから読み込み（orjsonがあれば使用）
+            household_data = loads(household_data_file.read_bytes())
+            household_profiles = household_data.get("households", [])
 
             self.households = [
                 HouseholdAgent(
@@ -139,6 +231,8 @@ class Simulation:
                 random_seed=self.config.simulation.random_seed
             )
             profiles = generator.generate(count=self.config.agents.households.initial)
+            # 流入世帯の生成に使い回す（IDは続きから採番）
+            self._household_generator = generator
 
             self.households = [
                 HouseholdAgent(
@@ -240,6 +334,13 @@ class Simulation:
             llm_interface=self.llm_interface,
         )
 
+        # ID→エージェントの索引（取引結果の反映をO(1)の辞書参照で行う）
+        self._households_by_id: dict = {}
+        self._register_households(self.households)
+        self._firms_by_id = {}
+        for firm in self.firms:
+            self._firms_by_id.setdefault(firm.profile.id, firm)
+
         # SimulationStateに設定
         self.state.households = [h.profile for h in self.households]
         self.state.firms = [f.profile for f in self.firms]
@@ -250,6 +351,20 @@ class Simulation:
             f"Agents initialized: {len(self.households)} households, {len(self.firms)} firms"
         )
 
+    def _register_households(self, households: list[HouseholdAgent]):
+        """
+        世帯をID索引に登録
+
+        IDが重複する場合は先に登録された世帯を優先する
+        （リストを先頭から線形探索した場合と同じ世帯を返すため）
+
+        Args:
+            households: 登録する世帯エージェントのリスト
+        """
+        households_by_id = self._households_by_id
+        for household in households:
+            households_by_id.setdefault(household.profile.id, household)
+
     def _initialize_markets(self):
         """市場の初期化"""
         logger.info("Initializing markets...")
@@ -260,7 +375,12 @@ class Simulation:
             k: v
             for k, v in labor_config.items()
             if k
-            in ["matching_probability", "consider_distance", "max_commute_distance"]
+            in [
+                "matching_probability",
+                "consider_distance",
+                "max_commute_distance",
+                "auction_threshold",
+            ]
         }
         self.labor_market = LaborMarket(**labor_params)
 
@@ -295,6 +415,9 @@ class Simulation:
         """
         logger.info(f"=== Step {self.state.step} ===")
 
+        # 前ステップの市場スナップショットを破棄
+        self._market_snapshot_cache = None
+
         # フェーズ管理
         if self.state.step >= self.config.simulation.phase1_steps:
             if self.state.phase == "move_in":
@@ -326,6 +449,13 @@ class Simulation:
         # ステップカウンタ更新
         self.state.step += 1
 
+        # get_indicators()/get_metrics()用に今ステップの指標を保持
+        # （戻り値を呼び出し側が変更してもキャッシュに影響しないようコピーを保持）
+        self._step_cache = {
+            "_step": self.state.step,
+            "_current_indicators": dict(indicators),
+        }
+
         # 問題4修正: キャッシュをクリア（次のステップのため）
         self._cached_indicators = None
 
@@ -355,11 +485,14 @@ class Simulation:
         from src.models.data_models import EmploymentStatus
 
         sync_count = 0
+        # 全企業の従業員IDを集合にまとめ、世帯ごとの企業走査を省略
+        employed_ids = set()
+        for firm in self.firms:
+            employed_ids.update(firm.profile.employees)
+
         for household in self.households:
             # 実際にどこかの企業の従業員リストに含まれているか確認
-            is_employed = any(
-                household.profile.id in firm.profile.employees for firm in self.firms
-            )
+            is_employed = household.profile.id in employed_ids
 
             # ステータスを同期
             if (
@@ -387,18 +520,18 @@ class Simulation:
 
         # 0. 賃金支払い（Phase 9.9.3: 毎月の賃金支払い処理）
         total_wages_paid = 0.0
+        households_by_id = self._households_by_id
         for firm in self.firms:
             for employee_id in firm.profile.employees:
                 # 従業員を検索
-                for household in self.households:
-                    if household.profile.id == employee_id:
-                        # 賃金支払い
-                        wage = firm.profile.wage_offered
-                        firm.profile.cash -= wage
-                        household.profile.cash += wage
-                        household.profile.monthly_income = wage
-                        total_wages_paid += wage
-                        break
+                household = households_by_id.get(employee_id)
+                if household is not None:
+                    # 賃金支払い
+                    wage = firm.profile.wage_offered
+                    firm.profile.cash -= wage
+                    household.profile.cash += wage
+                    household.profile.monthly_income = wage
+                    total_wages_paid += wage
 
         if total_wages_paid > 0:
             logger.info(
@@ -409,10 +542,9 @@ class Simulation:
 
         # 1. 企業が生産して出品
         listings = []
-        for firm in self.firms:
-            # 生産能力を計算（スキルマッチング考慮）
-            capacity = firm.calculate_production_capacity(self.households)
-
+        # 生産能力を全企業まとめて計算（スキルマッチング考慮）
+        capacities = self._production_capacities()
+        for firm, capacity in zip(self.firms, capacities.tolist(), strict=True):
             # 初期生産量（生産能力の50%）
             production_qty = capacity * 0.5 if capacity > 0 else 100.0
 
@@ -432,43 +564,61 @@ class Simulation:
                 listings.append(listing)
 
         # 2. 世帯が消費注文（Phase 8.1: LLM決定を使用）
-        orders = []
-        for household in self.households:
-            # Phase 8.5: 消費平滑化（バッファ・ストック貯蓄モデル）
-            # 現金保有量に応じて消費率を調整し、恒常所得仮説を簡易実装
-            if household.profile.monthly_income > 0:
-                cash_to_income_ratio = household.profile.cash / max(
-                    household.profile.monthly_income, 500.0
-                )
-
-                if cash_to_income_ratio > 3.0:
-                    # 高い現金準備（月収の3倍以上）→ 消費増加（85%）
-                    consumption_rate = 0.85
-                    logger.debug(
-                        f"Household {household.profile.id}: High cash reserves (ratio={cash_to_income_ratio:.2f}), consuming 85%"
-                    )
-                elif cash_to_income_ratio < 1.0:
-                    # 低い現金準備（月収未満）→ 消費抑制・貯蓄重視（75%）
-                    consumption_rate = 0.75
-                    logger.debug(
-                        f"Household {household.profile.id}: Low cash reserves (ratio={cash_to_income_ratio:.2f}), consuming 75%"
-                    )
-                else:
-                    # 通常の現金準備 → 標準消費（80%）
-                    consumption_rate = 0.80
-            else:
-                # 所得がない場合でも、現金があれば最低限消費可能
-                consumption_rate = 0.5  # 現金の50%まで消費可能
-
-            budget = household.profile.monthly_income * consumption_rate
+        households = self.households
+        num_households = len(households)
+        budgets = self._consumption_budgets(
+            np.fromiter(
+                (h.profile.monthly_income for h in households),
+                dtype=np.float64,
+                count=num_households,
+            ),
+            np.fromiter(
+                (h.profile.cash for h in households),
+                dtype=np.float64,
+                count=num_households,
+            ),
+        )
 
-            # 所得がなくても現金がある場合は最低限の消費を許可
-            if budget <= 0 and household.profile.cash > 100:
-                budget = min(
-                    household.profile.cash * consumption_rate,
-                    household.profile.cash * 0.3,
-                )
+        # 財ごとの最安出品（LLM決定の注文先、同価格なら先の出品を優先）
+        cheapest_listings: dict[str, GoodListing] = {}
+        for listing in listings:
+            current = cheapest_listings.get(listing.good_id)
+            if current is None or listing.price < current.price:
+                cheapest_listings[listing.good_id] = listing
+
+        # 問題2修正: フォールバック時に複数財（3-5種）をランダム選択し、予算を分散
+        # 全世帯分の選択財と注文数量をNumPyで一括計算（注文オブジェクトは世帯順に生成）
+        num_listings = len(listings)
+        if num_listings:
+            rng = self._rng
+            # 出品数が少ない場合は全て選択
+            num_goods = np.minimum(
+                rng.integers(3, 6, size=num_households), num_listings
+            )
+            choices = _sample_rows_without_replacement(
+                rng, num_listings, num_households, int(num_goods.max(initial=0))
+            )
+            listing_prices = np.fromiter(
+                (listing.price for listing in listings),
+                dtype=np.float64,
+                count=num_listings,
+            )
+            listing_quantities = np.fromiter(
+                (listing.quantity for listing in listings),
+                dtype=np.float64,
+                count=num_listings,
+            )
+            # 予算を財数で均等分配し、予算内かつ出品数量以下の注文数量を計算
+            budget_per_good = budgets / num_goods
+            fallback_quantities = np.minimum(
+                budget_per_good[:, None] / listing_prices[choices],
+                listing_quantities[choices],
+            )
 
+        orders = []
+        for i, (household, budget) in enumerate(
+            zip(households, budgets.tolist(), strict=True)
+        ):
             if budget <= 0:
                 continue
 
@@ -485,16 +635,11 @@ class Simulation:
                     if remaining_budget <= 0:
                         break  # 予算を使い切った
 
-                    # この財の出品を探す
-                    matching_listings = [
-                        listing for listing in listings if listing.good_id == good_id
-                    ]
-                    if not matching_listings:
+                    # この財の最も安い出品を選択
+                    target_listing = cheapest_listings.get(good_id)
+                    if target_listing is None:
                         continue  # この財の出品がない
 
-                    # 最も安い出品を選択
-                    target_listing = min(matching_listings, key=lambda x: x.price)
-
                     # 購入数量を決定（予算内かつLLM希望数量以下）
                     affordable_qty = remaining_budget / target_listing.price
                     order_qty = min(
@@ -514,65 +659,122 @@ class Simulation:
                 # 決定を使用したのでクリア
                 household.pending_consumption_decision = None
 
-            else:
-                # 問題2修正: フォールバック時に複数財（3-5種）をランダム選択し、予算を分散
-                if listings:
-                    # ランダムに3-5種類の財を選択（出品数が少ない場合は全て選択）
-                    num_goods = min(random.randint(3, 5), len(listings))
-                    selected_listings = random.sample(listings, k=num_goods)
-
-                    # 予算を財数で均等分配
-                    budget_per_good = budget / num_goods
-
-                    for target_listing in selected_listings:
-                        affordable_qty = budget_per_good / target_listing.price
-                        order_qty = min(affordable_qty, target_listing.quantity)
-
-                        if order_qty > 0:
-                            order = GoodOrder(
-                                household_id=household.profile.id,
-                                good_id=target_listing.good_id,
-                                quantity=order_qty,
-                                max_price=target_listing.price * 1.2,
-                            )
-                            orders.append(order)
+            elif num_listings:
+                household_choices = choices[i, : num_goods[i]].tolist()
+                household_quantities = fallback_quantities[i, : num_goods[i]].tolist()
+                for listing_index, order_qty in zip(
+                    household_choices, household_quantities, strict=True
+                ):
+                    if order_qty > 0:
+                        target_listing = listings[listing_index]
+                        order = GoodOrder(
+                            household_id=household.profile.id,
+                            good_id=target_listing.good_id,
+                            quantity=order_qty,
+                            max_price=target_listing.price * 1.2,
+                        )
+                        orders.append(order)
 
         # 3. 市場マッチング
         transactions = self.goods_market.match(listings, orders)
+        self._market_snapshot_cache = None  # マッチングで価格・需要が更新された
 
         # 4. 取引結果を反映
         total_consumption = 0.0
 
+        firms_by_id = self._firms_by_id
+        households_by_id = self._households_by_id
         for txn in transactions:
             # 企業側: 収入増加、在庫減少
-            for firm in self.firms:
-                if firm.profile.id == txn.firm_id:
-                    firm.profile.cash += txn.total_value
-                    firm.profile.inventory -= txn.quantity
-                    firm.profile.sales_quantity += txn.quantity
-                    break
+            firm = firms_by_id.get(txn.firm_id)
+            if firm is not None:
+                firm.profile.cash += txn.total_value
+                firm.profile.inventory -= txn.quantity
+                firm.profile.sales_quantity += txn.quantity
 
             # 世帯側: 支出記録（Phase 8.1: 新しいrecord_purchase()メソッドを使用）
-            for household in self.households:
-                if household.profile.id == txn.household_id:
-                    # consumption属性を追加（動的）
-                    if not hasattr(household, "consumption"):
-                        household.consumption = 0.0
-                    household.consumption += txn.total_value
-                    total_consumption += txn.total_value
-
-                    # Phase 8.1: 購入を記録（食料支出も自動的に記録される）
-                    household.record_purchase(
-                        good_id=txn.good_id, quantity=txn.quantity, price=txn.price
-                    )
-
-                    break
+            household = households_by_id.get(txn.household_id)
+            if household is not None:
+                # consumption属性はHouseholdAgent.__init__で初期化済み
+                household.consumption += txn.total_value
+                total_consumption += txn.total_value
+
+                # Phase 8.1: 購入を記録（食料支出も自動的に記録される）
+                household.record_purchase(
+                    good_id=txn.good_id, quantity=txn.quantity, price=txn.price
+                )
 
         logger.info(
             f"Production & Trading: {len(transactions)} transactions, "
             f"total consumption: ${total_consumption:.2f}"
         )
 
+    def _production_capacities(self) -> np.ndarray:
+        """
+        全企業の生産能力（Cobb-Douglas）を一括計算
+
+        実効労働量は企業ごとに求め、産出量の計算はcobb_douglas_output()で
+        まとめて行う（FirmAgent.calculate_production_capacityと同じ値）。
+
+        Returns:
+            企業順の生産能力の配列
+        """
+        firms = self.firms
+        labor = np.array(
+            [
+                firm.calculate_effective_labor(self.households, self._households_by_id)
+                for firm in firms
+            ],
+            dtype=np.float64,
+        )
+        capital = np.array([firm.profile.capital for firm in firms], dtype=np.float64)
+        tfp = np.array(
+            [firm.profile.total_factor_productivity for firm in firms],
+            dtype=np.float64,
+        )
+        alpha = np.array(
+            [firm.production_function.alpha for firm in firms], dtype=np.float64
+        )
+        return cobb_douglas_output(labor, capital, tfp, alpha)
+
+    @staticmethod
+    def _consumption_budgets(incomes: np.ndarray, cash: np.ndarray) -> np.ndarray:
+        """
+        世帯ごとの消費予算を一括計算
+
+        Phase 8.5: 消費平滑化（バッファ・ストック貯蓄モデル）
+        現金保有量に応じて消費率を調整し、恒常所得仮説を簡易実装
+        - 現金が月収の3倍超: 85%（消費増加）
+        - 現金が月収未満: 75%（消費抑制・貯蓄重視）
+        - それ以外: 80%（標準消費）
+        - 所得なし: 50%（現金があれば最低限の消費を許可）
+
+        Args:
+            incomes: 世帯の月収配列
+            cash: 世帯の現金配列
+
+        Returns:
+            消費予算の配列（0以下は注文なし）
+        """
+        cash_to_income_ratio = cash / np.maximum(incomes, 500.0)
+        consumption_rate = np.where(
+            incomes > 0,
+            np.where(
+                cash_to_income_ratio > 3.0,
+                0.85,
+                np.where(cash_to_income_ratio < 1.0, 0.75, 0.80),
+            ),
+            0.5,
+        )
+        budgets = incomes * consumption_rate
+
+        # 所得がなくても現金がある場合は最低限の消費を許可
+        cash_only = (budgets <= 0) & (cash > 100)
+        budgets[cash_only] = np.minimum(
+            cash[cash_only] * consumption_rate[cash_only], cash[cash_only] * 0.3
+        )
+        return budgets
+
     def _taxation_and_dividend_stage(self):
         """
         Stage 2: 課税と配当
@@ -583,21 +785,25 @@ class Simulation:
         logger.debug("Taxation and Dividend Stage")
 
         # 1. 所得税徴収
+        households = self.households
+        incomes = np.fromiter(
+            (h.profile.monthly_income for h in households),
+            dtype=np.float64,
+            count=len(households),
+        )
+        taxes = self.government.collect_income_tax_batch(incomes)
         total_income_tax = 0.0
-        for household in self.households:
-            if household.profile.monthly_income > 0:
-                tax = self.government.collect_income_tax(
-                    household.profile.monthly_income
-                )
+        for household, income, tax in zip(
+            households, incomes.tolist(), taxes.tolist(), strict=True
+        ):
+            if income > 0:
                 total_income_tax += tax
                 # 世帯の現金から税金を差し引く
                 household.profile.cash = max(0.0, household.profile.cash - tax)
 
         # 2. VAT徴収（取引総額から）
         total_vat = 0.0
-        total_transactions = sum(
-            getattr(h, "consumption", 0.0) for h in self.households
-        )
+        total_transactions = sum(map(_get_consumption, self.households))
         if total_transactions > 0:
             total_vat = self.government.collect_vat(total_transactions)
 
@@ -631,14 +837,13 @@ class Simulation:
 
         # 6. 企業配当（純利益の10%）を世帯に直接配分
         total_dividends = 0.0
-        for firm in self.firms:
+        wage_costs = self._get_firm_wage_bills().tolist()
+        for firm, wage_cost in zip(self.firms, wage_costs, strict=True):
             # 純利益 = 売上 - コスト（賃金）
             # 売上 = 当月の販売額
             revenue = firm.profile.sales_quantity * firm.profile.price
 
-            # 賃金コスト = 従業員数 × 賃金
-            num_employees = len(firm.profile.employees)
-            wage_cost = num_employees * firm.profile.wage_offered
+            # 賃金コスト = 従業員数 × 賃金（意思決定ステージ終了時に計算済み）
 
             # 純利益
             net_profit = revenue - wage_cost
@@ -682,29 +887,50 @@ class Simulation:
         current_households = len(self.households)
         monthly_inflow = self.config.agents.households.monthly_inflow
 
-        if current_households < max_households:
-            new_count = min(monthly_inflow, max_households - current_households)
+        new_count = min(monthly_inflow, max_households - current_households)
+        if new_count <= 0:
+            return
 
-            if new_count > 0:
-                # 新規世帯を生成
-                generator = HouseholdProfileGenerator(
-                    random_seed=self.config.simulation.random_seed + self.state.step
-                )
-                new_profiles = generator.generate(count=new_count)
-
-                # HouseholdAgentを初期化して追加
-                for profile in new_profiles:
-                    new_household = HouseholdAgent(
-                        household_id=profile.id,
-                        profile=profile,
-                        llm_interface=self.llm_interface,
-                    )
-                    self.households.append(new_household)
-                    self.state.households.append(profile)
+        # 新規世帯を生成（生成器は使い回し、ステップごとにシードを再設定）
+        new_profiles = self._get_household_generator().generate(
+            count=new_count, seed=self._inflow_seed()
+        )
 
-                logger.info(
-                    f"Metabolic: Added {new_count} new households (total: {len(self.households)})"
-                )
+        # HouseholdAgentを初期化して追加
+        for profile in new_profiles:
+            new_household = HouseholdAgent(
+                household_id=profile.id,
+                profile=profile,
+                llm_interface=self.llm_interface,
+            )
+            self.households.append(new_household)
+            self.state.add_household(profile)
+            self._register_households([new_household])
+
+        logger.info(
+            f"Metabolic: Added {new_count} new households (total: {len(self.households)})"
+        )
+
+    def _get_household_generator(self) -> HouseholdProfileGenerator:
+        """
+        流入世帯用のプロファイル生成器を取得（初回のみ生成）
+
+        IDは既存世帯の最大ID+1から採番するため、流入世帯のIDは重複しない
+
+        Returns:
+            世帯プロファイル生成器
+        """
+        if self._household_generator is None:
+            self._household_generator = HouseholdProfileGenerator()
+            self._household_generator.next_id = (
+                max((h.profile.id for h in self.households), default=0) + 1
+            )
+        return self._household_generator
+
+    def _inflow_seed(self) -> int | None:
+        """流入世帯生成用の乱数シード（ステップごとに変化）"""
+        random_seed = self.config.simulation.random_seed
+        return None if random_seed is None else random_seed + self.state.step
 
     def _revision_stage(self):
         """
@@ -718,35 +944,65 @@ class Simulation:
         self._cached_indicators = self._calculate_indicators(update_prev_price_index=False)
         logger.debug(f"Cached indicators for {len(self.households) + len(self.firms) + 2} agents")
 
+        # 世帯・企業の意思決定をまとめて行う方式（クエリ連結 > 並行呼び出し > 逐次）
+        batch_size = self.config.simulation.llm_batch_size
+        concurrency = self.config.simulation.llm_concurrency
+        group_decide = None
+        if batch_size > 1:
+            group_decide = decide_actions_batch
+        elif concurrency > 1:
+            batch_size = concurrency
+            group_decide = functools.partial(
+                decide_actions_concurrent, max_concurrency=concurrency
+            )
+
         # 1. 世帯エージェントの意思決定（全世帯）
         logger.debug(f"Processing {len(self.households)} household decisions...")
-        for _i, household in enumerate(self.households):
-            # 観察情報を構築
-            observation = self._build_household_observation(household)
-
-            # LLMで意思決定（Phase 10.2: 決定頻度管理は将来実装）
-            try:
-                decision = household.decide_action(observation, self.state.step)
-                # 決定を実行
-                self._execute_household_decision(household, decision)
-            except Exception as e:
-                logger.warning(f"Household {household.profile.id} decision failed: {e}")
+        if group_decide is not None:
+            self._run_batched_decisions(
+                self.households,
+                self._build_household_observation,
+                self._execute_household_decision,
+                batch_size,
+                group_decide,
+            )
+        else:
+            for _i, household in enumerate(self.households):
+                # 観察情報を構築
+                observation = self._build_household_observation(household)
+
+                # LLMで意思決定（Phase 10.2: 決定頻度管理は将来実装）
+                try:
+                    decision = household.decide_action(observation, self.state.step)
+                    # 決定を実行
+                    self._execute_household_decision(household, decision)
+                except Exception as e:
+                    logger.warning(f"Household {household.profile.id} decision failed: {e}")
 
         logger.info(f"Completed {len(self.households)} household decisions")
 
         # 2. 企業エージェントの意思決定（全企業）
         logger.debug(f"Processing {len(self.firms)} firm decisions...")
-        for _i, firm in enumerate(self.firms):
-            # 観察情報を構築
-            observation = self._build_firm_observation(firm)
-
-            # LLMで意思決定
-            try:
-                decision = firm.decide_action(observation, self.state.step)
-                # 決定を実行
-                self._execute_firm_decision(firm, decision)
-            except Exception as e:
-                logger.warning(f"Firm {firm.profile.id} decision failed: {e}")
+        if group_decide is not None:
+            self._run_batched_decisions(
+                self.firms,
+                self._build_firm_observation,
+                self._execute_firm_decision,
+                batch_size,
+                group_decide,
+            )
+        else:
+            for _i, firm in enumerate(self.firms):
+                # 観察情報を構築
+                observation = self._build_firm_observation(firm)
+
+                # LLMで意思決定
+                try:
+                    decision = firm.decide_action(observation, self.state.step)
+                    # 決定を実行
+                    self._execute_firm_decision(firm, decision)
+                except Exception as e:
+                    logger.warning(f"Firm {firm.profile.id} decision failed: {e}")
 
         logger.info(f"Completed {len(self.firms)} firm decisions")
 
@@ -812,22 +1068,24 @@ class Simulation:
             matches = self.labor_market.match(job_postings, job_seekers)
 
             # マッチング結果を反映
+            # 企業側: 企業ごとにまとめて従業員追加・求人数減算（マッチ順を維持）
+            hires_by_firm: dict[int, list[int]] = {}
+            for match in matches:
+                hires_by_firm.setdefault(match.firm_id, []).append(match.household_id)
+            for firm_id, hired_ids in hires_by_firm.items():
+                firm = self._firms_by_id.get(firm_id)
+                if firm is not None:
+                    firm.profile.employees.extend(hired_ids)
+                    firm.profile.job_openings -= len(hired_ids)
+
+            # 世帯側: 雇用状態更新
             for match in matches:
-                # 企業側: 従業員追加
-                for firm in self.firms:
-                    if firm.profile.id == match.firm_id:
-                        firm.profile.employees.append(match.household_id)
-                        firm.profile.job_openings -= 1
-                        break
-
-                # 世帯側: 雇用状態更新
-                for household in self.households:
-                    if household.profile.id == match.household_id:
-                        household.profile.employment_status = EmploymentStatus.EMPLOYED
-                        household.profile.monthly_income = match.wage
-                        household.profile.employer_id = match.firm_id
-                        household.profile.wage = match.wage
-                        break
+                household = self._households_by_id.get(match.household_id)
+                if household is not None:
+                    household.profile.employment_status = EmploymentStatus.EMPLOYED
+                    household.profile.monthly_income = match.wage
+                    household.profile.employer_id = match.firm_id
+                    household.profile.wage = match.wage
 
             # Phase 7.7: 拒否統計をログ出力して低マッチング率の原因を特定
             labor_stats = self.labor_market.get_statistics()
@@ -859,21 +1117,23 @@ class Simulation:
             if employed_households:
                 # Phase C-1: 各雇用者を個別に確率判定（Bernoulli trial）
                 # これにより雇用者数が少なくても離職が発生する
-                quitters = []
-                for household in employed_households:
-                    if random.random() < turnover_rate:
-                        quitters.append(household)
+                draws = self._rng.random(len(employed_households))
+                quitters = [
+                    household
+                    for household, draw in zip(employed_households, draws, strict=True)
+                    if draw < turnover_rate
+                ]
 
                 if quitters:
                     for household in quitters:
                         # 雇用主から削除
-                        employer_id = household.profile.employer_id
-                        for firm in self.firms:
-                            if firm.profile.id == employer_id:
-                                if household.profile.id in firm.profile.employees:
-                                    firm.profile.employees.remove(household.profile.id)
-                                    firm.profile.job_openings += 1  # 求人枠を補充
-                                break
+                        firm = self._firms_by_id.get(household.profile.employer_id)
+                        if (
+                            firm is not None
+                            and household.profile.id in firm.profile.employees
+                        ):
+                            firm.profile.employees.remove(household.profile.id)
+                            firm.profile.job_openings += 1  # 求人枠を補充
 
                         # 雇用状態を失業に変更
                         household.profile.employment_status = (
@@ -892,9 +1152,36 @@ class Simulation:
                         f"({len(employed_households)} employed, rate={turnover_rate * 100:.1f}%)"
                     )
 
+        # 雇用・賃金の変更はここまでのため、企業の月次賃金総額を確定
+        self._refresh_firm_wage_bills()
+
         # 6. 金融市場統合
         self._financial_stage()
 
+    def _refresh_firm_wage_bills(self):
+        """
+        企業ごとの月次賃金総額（従業員数 × 提示賃金）を計算して保持
+
+        従業員・提示賃金は意思決定ステージでのみ変化するため、その終了時に
+        1回だけ計算し、金融ステージ・配当計算で再利用する（self.firmsと同じ順）。
+        """
+        self._firm_wage_bills = np.fromiter(
+            (len(f.profile.employees) * f.profile.wage_offered for f in self.firms),
+            dtype=np.float64,
+            count=len(self.firms),
+        )
+
+    def _get_firm_wage_bills(self) -> np.ndarray:
+        """
+        企業ごとの月次賃金総額を取得（企業数が変化していれば再計算）
+
+        Returns:
+            self.firmsと同じ順の賃金総額配列
+        """
+        if len(self._firm_wage_bills) != len(self.firms):
+            self._refresh_firm_wage_bills()
+        return self._firm_wage_bills
+
     def _financial_stage(self):
         """
         金融市場統合
@@ -912,43 +1199,62 @@ class Simulation:
         # 2. 世帯の預金申請を収集
         from src.environment.markets.financial_market import DepositRequest, LoanRequest
 
-        deposit_requests = []
-        for household in self.households:
-            # 余剰現金がある場合に預金（月収の2ヶ月分以上の現金）
-            if household.profile.cash > household.profile.monthly_income * 2.0:
-                surplus = (
-                    household.profile.cash - household.profile.monthly_income * 2.0
-                )
-                deposit_amount = surplus * 0.5  # 余剰の50%を預金
+        # NumPyで一括判定し、条件を満たす世帯・企業のみ申請オブジェクトを生成
+        num_households = len(self.households)
+        household_ids = np.fromiter(
+            (h.profile.id for h in self.households),
+            dtype=np.int64,
+            count=num_households,
+        )
+        cash = np.fromiter(
+            (h.profile.cash for h in self.households),
+            dtype=np.float64,
+            count=num_households,
+        )
+        incomes = np.fromiter(
+            (h.profile.monthly_income for h in self.households),
+            dtype=np.float64,
+            count=num_households,
+        )
 
-                if deposit_amount > 100.0:  # 最低預金額
-                    deposit_requests.append(
-                        DepositRequest(
-                            household_id=household.profile.id, amount=deposit_amount
-                        )
-                    )
+        # 余剰現金がある場合に預金（月収の2ヶ月分以上の現金）
+        reserve = incomes * 2.0
+        deposit_amounts = (cash - reserve) * 0.5  # 余剰の50%を預金
+        deposit_mask = (cash > reserve) & (deposit_amounts > 100.0)  # 最低預金額
+        deposit_requests = [
+            DepositRequest(household_id=household_id, amount=amount)
+            for household_id, amount in zip(
+                household_ids[deposit_mask].tolist(),
+                deposit_amounts[deposit_mask].tolist(),
+                strict=True,
+            )
+        ]
 
         # 3. 企業の借入申請を収集
-        loan_requests = []
-        for firm in self.firms:
-            # 月次賃金総額を計算
-            num_employees = len(firm.profile.employees)
-            monthly_wage_bill = (
-                num_employees * firm.profile.wage_offered if num_employees > 0 else 0.0
+        num_firms = len(self.firms)
+        firm_ids = np.fromiter(
+            (f.profile.id for f in self.firms), dtype=np.int64, count=num_firms
+        )
+        firm_cash = np.fromiter(
+            (f.profile.cash for f in self.firms), dtype=np.float64, count=num_firms
+        )
+        # 月次賃金総額 = 従業員数 × 提示賃金（意思決定ステージ終了時に計算済み）
+        monthly_wage_bills = self._get_firm_wage_bills()
+
+        # 運転資金が不足している場合に借入（賃金総額の2ヶ月分未満）
+        loan_mask = (firm_cash < monthly_wage_bills * 2.0) & (monthly_wage_bills > 0)
+        loan_requests = [
+            LoanRequest(
+                firm_id=firm_id,
+                amount=wage_bill * 3.0,  # 賃金総額の3ヶ月分を借入
+                purpose="working_capital",
             )
-
-            # 運転資金が不足している場合に借入（賃金総額の2ヶ月分未満）
-            required_cash = monthly_wage_bill * 2.0
-            if firm.profile.cash < required_cash and monthly_wage_bill > 0:
-                loan_amount = monthly_wage_bill * 3.0  # 賃金総額の3ヶ月分を借入
-
-                loan_requests.append(
-                    LoanRequest(
-                        firm_id=firm.profile.id,
-                        amount=loan_amount,
-                        purpose="working_capital",
-                    )
-                )
+            for firm_id, wage_bill in zip(
+                firm_ids[loan_mask].tolist(),
+                monthly_wage_bills[loan_mask].tolist(),
+                strict=True,
+            )
+        ]
 
         # 4. 金融市場で処理
         deposit_transactions = self.financial_market.process_deposits(deposit_requests)
@@ -956,19 +1262,17 @@ class Simulation:
 
         # 5. 預金結果を反映
         for txn in deposit_transactions:
-            for household in self.households:
-                if household.profile.id == txn.agent_id:
-                    household.profile.cash -= txn.amount
-                    household.profile.savings += txn.amount
-                    break
+            household = self._households_by_id.get(txn.agent_id)
+            if household is not None:
+                household.profile.cash -= txn.amount
+                household.profile.savings += txn.amount
 
         # 6. 借入結果を反映
         for txn in loan_transactions:
-            for firm in self.firms:
-                if firm.profile.id == txn.agent_id:
-                    firm.profile.cash += txn.amount
-                    firm.profile.debt += txn.amount
-                    break
+            firm = self._firms_by_id.get(txn.agent_id)
+            if firm is not None:
+                firm.profile.cash += txn.amount
+                firm.profile.debt += txn.amount
 
         logger.info(
             f"Financial: {len(deposit_transactions)} deposits (${sum(t.amount for t in deposit_transactions):.2f}), "
@@ -977,6 +1281,75 @@ class Simulation:
 
     # ========== LLM意思決定用: 観察情報構築メソッド ==========
 
+    def _market_snapshot(self) -> tuple[dict[str, float], dict[str, float]]:
+        """
+        財市場の価格・需要辞書を取得（次のマッチングまで共有）
+
+        観察情報の構築（全世帯・全企業）と履歴記録で毎回辞書を再構築しないよう、
+        ステップ開始時と財市場のマッチング後に破棄するスナップショットを返す。
+        返す辞書は共有されるため呼び出し側で変更しないこと。
+
+        Returns:
+            (財ID→価格, 財ID→需要量)
+        """
+        if self._market_snapshot_cache is None:
+            self._market_snapshot_cache = (
+                self.goods_market.get_market_prices(),
+                self.goods_market.get_market_demands(),
+            )
+        return self._market_snapshot_cache
+
+    def _total_job_openings(self) -> int:
+        """
+        全企業の現在の求人数の合計
+
+        意思決定フェーズ中は求人数が変化するため、SoAミラーではなく
+        企業プロファイルから直接NumPy配列に集めて合計する
+
+        Returns:
+            総求人数
+        """
+        return int(
+            np.fromiter(
+                (f.profile.job_openings for f in self.firms),
+                dtype=np.int64,
+                count=len(self.firms),
+            ).sum()
+        )
+
+    def _run_batched_decisions(
+        self,
+        agents: list,
+        build_observation,
+        execute_decision,
+        batch_size: int,
+        group_decide=decide_actions_batch,
+    ):
+        """
+        エージェントをbatch_size体ずつまとめてLLMで意思決定・実行
+
+        バッチ内の観察情報は全て意思決定前に構築するため、
+        同じバッチ内の先行エージェントの行動結果は観察に反映されない。
+
+        Args:
+            agents: 世帯または企業エージェントのリスト
+            build_observation: 観察情報を構築する関数
+            execute_decision: 決定を実行する関数 (agent, decision)
+            batch_size: まとめて意思決定するエージェント数
+            group_decide: まとめて意思決定する関数 (agents, observations, step)
+                （decide_actions_batch: クエリ連結、decide_actions_concurrent: 並行呼び出し）
+        """
+        for start in range(0, len(agents), batch_size):
+            batch = agents[start : start + batch_size]
+            observations = [build_observation(agent) for agent in batch]
+            decisions = group_decide(batch, observations, self.state.step)
+
+            for agent, decision in zip(batch, decisions, strict=True):
+                try:
+                    execute_decision(agent, decision)
+                except Exception as e:
+                    logger.warning(f"Agent {agent.agent_id} decision failed: {e}")
+
     def _build_household_observation(self, household: HouseholdAgent) -> dict[str, any]:
         """
         世帯エージェント用の観察情報を構築
@@ -988,13 +1361,13 @@ class Simulation:
             観察情報の辞書
         """
         # 市場価格情報（財市場）
-        market_prices = self.goods_market.get_market_prices()
+        market_prices, _ = self._market_snapshot()
         avg_price = (
             sum(market_prices.values()) / len(market_prices) if market_prices else 100.0
         )
 
         # 求人情報（労働市場）
-        job_openings_count = sum(f.profile.job_openings for f in self.firms)
+        job_openings_count = self._total_job_openings()
         avg_wage = sum(
             f.profile.wage_offered for f in self.firms if f.profile.job_openings > 0
         ) / max(1, sum(1 for f in self.firms if f.profile.job_openings > 0))
@@ -1045,7 +1418,7 @@ class Simulation:
             観察情報の辞書
         """
         # 市場価格（競合他社）
-        market_prices = self.goods_market.get_market_prices()
+        market_prices, _ = self._market_snapshot()
         competitors_prices = [
             p
             for good_id, p in market_prices.items()
@@ -1171,8 +1544,8 @@ class Simulation:
 
         # 潜在GDP（簡略版: 過去平均の1.02倍）
         if len(self.state.history["gdp"]) >= 3:
-            recent_gdp = self.state.history["gdp"][-3:]
-            potential_gdp = sum(recent_gdp) / len(recent_gdp) * 1.02
+            recent_gdp = self.state.history["gdp"].window(3)
+            potential_gdp = float(recent_gdp.mean()) * 1.02
         else:
             potential_gdp = current_indicators.get("gdp", 100000.0) * 1.02
 
@@ -1191,7 +1564,7 @@ class Simulation:
             )
 
         # 求人率（ベバリッジ曲線用）
-        total_jobs = sum(f.profile.job_openings for f in self.firms)
+        total_jobs = self._total_job_openings()
         vacancy_rate = total_jobs / len(self.households) if self.households else 0.0
 
         observation = {
@@ -1254,13 +1627,10 @@ class Simulation:
                 and household.profile.employment_status == EmploymentStatus.EMPLOYED
             ):
                 # 現在の雇用主から削除
-                employer_id = household.profile.employer_id
-                for firm in self.firms:
-                    if firm.profile.id == employer_id:
-                        if household.profile.id in firm.profile.employees:
-                            firm.profile.employees.remove(household.profile.id)
-                            firm.profile.job_openings += 1  # 求人枠を1つ増やす
-                        break
+                firm = self._firms_by_id.get(household.profile.employer_id)
+                if firm is not None and household.profile.id in firm.profile.employees:
+                    firm.profile.employees.remove(household.profile.id)
+                    firm.profile.job_openings += 1  # 求人枠を1つ増やす
 
                 # 雇用状態を失業に変更
                 household.profile.employment_status = EmploymentStatus.UNEMPLOYED
@@ -1319,7 +1689,9 @@ class Simulation:
             price = arguments.get("price", firm.profile.price)
 
             # 生産能力チェック
-            capacity = firm.calculate_production_capacity(self.households)
+            capacity = firm.calculate_production_capacity(
+                self.households, self._households_by_id
+            )
             actual_production = min(target_production, capacity)
 
             # Phase 8.3: 強化された需給バランスに応じた価格調整
@@ -1332,7 +1704,7 @@ class Simulation:
                 inventory_sales_ratio = 1.0  # デフォルト
 
             # Phase 8.3: 需要データを取得（goods_marketから）
-            market_demands = self.goods_market.get_market_demands()
+            _, market_demands = self._market_snapshot()
             firm_demand = market_demands.get(firm.profile.goods_type, 0.0)
 
             # Phase 8.3: より敏感で段階的な価格調整メカニズム
@@ -1454,15 +1826,14 @@ class Simulation:
                     if employee_id in firm.profile.employees:
                         firm.profile.employees.remove(employee_id)
                         # 世帯の雇用状態更新
-                        for household in self.households:
-                            if household.profile.id == employee_id:
-                                household.profile.employment_status = (
-                                    EmploymentStatus.UNEMPLOYED
-                                )
-                                household.profile.employer_id = None
-                                household.profile.monthly_income = 0.0
-                                household.profile.wage = 0.0
-                                break
+                        household = self._households_by_id.get(employee_id)
+                        if household is not None:
+                            household.profile.employment_status = (
+                                EmploymentStatus.UNEMPLOYED
+                            )
+                            household.profile.employer_id = None
+                            household.profile.monthly_income = 0.0
+                            household.profile.wage = 0.0
                 logger.debug(
                     f"Firm {firm.profile.id} fired {len(fire_employee_ids)} employees"
                 )
@@ -1748,41 +2119,50 @@ class Simulation:
         Returns:
             指標の辞書
         """
+        # 家計属性をSoA配列に同期（_record_history・get_metricsでも再利用）
+        arrays = self._agent_arrays
+        arrays.sync_households(self.households)
+
         # 家計所得の集計
-        if self.households:
-            household_incomes = [
-                getattr(h.profile, "monthly_income", 50000.0) for h in self.households
-            ]
-        else:
-            household_incomes = []
+        household_incomes = arrays.household("monthly_income")
 
         # GDP計算（簡略版）
-        total_consumption = sum(getattr(h, "consumption", 0.0) for h in self.households)
+        total_consumption = float(arrays.household("consumption").sum())
 
         # Phase 8.4: 投資を資本ストック変化から計算（経済学的に正しい方法）
         # Investment = Δ Capital = 現在の資本 - 前期の資本
-        total_investment = 0.0
-        for firm in self.firms:
-            current_capital = firm.profile.capital
-            prev_capital = self.prev_capital_stocks.get(
-                firm.profile.id, current_capital
-            )
+        # 資本はSoA配列に同期し、投資額は配列の差分として一括計算
+        firms = self.firms
+        arrays.sync_firms(firms)
+        capital = arrays.firm("capital")
+        prev_capital_stocks = self.prev_capital_stocks
+        firm_ids = [firm.profile.id for firm in firms]
+        prev_capital = np.fromiter(
+            (
+                prev_capital_stocks.get(firm_id, current_capital)
+                for firm_id, current_capital in zip(
+                    firm_ids, capital.tolist(), strict=True
+                )
+            ),
+            dtype=np.float64,
+            count=len(firm_ids),
+        )
 
-            # 投資 = 資本の変化
-            firm_investment = current_capital - prev_capital
-            total_investment += firm_investment
+        # 投資 = 資本の変化（SoAの投資行に直接書き込む）
+        investment = arrays.firm("investment")
+        np.subtract(capital, prev_capital, out=investment)
+        total_investment = float(investment.sum())
 
-            # Phase 8.4: firmオブジェクトにも記録（後方互換性）
+        # Phase 8.4: firmオブジェクトにも記録（後方互換性）
+        for firm, firm_investment in zip(firms, investment.tolist(), strict=True):
             firm.investment = firm_investment
 
-            # 次のステップのために現在の資本を保存（メインステップのみ）
-            if update_prev_price_index:
-                self.prev_capital_stocks[firm.profile.id] = current_capital
+        # 次のステップのために現在の資本を保存（メインステップのみ）
+        if update_prev_price_index:
+            prev_capital_stocks.update(zip(firm_ids, capital.tolist(), strict=True))
 
         government_spending = (
-            getattr(self.government.state, "expenditure", 0.0)
-            if self.government
-            else 0.0
+            self.government.state.expenditure if self.government else 0.0
         )
 
         gdp = total_consumption + total_investment + government_spending
@@ -1793,22 +2173,37 @@ class Simulation:
         # 失業率計算（Phase 9.9.4: Enum対応）
         total_labor_force = len(self.households)
         if total_labor_force > 0:
-            from src.models.data_models import EmploymentStatus
-
-            employed = sum(
-                1
-                for h in self.households
-                if h.profile.employment_status == EmploymentStatus.EMPLOYED
-            )
+            employed = int(arrays.household("employed").sum())
             unemployment_rate = (total_labor_force - employed) / total_labor_force
         else:
             unemployment_rate = 0.0
 
-        # Gini係数
-        if household_incomes:
-            gini = MacroeconomicIndicators.calculate_gini_coefficient(household_incomes)
-        else:
-            gini = 0.0
+        # 価格データを財インデックス順の配列に変換
+        good_ids, price_values = self.goods_market.get_market_prices_array()
+        has_prices = len(good_ids) > 0
+        logger.info(
+            f"[Inflation] Step {self.state.step}: current_prices count = {len(good_ids)}"
+        )
+
+        # 基準年価格を設定（価格データがある最初のステップ）
+        if self.base_year_prices is None and has_prices:
+            self._set_base_year_prices(
+                dict(zip(good_ids.tolist(), price_values.tolist(), strict=True))
+            )
+            # 初期価格指数を100.0に設定（基準年）
+            self.prev_price_index = 100.0
+            logger.info(f"Base year prices set with {len(self.base_year_prices)} goods")
+            logger.info(f"[Inflation] base_year_prices = {self.base_year_prices}")
+            logger.info("[Inflation] Initialized prev_price_index = 100.0 (base year)")
+
+        prices, base_prices, common_mask = self._build_price_arrays(
+            good_ids, price_values
+        )
+
+        # Gini係数と共通財の平均価格（数値カーネルで一括計算）
+        gini, current_avg, base_avg, num_common = gini_price_index(
+            household_incomes, prices, base_prices, common_mask
+        )
 
         # 政府の状態更新
         if self.government and self.government.state:
@@ -1827,39 +2222,13 @@ class Simulation:
         # 実質GDPの計算
         real_gdp = gdp  # デフォルトは名目GDPと同じ
 
-        # 価格データから価格指数を計算
-        current_prices = self.goods_market.get_market_prices()
-        logger.info(
-            f"[Inflation] Step {self.state.step}: current_prices count = {len(current_prices)}"
-        )
-
-        # 基準年価格を設定（価格データがある最初のステップ）
-        if self.base_year_prices is None and current_prices:
-            self.base_year_prices = current_prices.copy()
-            # 初期価格指数を100.0に設定（基準年）
-            self.prev_price_index = 100.0
-            logger.info(f"Base year prices set with {len(self.base_year_prices)} goods")
-            logger.info(f"[Inflation] base_year_prices = {self.base_year_prices}")
-            logger.info("[Inflation] Initialized prev_price_index = 100.0 (base year)")
-
         # 価格指数を計算（基準年価格と現在価格の両方がある場合のみ）
-        if self.base_year_prices and current_prices:
+        if self.base_year_prices and has_prices:
             # 共通の財IDのみで計算
-            common_goods = set(current_prices.keys()) & set(
-                self.base_year_prices.keys()
-            )
-            logger.info(
-                f"[Inflation] common_goods = {common_goods} ({len(common_goods)} goods)"
-            )
+            logger.info(f"[Inflation] common_goods = {num_common} goods")
 
-            if common_goods:
+            if num_common:
                 # 平均価格比で価格指数を計算
-                current_avg = sum(current_prices[g] for g in common_goods) / len(
-                    common_goods
-                )
-                base_avg = sum(self.base_year_prices[g] for g in common_goods) / len(
-                    common_goods
-                )
                 logger.info(
                     f"[Inflation] current_avg={current_avg:.2f}, base_avg={base_avg:.2f}"
                 )
@@ -1901,7 +2270,7 @@ class Simulation:
         else:
             if not self.base_year_prices:
                 logger.info("[Inflation] No base_year_prices yet")
-            if not current_prices:
+            if not has_prices:
                 logger.warning("[Inflation] No current_prices available!")
 
         return {
@@ -1917,6 +2286,88 @@ class Simulation:
             "investment": total_investment,
         }
 
+    def _build_price_arrays(
+        self, good_ids: np.ndarray, price_values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        市場価格配列を財インデックス順の配列に変換
+
+        財ID→インデックスの対応はself._good_indexに保持し、新しい財が
+        現れたときだけ拡張する。基準年価格も同じ並びの配列に保持する。
+        取引された財IDの並びが前ステップと同じ場合は、インデックス配列と
+        共通財マスクをキャッシュから再利用する。
+
+        Args:
+            good_ids: 財ID配列（GoodsMarket.get_market_prices_array()）
+            price_values: good_idsと同じ並びの現在価格配列
+
+        Returns:
+            (現在価格, 基準年価格, 共通財マスク) の配列タプル
+        """
+        cache = self._price_layout_cache
+        if cache is None or not (
+            cache[0] is good_ids or np.array_equal(cache[0], good_ids)
+        ):
+            self._register_goods(good_ids.tolist())
+            indices = np.fromiter(
+                (self._good_index[g] for g in good_ids),
+                dtype=np.intp,
+                count=len(good_ids),
+            )
+            common_mask = np.zeros(len(self._good_index), dtype=bool)
+            common_mask[indices] = True
+            common_mask &= self._base_price_mask
+            cache = (good_ids, indices, common_mask)
+            self._price_layout_cache = cache
+
+        _, indices, common_mask = cache
+        prices = np.zeros(len(self._good_index))
+        prices[indices] = price_values
+
+        return prices, self._base_price_array, common_mask
+
+    def _set_base_year_prices(self, prices: dict[str, float]):
+        """
+        基準年価格を設定し、財インデックス順の配列に一度だけ展開
+
+        Args:
+            prices: 財ID→基準年価格
+        """
+        self.base_year_prices = prices.copy()
+        self._register_goods(prices)
+
+        indices = np.fromiter(
+            (self._good_index[g] for g in prices), dtype=np.intp, count=len(prices)
+        )
+        self._base_price_array[indices] = np.fromiter(
+            prices.values(), dtype=np.float64, count=len(prices)
+        )
+        self._base_price_mask[indices] = True
+
+        # 共通財マスクを作り直させる
+        self._price_layout_cache = None
+
+    def _register_goods(self, good_ids):
+        """
+        未登録の財IDにインデックスを割り当て、基準年価格配列を拡張
+
+        Args:
+            good_ids: 財IDのイテラブル
+        """
+        good_index = self._good_index
+        for good_id in good_ids:
+            if good_id not in good_index:
+                good_index[good_id] = len(good_index)
+
+        grow = len(good_index) - len(self._base_price_array)
+        if grow > 0:
+            self._base_price_array = np.concatenate(
+                [self._base_price_array, np.zeros(grow)]
+            )
+            self._base_price_mask = np.concatenate(
+                [self._base_price_mask, np.zeros(grow, dtype=bool)]
+            )
+
     def _record_history(self, indicators: dict[str, float]):
         """
         指標を履歴に記録
@@ -1929,40 +2380,40 @@ class Simulation:
                 self.state.history[key].append(value)
 
         # 価格・需要データを記録（財市場から取得）
-        market_prices = self.goods_market.get_market_prices()
-        market_demands = self.goods_market.get_market_demands()
+        market_prices, market_demands = self._market_snapshot()
 
+        # setdefaultで存在確認と取得を1回の辞書参照にまとめる
+        prices_history = self.state.history["prices"]
         for good_id, price in market_prices.items():
-            if good_id not in self.state.history["prices"]:
-                self.state.history["prices"][good_id] = []
-            self.state.history["prices"][good_id].append(price)
+            prices_history.setdefault(good_id, []).append(price)
 
+        demands_history = self.state.history["demands"]
         for good_id, demand in market_demands.items():
-            if good_id not in self.state.history["demands"]:
-                self.state.history["demands"][good_id] = []
-            self.state.history["demands"][good_id].append(demand)
+            demands_history.setdefault(good_id, []).append(demand)
 
         # 食料支出比率を計算して記録（Engel's Law検証用）
         # 全世帯分を記録（取引がない世帯は0.0）
-        food_expenditure_ratios = []
-        for household in self.households:
-            total_spending = getattr(household, "total_spending", 0.0)
-            food_spending = getattr(household, "food_spending", 0.0)
-
-            if total_spending > 0:
-                ratio = food_spending / total_spending
-            else:
-                ratio = 0.0  # 取引がない世帯は0
-            food_expenditure_ratios.append(ratio)
+        # NumPyで一括計算（世帯ごとのPythonレベル除算を排除）
+        # 支出はstep()内で直前に呼ばれる_calculate_indicators()で同期済みのSoA配列を使用
+        arrays = self._agent_arrays
+        food = arrays.household("food_spending")
+        total = arrays.household("total_spending")
+        food_expenditure_ratios = np.zeros(len(total), dtype=np.float32)
+        np.divide(
+            food,
+            total,
+            out=food_expenditure_ratios,
+            where=total > 0,
+            casting="same_kind",
+        )
 
-        # 世帯ごとの食料支出比率を記録
+        # 世帯ごとの食料支出比率を記録（ステップ×世帯の行列に書き込み）
         self.state.history["food_expenditure_ratios"].append(food_expenditure_ratios)
 
         # 世帯ごとの所得を記録（Engel's Law検証用）
-        household_incomes = [
-            getattr(h.profile, "monthly_income", 0.0) for h in self.households
-        ]
-        self.state.history["household_incomes"].append(household_incomes)
+        self.state.history["household_incomes"].append(
+            arrays.household("monthly_income")
+        )
 
         # Phase 8.1: 次のステップのために支出をリセット（新しいメソッドを使用）
         for household in self.households:
@@ -1978,52 +2429,76 @@ class Simulation:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        state_dict = self.state.to_dict()
+        # 履歴の系列はlistに変換せず配列のままシリアライズ
+        state_dict = self.state.to_dict(arrays=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(state_dict, f, indent=2, ensure_ascii=False)
+        # インデントなしのコンパクトなJSONで保存（orjsonがあれば使用）
+        filepath.write_bytes(dumps(state_dict))
 
         logger.info(f"State saved to {filepath}")
 
-    def load_state(self, filepath: str | Path):
+    def load_state(self, filepath: str | Path, trusted: bool = False):
         """
         シミュレーション状態を読み込み
 
         Args:
             filepath: 読み込むファイルパス
+            trusted: Trueの場合、save_state()で書き出したファイルとして扱い、
+                世帯・企業・政府・中央銀行・市場の状態を__init__を経由せずに復元する
+
+        history_dir指定時は、スカラー指標の履歴を同じ<key>.npyにマップし直し、
+        再開後もファイルへの書き込みを続ける。
         """
         filepath = Path(filepath)
 
         if not filepath.exists():
             raise FileNotFoundError(f"State file not found: {filepath}")
 
-        with open(filepath, encoding="utf-8") as f:
-            state_dict = json.load(f)
+        state_dict = loads(filepath.read_bytes())
 
         # 状態の復元
         self.state.step = state_dict["step"]
         self.state.phase = state_dict["phase"]
 
-        # 家計の復元
+        # 家計・企業の復元（trusted=Trueの場合は__init__を省略）
+        # 復元済みの部分木はstate_dictから外し、以降の変換と同時に保持しない
         self.state.households = [
-            HouseholdProfile.from_dict(h) for h in state_dict["households"]
+            HouseholdProfile.from_dict(profile, trusted=trusted)
+            for profile in state_dict.pop("households")
+        ]
+        self.state.firms = [
+            FirmProfile.from_dict(profile, trusted=trusted)
+            for profile in state_dict.pop("firms")
         ]
-
-        # 企業の復元
-        self.state.firms = [FirmProfile.from_dict(f) for f in state_dict["firms"]]
 
         # 政府・中央銀行の復元
         if state_dict["government"]:
-            self.state.government = GovernmentState(**state_dict["government"])
+            self.state.government = GovernmentState.from_dict(
+                state_dict["government"], trusted=trusted
+            )
 
         if state_dict["central_bank"]:
-            self.state.central_bank = CentralBankState(**state_dict["central_bank"])
+            self.state.central_bank = CentralBankState.from_dict(
+                state_dict["central_bank"], trusted=trusted
+            )
 
-        # 市場の復元
-        self.state.market = MarketState(**state_dict["market"])
+        # 市場の復元（空の場合はデフォルト値で生成）
+        market = state_dict["market"]
+        self.state.market = (
+            MarketState.from_dict(market, trusted=trusted) if market else MarketState()
+        )
+
+        # 履歴の復元（系列ごとに配列へ変換しながらlistを解放）
+        self.state.load_history(
+            state_dict.pop("history"),
+            capacity=self.config.simulation.max_steps,
+            household_capacity=self.config.agents.households.max,
+            consume=True,
+            mmap_dir=self.history_dir,
+        )
 
-        # 履歴の復元
-        self.state.history = state_dict["history"]
+        # 読み込んだ状態に対して指標を再計算させる
+        self._step_cache.clear()
 
         logger.info(f"State loaded from {filepath}")
 
@@ -2031,12 +2506,26 @@ class Simulation:
         """
         現在のマクロ経済指標を取得
 
+        Returns:
+            指標の辞書
+        """
+        return self._current_indicators()
+
+    @_step_cached
+    def _current_indicators(self) -> dict[str, float]:
+        """
+        現在ステップの指標を取得
+
+        直前のstep()で計算済みの場合はその結果のコピーを返し、
+        全エージェントの再走査を省略する
+
         Returns:
             指標の辞書
         """
         # prev_price_indexを更新しない（step()で既に更新済み）
         return self._calculate_indicators(update_prev_price_index=False)
 
+    @_step_cached
     def get_metrics(self) -> dict[str, float]:
         """
         現在のマクロ経済指標を取得（get_indicators()のエイリアス）
@@ -2044,106 +2533,180 @@ class Simulation:
         Returns:
             指標の辞書
         """
-        # prev_price_indexを更新しない（step()で既に更新済み）
-        indicators = self._calculate_indicators(update_prev_price_index=False)
+        indicators = self._current_indicators()
 
         # スクリプトが期待する追加のメトリクス
-        if self.households:
-            household_incomes = [
-                getattr(h.profile, "monthly_income", 50000.0) for h in self.households
-            ]
-            indicators["average_income"] = sum(household_incomes) / len(
-                household_incomes
-            )
-        else:
-            indicators["average_income"] = 0.0
-
-        indicators["total_consumption"] = sum(
-            getattr(h, "consumption", 0.0) for h in self.households
-        )
-        indicators["total_investment"] = sum(
-            getattr(f, "investment", 0.0) for f in self.firms
+        # 消費・投資の合計は指標計算時の集計をそのまま使い、
+        # 残りは_calculate_indicators()で同期済みのSoA配列をNumPyで集計
+        arrays = self._agent_arrays
+        num_households = arrays.num_households
+        household_incomes = arrays.household("monthly_income")
+        job_openings = arrays.firm("job_openings")
+
+        indicators["average_income"] = (
+            float(household_incomes.mean()) if num_households else 0.0
         )
+        indicators["total_consumption"] = indicators["consumption"]
+        indicators["total_investment"] = indicators["investment"]
 
         # Vacancy Rate（求人率）を動的計算: 総求人数 / 労働力
-        total_job_openings = sum(f.profile.job_openings for f in self.firms)
-        total_labor_force = len(self.households) if self.households else 1
-        indicators["vacancy_rate"] = total_job_openings / total_labor_force
-        indicators["government_spending"] = (
-            getattr(self.government.state, "expenditure", 0.0)
-            if self.government and self.government.state
-            else 0.0
-        )
-        indicators["tax_revenue"] = (
-            getattr(self.government.state, "tax_revenue", 0.0)
-            if self.government and self.government.state
-            else 0.0
-        )
+        total_labor_force = num_households if num_households else 1
+        indicators["vacancy_rate"] = float(job_openings.sum()) / total_labor_force
+
+        # 政府の状態は1回だけ取得して使い回す
+        gov_state = self.government.state if self.government else None
+        if gov_state:
+            indicators["government_spending"] = gov_state.expenditure
+            indicators["tax_revenue"] = gov_state.tax_revenue
+        else:
+            indicators["government_spending"] = 0.0
+            indicators["tax_revenue"] = 0.0
 
         return indicators
 
-    def save_results(self, output_dir: str | Path):
+    def save_results(
+        self,
+        output_dir: str | Path,
+        embed_household_history: bool = True,
+        embed_scalar_history: bool = True,
+        pretty: bool = False,
+    ):
         """
         シミュレーション結果を保存
 
+        世帯ごとのスナップショット履歴（household_incomes等）をresults.jsonに
+        含めない場合は、ステップ×世帯の行列として<key>.npyに保存する。
+        スカラー指標の履歴がメモリマップされている場合（history_dir指定時）は
+        ファイルへのフラッシュのみ行う。
+
         Args:
             output_dir: 出力ディレクトリパス
+            embed_household_history: 世帯スナップショットをresults.jsonに含めるか。
+                Falseの場合は<key>.npyとして保存する
+            embed_scalar_history: スカラー指標の履歴をresults.jsonにも含めるか。
+                Falseの場合、メモリマップされていない系列は<key>.npyとして保存する
+            pretty: Trueの場合、results.jsonもインデント付きで保存する
+                （既定は機械読み取り向けのコンパクト形式。summary.jsonは常にインデント付き）
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # JSONに含めない世帯スナップショットは.npyで保存（世帯が存在しない要素はNaN）
+        if not embed_household_history:
+            for key in HOUSEHOLD_HISTORY_KEYS:
+                np.save(output_dir / f"{key}.npy", self.state.history[key].values)
+
+        # スカラー指標の履歴（メモリマップ済みの系列は書き込み済みのためフラッシュのみ）
+        for key in SCALAR_HISTORY_KEYS:
+            series = self.state.history[key]
+            if series.is_memmap:
+                series.flush()
+            elif not embed_scalar_history:
+                np.save(output_dir / f"{key}.npy", series.values)
+
+        exclude = () if embed_household_history else HOUSEHOLD_HISTORY_KEYS
+        if not embed_scalar_history:
+            exclude += SCALAR_HISTORY_KEYS
+        history = self.state.history_to_dict(exclude=exclude, arrays=True)
+
         # 結果の構築
         results = {
-            "history": self.state.history,
+            "history": history,
             "metadata": {
                 "steps": self.state.step,
                 "households": len(self.state.households),
                 "firms": len(self.state.firms),
                 "seed": self.config.simulation.random_seed,
                 "phase": self.state.phase,
+                # メモリマップされた.npyは確保済みの長さ（max_steps以上）のため、先頭history_length件が有効
+                "history_length": len(self.state.history["gdp"]),
+                "history_dir": str(self.history_dir) if self.history_dir else None,
             },
         }
 
-        # results.jsonの保存
+        # results.jsonの保存（既定はインデントなしでバイト数を削減）
         results_file = output_dir / "results.json"
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        results_file.write_bytes(dumps(results, indent=pretty))
 
         logger.info(f"Results saved to {results_file}")
 
         # サマリーの保存
-        if self.state.history.get("gdp"):
+        if len(self.state.history.get("gdp", [])) > 0:
+            gdp_values = self.state.history["gdp"].values
             summary = {
-                "final_gdp": self.state.history["gdp"][-1],
+                "final_gdp": float(gdp_values[-1]),
                 "final_unemployment": self.state.history.get("unemployment", [0])[-1],
                 "final_inflation": self.state.history.get("inflation", [0])[-1],
                 "final_gini": self.state.history.get("gini", [0])[-1],
-                "avg_gdp": sum(self.state.history["gdp"])
-                / len(self.state.history["gdp"]),
+                "avg_gdp": float(gdp_values.mean()),
                 "steps": self.state.step,
             }
 
             summary_file = output_dir / "summary.json"
-            with open(summary_file, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            summary_file.write_bytes(dumps(summary, indent=True))
 
             logger.info(f"Summary saved to {summary_file}")
 
-    def run(self, steps: int) -> list[dict[str, float]]:
+    def run(
+        self,
+        steps: int,
+        results_path: str | Path | None = None,
+        return_list: bool = True,
+        parquet_dir: str | Path | None = None,
+        flush_every: int = 100,
+    ) -> list[dict[str, float]] | None:
         """
         複数ステップを実行
 
         Args:
             steps: 実行するステップ数
+            results_path: 指定した場合、各ステップの指標をJSONL形式で逐次追記
+                （load_jsonl_columns()で列ごとに読み戻せる）
+            return_list: Falseの場合、指標の辞書を保持せずNoneを返す
+                （指標は履歴・results_pathから参照でき、長時間実行のメモリを抑える）
+            parquet_dir: 指定した場合、スカラー指標をflush_everyステップごとに
+                列指向のhist_<chunk>.parquetとして書き出す（pyarrowが必要。
+                既存のチャンクがある場合はその続きの番号から追記する）
+            flush_every: Parquetチャンク1つあたりのステップ数
 
         Returns:
-            各ステップの指標のリスト
+            各ステップの指標のリスト（return_list=Falseの場合はNone）
         """
-        results = []
+        # 結果リストは事前確保してインデックスで書き込む
+        results = [None] * steps if return_list else None
 
-        for _ in range(steps):
-            indicators = self.step()
-            results.append(indicators)
+        writer = None
+        if parquet_dir is not None:
+            writer = ParquetChunkWriter(parquet_dir, SCALAR_HISTORY_KEYS, flush_every)
+
+        # 例外で中断した場合もバッファ済みの行をParquetに書き出す
+        try:
+            if results_path is None:
+                for i in range(steps):
+                    indicators = self.step()
+                    if writer is not None:
+                        writer.append(self.state.step, indicators)
+                    if results is not None:
+                        results[i] = indicators
+                return results
+
+            # 1ステップ1行で追記（全履歴の再シリアライズを回避）
+            results_path = Path(results_path)
+            results_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(results_path, "ab") as results_fp:
+                for i in range(steps):
+                    indicators = self.step()
+                    results_fp.write(dumps({"step": self.state.step, **indicators}))
+                    results_fp.write(b"\n")
+                    if writer is not None:
+                        writer.append(self.state.step, indicators)
+                    if results is not None:
+                        results[i] = indicators
+        finally:
+            if writer is not None:
+                writer.flush()
+
+        logger.info(f"Step indicators appended to {results_path}")
 
         return results
 
@@ -2190,20 +2753,24 @@ class Simulation:
 
         if actual_count > 0:
             # 新規世帯を生成
-            generator = HouseholdProfileGenerator(
-                random_seed=self.config.simulation.random_seed + self.state.step
+            new_profiles = self._get_household_generator().generate(
+                count=actual_count, seed=self._inflow_seed()
             )
-            new_profiles = generator.generate(count=actual_count)
 
-            # HouseholdAgentを初期化して追加
-            for profile in new_profiles:
-                new_household = HouseholdAgent(
+            # HouseholdAgentを初期化して一括追加
+            new_households = [
+                HouseholdAgent(
                     household_id=profile.id,
                     profile=profile,
                     llm_interface=self.llm_interface,
                 )
-                self.households.append(new_household)
-                self.state.households.append(profile)
+                for profile in new_profiles
+            ]
+            self.households.extend(new_households)
+            for profile in new_profiles:
+                self.state.add_household(profile)
+            self._register_households(new_households)
+            self._step_cache.clear()
 
             logger.info(
                 f"Added {actual_count} new households "
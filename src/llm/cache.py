@@ -0,0 +1,186 @@
+"""
+LLM Response Cache for SimCity
+
+同一プロンプトに対するFunction Callingの結果を再利用するキャッシュ
+- SHA256キー（モデル・メッセージ・関数定義・温度）
+- インメモリLRU + オプションのSQLite永続化
+- TTL（有効期限）
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class LLMResponseCache:
+    """
+    LLMレスポンスキャッシュ
+
+    キャッシュ対象はtemperatureがmax_temperature以下の呼び出しのみ
+    （サンプリングのある呼び出しを再利用すると意思決定の多様性が失われるため）。
+    保存するのはfunction_nameとargumentsのみで、生のレスポンスは保持しない。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = None,
+        cache_dir: str | Path | None = None,
+        max_temperature: float = 0.0,
+    ):
+        """
+        Args:
+            max_entries: インメモリLRUの最大エントリ数
+            ttl: 有効期限（秒）。Noneの場合は無期限
+            cache_dir: 指定した場合、responses.sqliteに永続化
+            max_temperature: キャッシュ対象とする温度の上限
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self._db: sqlite3.Connection | None = None
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(cache_dir / "responses.sqlite")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, created REAL, value TEXT)"
+            )
+            self._db.commit()
+
+        logger.info(
+            f"LLMResponseCache initialized: max_entries={max_entries}, ttl={ttl}, "
+            f"persistent={self._db is not None}"
+        )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        functions: list[dict[str, Any]],
+        temperature: float,
+    ) -> str:
+        """
+        リクエスト内容からキャッシュキーを生成
+
+        Args:
+            model: モデル名
+            messages: メッセージリスト
+            functions: 関数定義リスト
+            temperature: 温度
+
+        Returns:
+            SHA256ハッシュ（16進文字列）
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "functions": functions,
+                "temperature": temperature,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """この温度の呼び出しをキャッシュするか"""
+        return temperature <= self.max_temperature
+
+    def _is_expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        キャッシュされたレスポンスを取得
+
+        Args:
+            key: make_key()で生成したキー
+
+        Returns:
+            {"function_name", "arguments"} の辞書（存在しない・期限切れの場合None）
+        """
+        entry = self._entries.get(key)
+        if entry is None and self._db is not None:
+            row = self._db.execute(
+                "SELECT created, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                entry = (row[0], json.loads(row[1]))
+                self._remember(key, entry)
+
+        if entry is None or self._is_expired(entry[0]):
+            if entry is not None:
+                self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # 呼び出し側が変更してもキャッシュに影響しないようコピーを返す
+        return json.loads(json.dumps(entry[1]))
+
+    def set(self, key: str, value: dict[str, Any]):
+        """
+        レスポンスをキャッシュに保存
+
+        Args:
+            key: make_key()で生成したキー
+            value: {"function_name", "arguments"} の辞書
+        """
+        entry = (
+            time.time(),
+            {"function_name": value["function_name"], "arguments": value["arguments"]},
+        )
+        self._remember(key, entry)
+
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)",
+                (key, entry[0], json.dumps(entry[1], ensure_ascii=False)),
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, entry: tuple[float, dict[str, Any]]):
+        """インメモリLRUに追加し、上限を超えた古いエントリを破棄"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        キャッシュ統計を取得
+
+        Returns:
+            ヒット・ミス統計
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total > 0 else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def clear(self):
+        """キャッシュをクリア（永続化されたエントリも削除）"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
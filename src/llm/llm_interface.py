@@ -4,18 +4,38 @@ LLM Interface for SimCity Economic Simulation
 OpenAI APIとの統合を提供し、Function Callingによるエージェント行動決定を実現
 """
 
+import asyncio
 import json
+import random
 import time
+from collections import OrderedDict
 from typing import Any
 
 from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from src.llm.cache import LLMResponseCache
 
 try:
-    from openai import AsyncOpenAI, OpenAI
+    from openai import APIStatusError, AsyncOpenAI, OpenAI
 except ImportError as e:
     raise ImportError("OpenAI package not found. Install with: uv add openai") from e
 
 
+class BatchDecision(BaseModel):
+    """バッチ意思決定の1エージェント分の結果"""
+
+    agent: int  # 1始まりのエージェント番号
+    function_name: str
+    arguments: dict[str, Any] = {}
+
+
+BATCH_FUNCTION_NAME = "submit_decisions"
+
+# リトライで回復し得るHTTPステータス（タイムアウト・競合・レート制限）
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
 class LLMInterface:
     """
     OpenAI APIとのインターフェース
@@ -38,6 +58,10 @@ class LLMInterface:
         retry_delay: float = 1.0,
         timeout: int = 30,
         enable_prompt_caching: bool = True,
+        response_cache: LLMResponseCache | None = None,
+        max_prompt_cache_entries: int = 10_000,
+        request_timeout: float | None = None,
+        max_concurrent: int = 20,
     ):
         """
         Args:
@@ -46,41 +70,199 @@ class LLMInterface:
             temperature: サンプリング温度 (0.0-2.0)
             max_tokens: 最大トークン数
             max_retries: 最大リトライ回数
-            retry_delay: リトライ間隔（秒）
+            retry_delay: リトライ間隔の基準値（秒、試行ごとに指数的に延長）
             timeout: APIタイムアウト（秒）
             enable_prompt_caching: プロンプト最適化を有効化（Phase 10.3）
+            response_cache: 指定した場合、同一リクエストのレスポンスを再利用
+            max_prompt_cache_entries: 静的プロンプトキャッシュ（LRU）の最大エントリ数
+            request_timeout: 1回の試行の上限秒数。超過した試行はキャンセルして
+                バックオフ後に再試行する（Noneの場合はtimeoutの1.5倍）
+            max_concurrent: 並列実行時に同時に送信するリクエスト数の既定の上限
         """
-        self.client = OpenAI(api_key=api_key, timeout=timeout)
-        self.async_client = AsyncOpenAI(api_key=api_key, timeout=timeout)  # Phase 10.4
+        # 再試行はmax_retriesのループで一元管理する（SDK内部のリトライは無効化）
+        self.client = OpenAI(api_key=api_key, timeout=timeout, max_retries=0)
+        self.async_client = AsyncOpenAI(
+            api_key=api_key, timeout=timeout, max_retries=0
+        )  # Phase 10.4
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.request_timeout = (
+            request_timeout if request_timeout is not None else timeout * 1.5
+        )
+        self.max_concurrent = max_concurrent
         self.enable_prompt_caching = enable_prompt_caching
+        self.response_cache = response_cache
+        # リトライのジッタ用（シミュレーションの乱数系列を消費しないよう専用の生成器）
+        self._retry_rng = random.Random()
 
         # コスト追跡
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0  # サーバー側プロンプトキャッシュのヒット分
         self.call_count = 0
 
-        # Phase 10.3: 静的プロンプトキャッシュ
-        self._system_prompt_cache: dict[str, str] = {}
-        self._static_content_cache: dict[str, str] = {}
+        # Phase 10.3: 静的プロンプトキャッシュ（エージェントごとのキーで増え続けないようLRU）
+        self.max_prompt_cache_entries = max_prompt_cache_entries
+        self._system_prompt_cache: OrderedDict[str, str] = OrderedDict()
+        self._static_content_cache: OrderedDict[str, str] = OrderedDict()
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Phase 10.4: 非同期呼び出し用のイベントループ（async_clientの接続プールと共有）
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+
         logger.info(
             f"LLMInterface initialized with model={model}, temperature={temperature}, "
-            f"prompt_caching={enable_prompt_caching}, async=True"
+            f"prompt_caching={enable_prompt_caching}, "
+            f"response_cache={response_cache is not None}, async=True"
         )
 
+    @staticmethod
+    def _build_messages(system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+        """
+        メッセージリストを構築
+
+        OpenAIのプロンプトキャッシュは先頭からの一致で判定されるため、
+        エージェント種別ごとに共通の静的部分（関数定義・システムプロンプト）を先頭に、
+        エージェント固有の動的部分（プロフィール・観察）を最後に置く
+
+        Args:
+            system_prompt: システムプロンプト（静的）
+            user_prompt: ユーザープロンプト（動的）
+
+        Returns:
+            メッセージリスト
+        """
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _prompt_cache_options(self, prompt_cache_key: str | None) -> dict[str, Any]:
+        """
+        プロンプトキャッシュ用のリクエストオプション
+
+        prompt_cache_keyはextra_body経由で送信（古いSDKでも利用可能）
+
+        Args:
+            prompt_cache_key: キャッシュグループ名
+
+        Returns:
+            chat.completions.createに渡す追加キーワード引数
+        """
+        if not self.enable_prompt_caching or prompt_cache_key is None:
+            return {}
+        return {"extra_body": {"prompt_cache_key": prompt_cache_key}}
+
+    def _track_usage(self, usage: Any):
+        """
+        レスポンスのトークン使用量をコスト追跡に加算
+
+        Args:
+            usage: response.usage（prompt_tokens_details.cached_tokensがあれば集計）
+        """
+        self.total_input_tokens += usage.prompt_tokens
+        self.total_output_tokens += usage.completion_tokens
+        self.call_count += 1
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens:
+            self.total_cached_tokens += cached_tokens
+
+    @staticmethod
+    def _response_summary(response: Any) -> dict[str, Any]:
+        """
+        呼び出し側に返すレスポンスのメタデータ
+
+        ChatCompletion全体を保持すると並行呼び出しの結果リストが
+        メッセージ本文ごとメモリに残るため、使用量と終了理由のみ取り出す
+
+        Args:
+            response: chat.completions.createのレスポンス
+
+        Returns:
+            {"usage", "finish_reason"} の辞書
+        """
+        usage = response.usage
+        return {
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+            },
+            "finish_reason": getattr(response.choices[0], "finish_reason", None),
+        }
+
+    def _lookup_response(
+        self,
+        messages: list[dict[str, Any]],
+        functions: list[dict[str, Any]],
+        temperature: float,
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """
+        レスポンスキャッシュを参照
+
+        Args:
+            messages: メッセージリスト
+            functions: 関数定義リスト
+            temperature: 温度
+
+        Returns:
+            (キャッシュキー, キャッシュされたレスポンス) のタプル
+            キャッシュ対象外の場合キーはNone、ミスの場合レスポンスはNone
+        """
+        cache = self.response_cache
+        if cache is None or not cache.is_cacheable(temperature):
+            return None, None
+
+        key = cache.make_key(self.model, messages, functions, temperature)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit: {cached['function_name']}")
+            cached["cached"] = True
+        return key, cached
+
+    def _retry_wait(self, attempt: int, error: Exception) -> float | None:
+        """
+        失敗した呼び出しを再試行するまでの待機時間
+
+        指数バックオフ（retry_delay * 2^attempt）にジッタを加え、
+        Retry-Afterヘッダがあればそれ以上待つ。
+        リクエスト自体が不正な4xxエラー（認証・不正な引数等）は再試行しない。
+
+        Args:
+            attempt: 0始まりの試行回数
+            error: 発生した例外
+
+        Returns:
+            待機秒数（再試行しない場合はNone）
+        """
+        if attempt >= self.max_retries - 1:
+            return None
+
+        retry_after = 0.0
+        if isinstance(error, APIStatusError):
+            status = error.status_code
+            if status < 500 and status not in RETRYABLE_STATUS_CODES:
+                return None
+            try:
+                retry_after = float(error.response.headers.get("retry-after", 0.0))
+            except (TypeError, ValueError):
+                retry_after = 0.0
+
+        base = self.retry_delay * (2**attempt)
+        return max(base + self._retry_rng.uniform(0.0, base), retry_after)
+
     def function_call(
         self,
         system_prompt: str,
         user_prompt: str,
         functions: list[dict[str, Any]],
         temperature: float | None = None,
+        prompt_cache_key: str | None = None,
     ) -> dict[str, Any]:
         """
         Function Callingを使用してLLMを呼び出す
@@ -90,23 +272,30 @@ class LLMInterface:
             user_prompt: ユーザープロンプト（観察・状態）
             functions: 利用可能な関数のリスト（OpenAI形式）
             temperature: 温度（Noneの場合はデフォルト値を使用）
+            prompt_cache_key: 同じ静的プレフィックスを共有するリクエストのグループ名
+                （OpenAIのプロンプトキャッシュのヒット率を上げる）
 
         Returns:
             Dict containing:
                 - function_name: 呼び出された関数名
                 - arguments: 関数の引数（dict）
-                - raw_response: 生のレスポンス
+                - usage: トークン使用量（prompt_tokens, completion_tokens）
+                - finish_reason: 生成の終了理由
+                （レスポンスオブジェクト自体は保持しない。キャッシュヒット時は
+                usage・finish_reasonの代わりにcached=True）
 
         Raises:
             Exception: API呼び出しに失敗した場合
         """
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
+        messages = self._build_messages(system_prompt, user_prompt)
+        request_options = self._prompt_cache_options(prompt_cache_key)
 
         temp = temperature if temperature is not None else self.temperature
 
+        cache_key, cached = self._lookup_response(messages, functions, temp)
+        if cached is not None:
+            return cached
+
         for attempt in range(self.max_retries):
             try:
                 response = self.client.chat.completions.create(
@@ -116,12 +305,12 @@ class LLMInterface:
                     function_call="auto",
                     temperature=temp,
                     max_tokens=self.max_tokens,
+                    timeout=self.request_timeout,
+                    **request_options,
                 )
 
                 # コスト追跡
-                self.total_input_tokens += response.usage.prompt_tokens
-                self.total_output_tokens += response.usage.completion_tokens
-                self.call_count += 1
+                self._track_usage(response.usage)
 
                 # Function Callの抽出
                 message = response.choices[0].message
@@ -134,10 +323,16 @@ class LLMInterface:
                         f"LLM function call: {function_name} with args: {arguments}"
                     )
 
+                    if cache_key is not None:
+                        self.response_cache.set(
+                            cache_key,
+                            {"function_name": function_name, "arguments": arguments},
+                        )
+
                     return {
                         "function_name": function_name,
                         "arguments": arguments,
-                        "raw_response": response,
+                        **self._response_summary(response),
                     }
                 else:
                     # Function Callがない場合（エラー）
@@ -145,7 +340,7 @@ class LLMInterface:
                     return {
                         "function_name": None,
                         "arguments": {},
-                        "raw_response": response,
+                        **self._response_summary(response),
                         "error": "No function call returned",
                     }
 
@@ -154,11 +349,175 @@ class LLMInterface:
                     f"API call failed (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
 
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    logger.error(f"API call failed after {self.max_retries} attempts")
+                wait = self._retry_wait(attempt, e)
+                if wait is None:
+                    logger.error(f"API call failed after {attempt + 1} attempts")
                     raise
+                time.sleep(wait)
+
+    def batch_function_call(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        functions: list[dict[str, Any]],
+        temperature: float | None = None,
+        prompt_cache_key: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        複数エージェントの意思決定を1回のAPI呼び出しにまとめる（クエリ連結）
+
+        同じシステムプロンプト・関数定義を共有するK体分の観察を1つのプロンプトに
+        列挙し、submit_decisions関数でK件の決定を配列として返させる。
+        欠落・不正な決定があった場合はバッチを半分に分割して再試行し、
+        1件になった場合は通常のfunction_call()で呼び出す。
+
+        Args:
+            system_prompt: 共通のシステムプロンプト
+            user_prompts: エージェントごとのユーザープロンプト
+            functions: 共通の関数定義リスト
+            temperature: 温度（Noneの場合はデフォルト値を使用）
+            prompt_cache_key: プロンプトキャッシュのグループ名
+
+        Returns:
+            user_promptsと同じ順のfunction_call()形式のレスポンスリスト
+        """
+        if len(user_prompts) <= 1:
+            return [
+                self.function_call(
+                    system_prompt,
+                    user_prompt,
+                    functions,
+                    temperature=temperature,
+                    prompt_cache_key=prompt_cache_key,
+                )
+                for user_prompt in user_prompts
+            ]
+
+        function_names = [f["name"] for f in functions]
+        response = self.function_call(
+            system_prompt=self._build_batch_system_prompt(system_prompt, functions),
+            user_prompt=self._build_batch_user_prompt(user_prompts),
+            functions=[self._batch_function(function_names, len(user_prompts))],
+            temperature=temperature,
+            prompt_cache_key=prompt_cache_key,
+        )
+
+        results = self._parse_batch_response(
+            response, function_names, len(user_prompts)
+        )
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        # 欠落分を半分に分割して再試行
+        logger.warning(
+            f"Batch decision missing {len(missing)}/{len(user_prompts)} agents, "
+            "retrying in smaller batches"
+        )
+        half = (len(missing) + 1) // 2
+        for group in (missing[:half], missing[half:]):
+            if not group:
+                continue
+            retried = self.batch_function_call(
+                system_prompt,
+                [user_prompts[i] for i in group],
+                functions,
+                temperature=temperature,
+                prompt_cache_key=prompt_cache_key,
+            )
+            for i, result in zip(group, retried, strict=True):
+                results[i] = result
+        return results
+
+    @staticmethod
+    def _build_batch_system_prompt(
+        system_prompt: str, functions: list[dict[str, Any]]
+    ) -> str:
+        """バッチ用システムプロンプト（静的部分のみ、プロンプトキャッシュ対象）"""
+        return (
+            f"{system_prompt}\n\n"
+            "### Batch Decisions\n"
+            "You will receive several agents, numbered from 1. Decide independently "
+            "for EACH agent by choosing ONE of the actions below, and return all "
+            f"decisions in a single call to {BATCH_FUNCTION_NAME}.\n\n"
+            "### Actions (same for every agent)\n"
+            f"{json.dumps(functions, ensure_ascii=False)}"
+        )
+
+    @staticmethod
+    def _build_batch_user_prompt(user_prompts: list[str]) -> str:
+        """エージェントごとのプロンプトを番号付きで連結"""
+        sections = [
+            f"## Agent {i}\n{user_prompt}"
+            for i, user_prompt in enumerate(user_prompts, 1)
+        ]
+        return "\n\n".join(sections)
+
+    @staticmethod
+    def _batch_function(function_names: list[str], count: int) -> dict[str, Any]:
+        """K件の決定を配列で受け取る関数定義"""
+        return {
+            "name": BATCH_FUNCTION_NAME,
+            "description": f"Submit one decision for each of the {count} agents",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "decisions": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "agent": {
+                                    "type": "integer",
+                                    "description": "Agent number (1-based)",
+                                },
+                                "function_name": {
+                                    "type": "string",
+                                    "enum": function_names,
+                                },
+                                "arguments": {
+                                    "type": "object",
+                                    "description": "Arguments of the chosen action",
+                                },
+                            },
+                            "required": ["agent", "function_name", "arguments"],
+                        },
+                    }
+                },
+                "required": ["decisions"],
+            },
+        }
+
+    @staticmethod
+    def _parse_batch_response(
+        response: dict[str, Any], function_names: list[str], count: int
+    ) -> list[dict[str, Any] | None]:
+        """
+        バッチレスポンスをエージェントごとのレスポンスに分解
+
+        Returns:
+            エージェント順のレスポンスリスト（欠落・不正な要素はNone）
+        """
+        results: list[dict[str, Any] | None] = [None] * count
+        if response.get("function_name") != BATCH_FUNCTION_NAME:
+            return results
+
+        for item in response["arguments"].get("decisions", []):
+            try:
+                decision = BatchDecision.model_validate(item)
+            except ValidationError as e:
+                logger.debug(f"Invalid batch decision {item}: {e}")
+                continue
+            index = decision.agent - 1
+            if not 0 <= index < count or results[index] is not None:
+                continue
+            if decision.function_name not in function_names:
+                continue
+            results[index] = {
+                "function_name": decision.function_name,
+                "arguments": decision.arguments,
+            }
+        return results
 
     def validate_response(
         self,
@@ -217,13 +576,19 @@ class LLMInterface:
                 - total_calls: 総呼び出し回数
                 - total_input_tokens: 総入力トークン数
                 - total_output_tokens: 総出力トークン数
+                - total_cached_tokens: プロンプトキャッシュにヒットした入力トークン数
+                - cached_token_ratio: 入力トークンのうちキャッシュヒットの割合
                 - estimated_cost_usd: 推定コスト（USD）
         """
         # gpt-4o-miniの価格（2024年12月時点）
         input_price_per_1m = 0.15  # ドル/100万トークン
+        cached_input_price_per_1m = 0.075  # キャッシュヒット分は半額
         output_price_per_1m = 0.60  # ドル/100万トークン
 
-        input_cost = (self.total_input_tokens / 1_000_000) * input_price_per_1m
+        uncached_tokens = self.total_input_tokens - self.total_cached_tokens
+        input_cost = (uncached_tokens / 1_000_000) * input_price_per_1m + (
+            self.total_cached_tokens / 1_000_000
+        ) * cached_input_price_per_1m
         output_cost = (self.total_output_tokens / 1_000_000) * output_price_per_1m
         total_cost = input_cost + output_cost
 
@@ -231,6 +596,12 @@ class LLMInterface:
             "total_calls": self.call_count,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cached_tokens": self.total_cached_tokens,
+            "cached_token_ratio": (
+                round(self.total_cached_tokens / self.total_input_tokens, 3)
+                if self.total_input_tokens
+                else 0.0
+            ),
             "estimated_cost_usd": round(total_cost, 4),
             "input_cost_usd": round(input_cost, 4),
             "output_cost_usd": round(output_cost, 4),
@@ -240,6 +611,7 @@ class LLMInterface:
         """コスト追跡をリセット"""
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
         self.call_count = 0
         logger.info("Cost tracking reset")
 
@@ -254,7 +626,7 @@ class LLMInterface:
             prompt: システムプロンプト
         """
         if self.enable_prompt_caching:
-            self._system_prompt_cache[agent_type] = prompt
+            self._remember_prompt(self._system_prompt_cache, agent_type, prompt)
             logger.debug(f"Cached system prompt for {agent_type}")
 
     def get_cached_system_prompt(self, agent_type: str) -> str | None:
@@ -270,6 +642,7 @@ class LLMInterface:
         if self.enable_prompt_caching:
             prompt = self._system_prompt_cache.get(agent_type)
             if prompt:
+                self._system_prompt_cache.move_to_end(agent_type)
                 self._cache_hits += 1
                 return prompt
             self._cache_misses += 1
@@ -284,7 +657,7 @@ class LLMInterface:
             content: 静的コンテンツ
         """
         if self.enable_prompt_caching:
-            self._static_content_cache[key] = content
+            self._remember_prompt(self._static_content_cache, key, content)
 
     def get_cached_static_content(self, key: str) -> str | None:
         """
@@ -299,11 +672,19 @@ class LLMInterface:
         if self.enable_prompt_caching:
             content = self._static_content_cache.get(key)
             if content:
+                self._static_content_cache.move_to_end(key)
                 self._cache_hits += 1
                 return content
             self._cache_misses += 1
         return None
 
+    def _remember_prompt(self, cache: OrderedDict[str, str], key: str, value: str):
+        """プロンプトキャッシュに追加し、上限を超えた古いエントリを破棄"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_prompt_cache_entries:
+            cache.popitem(last=False)
+
     def get_cache_stats(self) -> dict[str, int]:
         """
         キャッシュ統計を取得（Phase 10.3）
@@ -339,6 +720,7 @@ class LLMInterface:
         user_prompt: str,
         functions: list[dict[str, Any]],
         temperature: float | None = None,
+        prompt_cache_key: str | None = None,
     ) -> dict[str, Any]:
         """
         非同期Function Calling（Phase 10.4）
@@ -348,54 +730,64 @@ class LLMInterface:
             user_prompt: ユーザープロンプト
             functions: 利用可能な関数のリスト
             temperature: 温度
+            prompt_cache_key: プロンプトキャッシュのグループ名
 
         Returns:
             LLMレスポンス
         """
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
+        messages = self._build_messages(system_prompt, user_prompt)
+        request_options = self._prompt_cache_options(prompt_cache_key)
 
         temp = temperature if temperature is not None else self.temperature
 
+        cache_key, cached = self._lookup_response(messages, functions, temp)
+        if cached is not None:
+            return cached
+
         for attempt in range(self.max_retries):
             try:
-                response = await self.async_client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    functions=functions,
-                    function_call="auto",
-                    temperature=temp,
-                    max_tokens=self.max_tokens,
+                # 試行ごとにrequest_timeoutで打ち切り、超過した試行も再試行の対象とする
+                response = await asyncio.wait_for(
+                    self.async_client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        functions=functions,
+                        function_call="auto",
+                        temperature=temp,
+                        max_tokens=self.max_tokens,
+                        **request_options,
+                    ),
+                    timeout=self.request_timeout,
                 )
 
                 # コスト追跡
-                self.total_input_tokens += response.usage.prompt_tokens
-                self.total_output_tokens += response.usage.completion_tokens
-                self.call_count += 1
+                self._track_usage(response.usage)
 
                 # Function Callの抽出
                 message = response.choices[0].message
 
                 if message.function_call:
                     function_name = message.function_call.name
-                    import json
-
                     arguments = json.loads(message.function_call.arguments)
 
                     logger.debug(f"Async LLM function call: {function_name}")
 
+                    if cache_key is not None:
+                        self.response_cache.set(
+                            cache_key,
+                            {"function_name": function_name, "arguments": arguments},
+                        )
+
                     return {
                         "function_name": function_name,
                         "arguments": arguments,
-                        "raw_response": response,
+                        **self._response_summary(response),
                     }
                 else:
                     return {
                         "function_name": None,
                         "arguments": {},
-                        "raw_response": response,
+                        **self._response_summary(response),
                         "error": "No function call returned",
                     }
 
@@ -404,23 +796,26 @@ class LLMInterface:
                     f"Async API call failed (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
 
-                if attempt < self.max_retries - 1:
-                    import asyncio
-
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    logger.error(
-                        f"Async API call failed after {self.max_retries} attempts"
-                    )
+                wait = self._retry_wait(attempt, e)
+                if wait is None:
+                    logger.error(f"Async API call failed after {attempt + 1} attempts")
                     raise
+                await asyncio.sleep(wait)
 
     async def batch_function_calls(
         self,
         requests: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+        chunk_size: int = 256,
     ) -> list[dict[str, Any]]:
         """
         複数のFunction Callingを並列実行（Phase 10.4）
 
+        リクエストはchunk_size件ずつ順に処理し、同時に保持する
+        コルーチン・Futureの数を抑える。
+        各試行はrequest_timeoutで打ち切られ、すべての試行に失敗した
+        リクエストは他のリクエストの結果を待たせないようエラー応答として返す。
+
         Args:
             requests: リクエストのリスト
                 各リクエストは以下を含む:
@@ -428,23 +823,37 @@ class LLMInterface:
                 - user_prompt: ユーザープロンプト
                 - functions: 利用可能な関数のリスト
                 - temperature: 温度（オプション）
+                - prompt_cache_key: プロンプトキャッシュのグループ名（オプション）
+            max_concurrency: 同時に実行するリクエスト数の上限
+                （Noneの場合はmax_concurrent）
+            chunk_size: 一度にスケジュールするリクエスト数
 
         Returns:
             レスポンスのリスト
         """
-        import asyncio
-
-        tasks = [
-            self.function_call_async(
-                system_prompt=req["system_prompt"],
-                user_prompt=req["user_prompt"],
-                functions=req["functions"],
-                temperature=req.get("temperature"),
+        if max_concurrency is None:
+            max_concurrency = self.max_concurrent
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def call(req: dict[str, Any]) -> dict[str, Any]:
+            kwargs = {
+                "system_prompt": req["system_prompt"],
+                "user_prompt": req["user_prompt"],
+                "functions": req["functions"],
+                "temperature": req.get("temperature"),
+                "prompt_cache_key": req.get("prompt_cache_key"),
+            }
+            if semaphore is None:
+                return await self.function_call_async(**kwargs)
+            async with semaphore:
+                return await self.function_call_async(**kwargs)
+
+        responses = []
+        for start in range(0, len(requests), chunk_size):
+            chunk = requests[start : start + chunk_size]
+            responses.extend(
+                await asyncio.gather(*map(call, chunk), return_exceptions=True)
             )
-            for req in requests
-        ]
-
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
 
         # エラーハンドリング
         valid_responses = []
@@ -455,7 +864,7 @@ class LLMInterface:
                     {
                         "function_name": None,
                         "arguments": {},
-                        "error": str(response),
+                        "error": str(response) or type(response).__name__,
                     }
                 )
             else:
@@ -467,6 +876,31 @@ class LLMInterface:
 
         return valid_responses
 
+    def run_function_calls(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        batch_function_calls()を同期的に実行
+
+        async_clientの接続プールがイベントループに紐づくため、
+        呼び出しごとにasyncio.run()せず、インスタンス専用のループを再利用する。
+        実行中のイベントループ内からは呼び出せない。
+
+        Args:
+            requests: batch_function_calls()と同じ形式のリクエストのリスト
+            max_concurrency: 同時に実行するリクエスト数の上限（Noneの場合はmax_concurrent）
+
+        Returns:
+            レスポンスのリスト（失敗したリクエストは"error"キーを含む）
+        """
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop.run_until_complete(
+            self.batch_function_calls(requests, max_concurrency=max_concurrency)
+        )
+
 
 class LLMInterfaceFactory:
     """LLMInterfaceのファクトリークラス"""
@@ -482,10 +916,12 @@ class LLMInterfaceFactory:
         Args:
             api_key: OpenAI APIキー
             config: LLM設定（llm_config.yamlのopenaiセクション）
+                "cache"キーがある場合、その値をLLMResponseCacheの引数として使用
 
         Returns:
             LLMInterface instance
         """
+        cache_config = config.get("cache")
         return LLMInterface(
             api_key=api_key,
             model=config.get("model", "gpt-4o-mini"),
@@ -494,4 +930,10 @@ class LLMInterfaceFactory:
             max_retries=config.get("max_retries", 3),
             retry_delay=config.get("retry_delay", 1.0),
             timeout=config.get("timeout", 30),
+            max_prompt_cache_entries=config.get("max_prompt_cache_entries", 10_000),
+            request_timeout=config.get("request_timeout"),
+            max_concurrent=config.get("max_concurrent", 20),
+            response_cache=(
+                LLMResponseCache(**cache_config) if cache_config is not None else None
+            ),
         )
@@ -2,10 +2,18 @@
 Data models for SimCity simulation
 
 エージェントや経済状態を表現するデータ構造
+
+データクラスは__slots__を持つ（インスタンスに__dict__がない）ため、
+フィールドとして宣言されていない属性を後から追加することはできない。
 """
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
 
 
 class EmploymentStatus(Enum):
@@ -39,7 +47,26 @@ class GoodCategory(Enum):
     OTHER = "other"
 
 
-@dataclass
+# 値→列挙子の索引（復元時の列挙型変換を辞書参照にする）
+_EMPLOYMENT_STATUS_BY_VALUE = {member.value: member for member in EmploymentStatus}
+_EDUCATION_LEVEL_BY_VALUE = {member.value: member for member in EducationLevel}
+_GOOD_CATEGORY_BY_VALUE = {member.value: member for member in GoodCategory}
+
+
+def _enum_from_value(table: dict, enum_cls: type[Enum], value: Any) -> Enum:
+    """
+    値から列挙子を取得
+
+    索引にない値（列挙子そのもの・不正な値）は列挙型のコンストラクタに任せる
+    （不正な値は従来通りValueErrorになる）。
+    """
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+@dataclass(slots=True)
 class HouseholdProfile:
     """
     家計プロファイル
@@ -96,15 +123,34 @@ class HouseholdProfile:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "HouseholdProfile":
-        """辞書形式から復元"""
+    def from_dict(cls, data: dict, trusted: bool = False) -> "HouseholdProfile":
+        """
+        辞書形式から復元
+
+        Args:
+            data: to_dict()で生成した辞書
+            trusted: Trueの場合、検証済みの辞書として__init__を省略して復元
+        """
+        if trusted:
+            profile = _restore_trusted(cls, data)
+            profile.education_level = _enum_from_value(
+                _EDUCATION_LEVEL_BY_VALUE, EducationLevel, data["education_level"]
+            )
+            profile.employment_status = _enum_from_value(
+                _EMPLOYMENT_STATUS_BY_VALUE, EmploymentStatus, data["employment_status"]
+            )
+            return profile
         data = data.copy()
-        data["education_level"] = EducationLevel(data["education_level"])
-        data["employment_status"] = EmploymentStatus(data["employment_status"])
+        data["education_level"] = _enum_from_value(
+            _EDUCATION_LEVEL_BY_VALUE, EducationLevel, data["education_level"]
+        )
+        data["employment_status"] = _enum_from_value(
+            _EMPLOYMENT_STATUS_BY_VALUE, EmploymentStatus, data["employment_status"]
+        )
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class FirmProfile:
     """
     企業プロファイル
@@ -167,14 +213,42 @@ class FirmProfile:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "FirmProfile":
-        """辞書形式から復元"""
+    def from_dict(cls, data: dict, trusted: bool = False) -> "FirmProfile":
+        """
+        辞書形式から復元
+
+        Args:
+            data: to_dict()で生成した辞書
+            trusted: Trueの場合、検証済みの辞書として__init__を省略して復元
+        """
+        if trusted:
+            profile = _restore_trusted(cls, data)
+            profile.goods_category = _enum_from_value(
+                _GOOD_CATEGORY_BY_VALUE, GoodCategory, data["goods_category"]
+            )
+            return profile
         data = data.copy()
-        data["goods_category"] = GoodCategory(data["goods_category"])
+        data["goods_category"] = _enum_from_value(
+            _GOOD_CATEGORY_BY_VALUE, GoodCategory, data["goods_category"]
+        )
         return cls(**data)
 
 
-@dataclass
+def _restore_trusted(cls, data: dict):
+    """
+    __init__を経由せずにデータクラスを復元
+
+    自プロセスが書き出した状態ファイルのように、フィールドが揃っていることが
+    保証されている辞書専用。キーワード展開とデフォルト値の処理を省略する。
+    データクラスは__slots__を持つため、フィールドにない属性は設定できない。
+    """
+    obj = cls.__new__(cls)
+    for name, value in data.items():
+        setattr(obj, name, value)
+    return obj
+
+
+@dataclass(slots=True)
 class GovernmentState:
     """
     政府の状態
@@ -228,8 +302,21 @@ class GovernmentState:
             "gini_coefficient": self.gini_coefficient,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> "GovernmentState":
+        """
+        辞書形式から復元
+
+        Args:
+            data: to_dict()で生成した辞書
+            trusted: Trueの場合、検証済みの辞書として__init__を省略して復元
+        """
+        if trusted:
+            return _restore_trusted(cls, data)
+        return cls(**data)
+
 
-@dataclass
+@dataclass(slots=True)
 class CentralBankState:
     """
     中央銀行の状態
@@ -276,8 +363,21 @@ class CentralBankState:
             "loan_rate_spread": self.loan_rate_spread,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> "CentralBankState":
+        """
+        辞書形式から復元
+
+        Args:
+            data: to_dict()で生成した辞書
+            trusted: Trueの場合、検証済みの辞書として__init__を省略して復元
+        """
+        if trusted:
+            return _restore_trusted(cls, data)
+        return cls(**data)
+
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """
     市場の状態
@@ -308,8 +408,401 @@ class MarketState:
             "interest_rate": self.interest_rate,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> "MarketState":
+        """
+        辞書形式から復元
+
+        Args:
+            data: to_dict()で生成した辞書
+            trusted: Trueの場合、検証済みの辞書として__init__を省略して復元
+        """
+        if trusted:
+            return _restore_trusted(cls, data)
+        return cls(**data)
+
 
-@dataclass
+# スカラー値の時系列として記録する履歴キー
+SCALAR_HISTORY_KEYS = (
+    "gdp",
+    "real_gdp",
+    "inflation",
+    "unemployment_rate",
+    "gini",
+    "policy_rate",
+    "num_households",
+    "num_firms",
+    "vacancy_rate",
+    "consumption",
+    "investment",
+)
+
+
+class HistorySeries:
+    """
+    スカラー時系列の履歴バッファ
+
+    事前確保したfloat64配列に値を書き込み、集計をNumPyで行えるようにする。
+    list互換のインターフェース（append, len, インデックス, スライス, 反復, ==）を
+    保つため、既存の呼び出し側はそのまま動作する。
+    容量を超えた場合は2倍に拡張する。
+    バッファにnp.memmapを渡すと、記録した値がそのままファイルに書き込まれる
+    （容量を超えた場合はファイルごと拡張し、引き続きファイルに書き込む）。
+    """
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(
+        self, capacity: int = 0, values: Any = None, buffer: np.ndarray | None = None
+    ):
+        """
+        Args:
+            capacity: 事前確保する要素数
+            values: 初期値（list等）
+            buffer: 書き込み先のfloat64配列（np.memmap等）。指定時はcapacityを無視
+        """
+        initial = np.asarray(values if values is not None else [], dtype=np.float64)
+        self._size = len(initial)
+        if buffer is not None and len(buffer) >= max(self._size, 1):
+            self._data = buffer
+        else:
+            self._data = np.empty(max(capacity, self._size, 1), dtype=np.float64)
+        self._data[: self._size] = initial
+
+    @property
+    def is_memmap(self) -> bool:
+        """ファイルにマップされたバッファに書き込んでいるか"""
+        return isinstance(self._data, np.memmap)
+
+    def flush(self):
+        """メモリマップされたバッファの内容をファイルに反映"""
+        if self.is_memmap:
+            self._data.flush()
+
+    @property
+    def values(self) -> np.ndarray:
+        """記録済み部分の配列ビュー（コピーなし）"""
+        return self._data[: self._size]
+
+    def append(self, value: float):
+        """値を末尾に追加"""
+        if self._size == len(self._data):
+            self._grow(2 * len(self._data))
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        """複数の値を末尾に追加（拡張は最大1回、書き込みは一括）"""
+        new_values = np.fromiter(values, dtype=np.float64)
+        end = self._size + len(new_values)
+        if end > len(self._data):
+            self._grow(max(end, 2 * len(self._data)))
+        self._data[self._size : end] = new_values
+        self._size = end
+
+    def _grow(self, length: int):
+        """
+        バッファをlength要素に拡張
+
+        メモリマップされている場合は拡張した.npyを一時ファイルに書き出して
+        元のファイルと置き換え、マップし直す（既存のビューは旧ファイルを参照し続ける）。
+        置き換えの前に自身のマップは解放するが、Windowsではマップ中のファイルを
+        置き換えられないため、values・window()のビューを保持したまま拡張すると
+        PermissionErrorになる（その場合は元のファイルをマップし直して送出する）。
+        """
+        path = self._data.filename if self.is_memmap else None
+        if path is None:
+            self._data = np.resize(self._data, length)
+            return
+
+        temp_path = f"{path}.tmp"
+        grown = np.lib.format.open_memmap(
+            temp_path, mode="w+", dtype=np.float64, shape=(length,)
+        )
+        grown[: self._size] = self._data[: self._size]
+        grown.flush()
+        del grown
+
+        self._data.flush()
+        self._data = None
+        try:
+            os.replace(temp_path, path)
+        finally:
+            self._data = np.lib.format.open_memmap(path, mode="r+")
+
+    def window(self, n: int) -> np.ndarray:
+        """
+        直近n件の読み取り専用ビュー（コピーなし）
+
+        Args:
+            n: 件数（記録数より多い場合は全件）
+
+        Returns:
+            直近n件の配列ビュー
+        """
+        view = self.values[max(self._size - n, 0) :]
+        view.flags.writeable = False
+        return view
+
+    def tolist(self) -> list[float]:
+        """Pythonのlistに変換（JSON保存用）"""
+        return self.values.tolist()
+
+    def copy(self) -> "HistorySeries":
+        """コピーを作成"""
+        return HistorySeries(values=self.values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.values[key].tolist()
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("HistorySeries index out of range")
+        return float(self._data[key])
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HistorySeries):
+            return self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.values if dtype is None else self.values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __repr__(self) -> str:
+        return f"HistorySeries({self.tolist()!r})"
+
+
+def _open_history_memmap(path: Path, length: int) -> np.memmap:
+    """
+    履歴の.npyファイルを書き込み可能なメモリマップとして開く
+
+    既存のファイルがlength要素以上のfloat64配列ならそのまま開き、
+    そうでなければlength要素のファイルを作り直す。
+    """
+    if path.exists():
+        existing = np.lib.format.open_memmap(path, mode="r+")
+        reusable = (
+            existing.dtype == np.float64
+            and existing.ndim == 1
+            and len(existing) >= length
+        )
+        if reusable:
+            return existing
+        del existing
+    return np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(length,))
+
+
+# 世帯ごとのスナップショットとして記録する履歴キー
+HOUSEHOLD_HISTORY_KEYS = (
+    "household_incomes",
+    "food_expenditure_ratios",
+)
+
+# 世帯スナップショットのデータ型
+# 比率（0〜1）はfloat32で十分な精度があるため容量を半減し、
+# 所得はfloat32では約1.6e7を超えると1単位の精度を失うためfloat64で保持する
+HOUSEHOLD_HISTORY_DTYPES = {
+    "household_incomes": np.float64,
+    "food_expenditure_ratios": np.float32,
+}
+
+# float32の行をlistに戻す際に丸める小数桁数（float32の有効桁数に相当）
+FLOAT32_LIST_DECIMALS = 7
+
+
+class HistoryMatrix:
+    """
+    世帯ごとのスナップショット履歴（ステップ × 世帯の行列）
+
+    各ステップの世帯数は可変のため、行ごとの有効長を別に保持し、
+    未使用部分はNaNで埋める。行の取得・反復はlistを返し、
+    既存の「listのlist」形式と互換に振る舞う。
+    """
+
+    __slots__ = ("_data", "_counts", "_size")
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        width: int = 0,
+        rows: Any = None,
+        dtype: Any = np.float64,
+    ):
+        """
+        Args:
+            capacity: 事前確保するステップ数
+            width: 事前確保する世帯数
+            rows: 初期値（listのlist）
+            dtype: 格納するデータ型
+        """
+        rows = rows if rows is not None else []
+        width = max([width, 1] + [len(row) for row in rows])
+        self._data = np.full((max(capacity, len(rows), 1), width), np.nan, dtype=dtype)
+        self._counts = np.zeros(len(self._data), dtype=np.int64)
+        self._size = 0
+        for row in rows:
+            self.append(row)
+
+    @property
+    def values(self) -> np.ndarray:
+        """記録済みステップの行列ビュー（世帯が存在しない要素はNaN）"""
+        return self._data[: self._size]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """各ステップの世帯数"""
+        return self._counts[: self._size]
+
+    def append(self, row: Any):
+        """
+        1ステップ分の世帯データを追加
+
+        Args:
+            row: 世帯ごとの値（配列またはlist）
+        """
+        row = np.asarray(row, dtype=self._data.dtype)
+        steps, width = self._data.shape
+        if self._size == steps or len(row) > width:
+            grown = np.full(
+                (2 * steps if self._size == steps else steps, max(len(row), width)),
+                np.nan,
+                dtype=self._data.dtype,
+            )
+            grown[:steps, :width] = self._data
+            self._data = grown
+            self._counts = np.resize(self._counts, len(grown))
+            self._counts[steps:] = 0
+        self._data[self._size, : len(row)] = row
+        self._counts[self._size] = len(row)
+        self._size += 1
+
+    def row(self, index: int) -> np.ndarray:
+        """指定ステップの有効部分の配列ビュー"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("HistoryMatrix index out of range")
+        return self._data[index, : self._counts[index]]
+
+    def _row_list(self, index: int) -> list[float]:
+        """
+        指定ステップをPythonのlistに変換
+
+        float32の場合は小数FLOAT32_LIST_DECIMALS桁に丸める
+        （0〜1の比率で0.2が0.20000000298...にならないように）
+        """
+        row = self.row(index)
+        if row.dtype == np.float64:
+            return row.tolist()
+        return np.round(row.astype(np.float64), FLOAT32_LIST_DECIMALS).tolist()
+
+    def tolist(self) -> list[list[float]]:
+        """listのlistに変換（JSON保存用）"""
+        return [self._row_list(i) for i in range(self._size)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._row_list(i) for i in range(self._size)[key]]
+        return self._row_list(key)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._row_list(i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (HistoryMatrix, list, tuple)):
+            return self.tolist() == [list(row) for row in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"HistoryMatrix({self.tolist()!r})"
+
+
+class _IdIndex:
+    """
+    プロファイルリストのID→位置の索引
+
+    SimulationStateのadd_*/remove_*/replace_*を経由した変更は索引に直接反映する。
+    リストを直接変更した場合も、リスト自体の差し替え・長さの変化・引けなかったID・
+    位置のずれを検知した時点で作り直すため、結果は常に線形探索と同じになる。
+    存在しないIDの参照は作り直しを伴う（線形探索と同じO(n)）。
+    IDが重複する場合は先頭側の要素を返す（線形探索と同じ結果）。
+    """
+
+    __slots__ = ("positions", "source", "size")
+
+    def __init__(self):
+        self.positions: dict[int, int] = {}
+        self.source: list | None = None
+        self.size = 0
+
+    def invalidate(self):
+        """索引を破棄する（次回のgetで作り直す）"""
+        self.positions = {}
+        self.source = None
+        self.size = 0
+
+    def rebuild(self, items: list):
+        """itemsから索引を作り直す"""
+        self.positions = {}
+        self.source = items
+        self.size = 0
+        self.extend(items)
+
+    def extend(self, items: list):
+        """itemsの末尾に追加された要素を索引に登録"""
+        positions = self.positions
+        for i in range(self.size, len(items)):
+            positions.setdefault(items[i].id, i)
+        self.size = len(items)
+
+    def get(self, items: list, item_id: int):
+        """
+        IDから要素を取得
+
+        Args:
+            items: 索引対象のリスト
+            item_id: 要素のID
+
+        Returns:
+            該当する要素（存在しない場合None）
+        """
+        rebuilt = False
+        if items is not self.source or len(items) < self.size:
+            self.rebuild(items)
+            rebuilt = True
+        elif len(items) > self.size:
+            self.extend(items)
+
+        i = self.positions.get(item_id)
+        if i is not None and items[i].id == item_id:
+            return items[i]
+        if rebuilt:
+            return None
+        # 長さを変えずにリストが書き換えられた可能性があるため、作り直して引き直す
+        self.rebuild(items)
+        i = self.positions.get(item_id)
+        return None if i is None else items[i]
+
+
+@dataclass(slots=True)
 class SimulationState:
     """
     シミュレーション全体の状態
@@ -327,24 +820,194 @@ class SimulationState:
     market: MarketState = field(default_factory=MarketState)
 
     # 履歴データ（時系列記録用）
-    history: dict[str, list[float]] = field(default_factory=dict)
+    # スカラー系列はHistorySeries、prices/demandsは財IDごとのlist
+    history: dict[str, Any] = field(default_factory=dict)
+
+    # ID索引（get_household/get_firmを辞書参照にする）
+    _household_index: _IdIndex = field(
+        default_factory=_IdIndex, init=False, repr=False, compare=False
+    )
+    _firm_index: _IdIndex = field(
+        default_factory=_IdIndex, init=False, repr=False, compare=False
+    )
+
+    def init_history(
+        self,
+        capacity: int = 0,
+        household_capacity: int = 0,
+        mmap_dir: str | Path | None = None,
+    ):
+        """
+        履歴を初期化
+
+        Args:
+            capacity: 系列ごとに事前確保するステップ数
+            household_capacity: 世帯スナップショットで事前確保する世帯数
+            mmap_dir: 指定した場合、スカラー系列を<key>.npyにメモリマップして
+                ステップごとに直接書き込む（長さcapacityのファイル）
+        """
+        if mmap_dir is None:
+            self.history = {key: HistorySeries(capacity) for key in SCALAR_HISTORY_KEYS}
+        else:
+            mmap_dir = Path(mmap_dir)
+            mmap_dir.mkdir(parents=True, exist_ok=True)
+            self.history = {
+                key: HistorySeries(
+                    buffer=np.lib.format.open_memmap(
+                        mmap_dir / f"{key}.npy",
+                        mode="w+",
+                        dtype=np.float64,
+                        shape=(max(capacity, 1),),
+                    )
+                )
+                for key in SCALAR_HISTORY_KEYS
+            }
+        for key in HOUSEHOLD_HISTORY_KEYS:
+            self.history[key] = HistoryMatrix(
+                capacity, household_capacity, dtype=HOUSEHOLD_HISTORY_DTYPES[key]
+            )
+        self.history["prices"] = {}
+        self.history["demands"] = {}
+
+    def load_history(
+        self,
+        history: dict,
+        capacity: int = 0,
+        household_capacity: int = 0,
+        consume: bool = False,
+        mmap_dir: str | Path | None = None,
+    ):
+        """
+        保存された履歴（listの辞書）から復元
+
+        Args:
+            history: to_dict()で保存された履歴
+            capacity: 系列ごとに事前確保するステップ数
+            household_capacity: 世帯スナップショットで事前確保する世帯数
+            consume: Trueの場合、変換した系列をhistoryから順に取り除く
+                （listの木と変換後の配列を同時に全て保持しないため、読み込み時の
+                ピークメモリを抑える）
+            mmap_dir: 指定した場合、スカラー系列を<key>.npyにメモリマップし直して
+                復元した値を書き込み、以降もファイルに直接書き込む
+                （既存のファイルが十分な長さならそのまま再利用する）
+        """
+        # 旧系列のマップを解放してから同じファイルを開き直す
+        self.history = {}
+        if mmap_dir is not None:
+            mmap_dir = Path(mmap_dir)
+            mmap_dir.mkdir(parents=True, exist_ok=True)
+        for key in list(history):
+            values = history.pop(key) if consume else history[key]
+            if key in SCALAR_HISTORY_KEYS:
+                if mmap_dir is None:
+                    self.history[key] = HistorySeries(capacity, values)
+                else:
+                    buffer = _open_history_memmap(
+                        mmap_dir / f"{key}.npy", max(capacity, len(values), 1)
+                    )
+                    self.history[key] = HistorySeries(values=values, buffer=buffer)
+            elif key in HOUSEHOLD_HISTORY_KEYS:
+                self.history[key] = HistoryMatrix(
+                    capacity,
+                    household_capacity,
+                    rows=values,
+                    dtype=HOUSEHOLD_HISTORY_DTYPES[key],
+                )
+            else:
+                self.history[key] = values
+
+    def history_to_dict(
+        self, exclude: tuple[str, ...] = (), arrays: bool = False
+    ) -> dict:
+        """
+        履歴をJSON保存可能な辞書に変換
+
+        Args:
+            exclude: 含めない履歴キー
+            arrays: Trueの場合、スカラー系列をlistに変換せず配列ビューのまま返す
+                （src.utils.serialization.dumps()で直接シリアライズする場合）
+        """
+        history = {}
+        for key, value in self.history.items():
+            if key in exclude:
+                continue
+            if isinstance(value, HistorySeries):
+                value = value.values if arrays else value.tolist()
+            elif isinstance(value, HistoryMatrix):
+                value = value.tolist()
+            history[key] = value
+        return history
 
     def get_household(self, household_id: int) -> HouseholdProfile | None:
         """IDから家計を取得"""
-        for h in self.households:
-            if h.id == household_id:
-                return h
-        return None
+        return self._household_index.get(self.households, household_id)
 
     def get_firm(self, firm_id: int) -> FirmProfile | None:
         """IDから企業を取得"""
-        for f in self.firms:
-            if f.id == firm_id:
-                return f
-        return None
-
-    def to_dict(self) -> dict:
-        """辞書形式に変換（保存用）"""
+        return self._firm_index.get(self.firms, firm_id)
+
+    def add_household(self, profile: HouseholdProfile):
+        """家計を追加し、ID索引に登録"""
+        self.households.append(profile)
+        if self._household_index.source is self.households:
+            self._household_index.extend(self.households)
+
+    def add_firm(self, profile: FirmProfile):
+        """企業を追加し、ID索引に登録"""
+        self.firms.append(profile)
+        if self._firm_index.source is self.firms:
+            self._firm_index.extend(self.firms)
+
+    def remove_household(self, household_id: int) -> HouseholdProfile | None:
+        """
+        IDで家計を取り除き、ID索引を破棄
+
+        Args:
+            household_id: 家計ID
+
+        Returns:
+            取り除いた家計（存在しない場合None）
+        """
+        return self._remove(self.households, self._household_index, household_id)
+
+    def remove_firm(self, firm_id: int) -> FirmProfile | None:
+        """
+        IDで企業を取り除き、ID索引を破棄
+
+        Args:
+            firm_id: 企業ID
+
+        Returns:
+            取り除いた企業（存在しない場合None）
+        """
+        return self._remove(self.firms, self._firm_index, firm_id)
+
+    def replace_household(self, index: int, profile: HouseholdProfile):
+        """指定位置の家計を置き換え、ID索引を破棄"""
+        self.households[index] = profile
+        self._household_index.invalidate()
+
+    def replace_firm(self, index: int, profile: FirmProfile):
+        """指定位置の企業を置き換え、ID索引を破棄"""
+        self.firms[index] = profile
+        self._firm_index.invalidate()
+
+    @staticmethod
+    def _remove(items: list, index: _IdIndex, item_id: int):
+        """IDに一致する先頭の要素をitemsから取り除く"""
+        item = index.get(items, item_id)
+        if item is not None:
+            del items[index.positions[item_id]]
+            index.invalidate()
+        return item
+
+    def to_dict(self, arrays: bool = False) -> dict:
+        """
+        辞書形式に変換（保存用）
+
+        Args:
+            arrays: Trueの場合、履歴のスカラー系列を配列ビューのまま含める
+        """
         return {
             "step": self.step,
             "phase": self.phase,
@@ -353,5 +1016,5 @@ class SimulationState:
             "government": self.government.to_dict() if self.government else None,
             "central_bank": self.central_bank.to_dict() if self.central_bank else None,
             "market": self.market.to_dict(),
-            "history": self.history,
+            "history": self.history_to_dict(arrays=arrays),
         }
@@ -8,6 +8,8 @@ Economic models for SimCity simulation
 - マクロ経済指標計算
 """
 
+from bisect import bisect_left
+
 import numpy as np
 
 
@@ -59,6 +61,28 @@ class ProductionFunction:
 
         return output
 
+    def calculate_output_batch(
+        self,
+        labor: np.ndarray,
+        capital: np.ndarray,
+        tfp: np.ndarray | float | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        複数企業の産出量を一括計算（calculate_output()のベクトル版）
+
+        Args:
+            labor: 企業ごとの労働投入（実効労働量）
+            capital: 企業ごとの資本ストック
+            tfp: 企業ごとの全要素生産性（Noneの場合はデフォルト値を使用）
+            out: 結果を書き込む配列（Noneの場合は新規確保）
+
+        Returns:
+            企業ごとの産出量（労働・資本が負の企業は0）
+        """
+        a = self.tfp if tfp is None else tfp
+        return cobb_douglas_output(labor, capital, a, self.alpha, out=out)
+
     def calculate_marginal_product_labor(
         self, labor: float, capital: float, tfp: float = None
     ) -> float:
@@ -110,6 +134,43 @@ class ProductionFunction:
         return mpk
 
 
+def cobb_douglas_output(
+    labor: np.ndarray,
+    capital: np.ndarray,
+    tfp: np.ndarray | float,
+    alpha: np.ndarray | float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Cobb-Douglas生産関数 Y = A * L^(1-α) * K^α を配列に対して一括計算
+
+    スカラー版（ProductionFunction.calculate_output）と同じ演算順序で
+    np.powerを使うため、企業ごとの結果はスカラー版と一致する。
+    αも配列で渡せるため、生産関数のパラメータが企業ごとに異なってもよい。
+
+    Args:
+        labor: 労働投入
+        capital: 資本ストック
+        tfp: 全要素生産性
+        alpha: 資本分配率
+        out: 結果を書き込む配列（Noneの場合は新規確保）
+
+    Returns:
+        産出量（労働・資本が負の要素は0）
+    """
+    labor = np.asarray(labor, dtype=np.float64)
+    capital = np.asarray(capital, dtype=np.float64)
+    valid = (labor >= 0) & (capital >= 0)
+    # 負の入力はpowerでNaNになるため0に置き換えてから計算
+    safe_labor = np.where(valid, labor, 0.0)
+    safe_capital = np.where(valid, capital, 0.0)
+
+    output = np.multiply(tfp, np.power(safe_labor, 1 - np.asarray(alpha)), out=out)
+    output *= np.power(safe_capital, alpha)
+    output[~valid] = 0.0
+    return output
+
+
 class TaxationSystem:
     """
     累進課税システム
@@ -126,6 +187,23 @@ class TaxationSystem:
         # 閾値でソート
         self.brackets = sorted(brackets, key=lambda x: x[0])
 
+        # 各区分の閾値・税率と、閾値までの累積税額を事前計算
+        # （区分の探索を二分探索にし、税額を累積税額 + 1回の積和で求める）
+        self._thresholds = [float(threshold) for threshold, _ in self.brackets]
+        self._rates = [float(rate) for _, rate in self.brackets]
+        self._base_taxes = []
+        tax = 0.0
+        for i, (threshold, rate) in enumerate(
+            zip(self._thresholds, self._rates, strict=True)
+        ):
+            self._base_taxes.append(tax)
+            if i + 1 < len(self._thresholds):
+                tax += (self._thresholds[i + 1] - threshold) * rate
+
+        self._threshold_array = np.array(self._thresholds, dtype=np.float64)
+        self._rate_array = np.array(self._rates, dtype=np.float64)
+        self._base_tax_array = np.array(self._base_taxes, dtype=np.float64)
+
     def calculate_income_tax(self, income: float) -> float:
         """
         所得税を計算
@@ -141,25 +219,42 @@ class TaxationSystem:
         if income <= 0:
             return 0.0
 
-        tax = 0.0
-
-        for i in range(len(self.brackets)):
-            threshold, rate = self.brackets[i]
+        # 所得が閾値を超える最後の区分
+        k = bisect_left(self._thresholds, income) - 1
+        if k < 0:
+            return 0.0
 
-            if income <= threshold:
-                break
+        return self._base_taxes[k] + (income - self._thresholds[k]) * self._rates[k]
 
-            # 次の区分の閾値
-            if i + 1 < len(self.brackets):
-                next_threshold = self.brackets[i + 1][0]
-            else:
-                next_threshold = float("inf")
+    def calculate_income_tax_batch(
+        self, incomes: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        複数世帯の所得税を一括計算（calculate_income_tax()のベクトル版）
 
-            # この区分での課税所得
-            taxable = min(income, next_threshold) - threshold
-            tax += taxable * rate
+        Args:
+            incomes: 世帯ごとの課税対象所得
+            out: 結果を書き込む配列（Noneの場合は新規確保）
 
-        return tax
+        Returns:
+            世帯ごとの所得税額（所得0以下・最低閾値以下は0）
+        """
+        incomes = np.asarray(incomes, dtype=np.float64)
+        if out is None:
+            out = np.zeros(incomes.shape, dtype=np.float64)
+        else:
+            out[...] = 0.0
+        if len(self._thresholds) == 0:
+            return out
+
+        k = np.searchsorted(self._threshold_array, incomes, side="left") - 1
+        taxed = (k >= 0) & (incomes > 0)
+        k = k[taxed]
+        out[taxed] = (
+            self._base_tax_array[k]
+            + (incomes[taxed] - self._threshold_array[k]) * self._rate_array[k]
+        )
+        return out
 
     def calculate_effective_rate(self, income: float) -> float:
         """
@@ -285,8 +380,8 @@ class MacroeconomicIndicators:
 
     @staticmethod
     def calculate_gdp(
-        household_incomes: list[float],
-        firm_outputs: list[float],
+        household_incomes: list[float] | np.ndarray,
+        firm_outputs: list[float] | np.ndarray,
         government_spending: float = 0.0,
     ) -> float:
         """
@@ -296,16 +391,16 @@ class MacroeconomicIndicators:
         簡略化版: 総所得 + 政府支出
 
         Args:
-            household_incomes: 家計所得のリスト
-            firm_outputs: 企業産出のリスト
+            household_incomes: 家計所得のリストまたは配列
+            firm_outputs: 企業産出のリストまたは配列
             government_spending: 政府支出
 
         Returns:
             名目GDP
         """
-        consumption = sum(household_incomes)
-        investment = sum(firm_outputs)
-        gdp = consumption + investment + government_spending
+        consumption = np.asarray(household_incomes, dtype=np.float64).sum()
+        investment = np.asarray(firm_outputs, dtype=np.float64).sum()
+        gdp = float(consumption + investment + government_spending)
 
         return max(0.0, gdp)
 
@@ -328,26 +423,30 @@ class MacroeconomicIndicators:
         if not previous_prices or not current_prices:
             return 0.0
 
-        # 共通の商品のみを対象
-        common_goods = set(current_prices.keys()) & set(previous_prices.keys())
+        # 共通の商品のみを対象（現在価格の順に配列へ整列）
+        common_goods = [good for good in current_prices if good in previous_prices]
+        count = len(common_goods)
 
-        if not common_goods:
+        if count == 0:
             return 0.0
 
-        # 平均価格変化率
-        inflation_rates = []
-        for good in common_goods:
-            prev_price = previous_prices[good]
-            curr_price = current_prices[good]
-
-            if prev_price > 0:
-                rate = (curr_price - prev_price) / prev_price
-                inflation_rates.append(rate)
+        curr = np.fromiter(
+            (current_prices[good] for good in common_goods),
+            dtype=np.float64,
+            count=count,
+        )
+        prev = np.fromiter(
+            (previous_prices[good] for good in common_goods),
+            dtype=np.float64,
+            count=count,
+        )
 
-        if inflation_rates:
-            return np.mean(inflation_rates)
-        else:
+        # 平均価格変化率（前期価格が正の商品のみ）
+        mask = prev > 0
+        if not mask.any():
             return 0.0
+        prev = prev[mask]
+        return float(((curr[mask] - prev) / prev).mean())
 
     @staticmethod
     def calculate_unemployment_rate(total_labor_force: int, employed: int) -> float:
@@ -370,41 +469,41 @@ class MacroeconomicIndicators:
         return unemployed / total_labor_force
 
     @staticmethod
-    def calculate_gini_coefficient(incomes: list[float]) -> float:
+    def calculate_gini_coefficient(incomes: list[float] | np.ndarray) -> float:
         """
         Gini係数を計算（所得不平等度）
 
         NumPy最適化版: ベクトル演算で高速化（Phase 10.5）
+        SoA配列（np.ndarray）をそのまま渡すとlistへの変換を挟まずに計算する
 
         Args:
-            incomes: 所得のリスト
+            incomes: 所得のリストまたは配列
 
         Returns:
             Gini係数（0-1、0が完全平等、1が完全不平等）
         """
-        if not incomes or len(incomes) == 0:
+        incomes_array = np.asarray(incomes, dtype=np.float64)
+        if incomes_array.size == 0:
             return 0.0
 
-        # NumPy配列に変換してゼロや負の所得を除外
-        incomes_array = np.maximum(0, np.array(incomes, dtype=np.float64))
+        # 負の所得は0として扱い、ソート（呼び出し側の配列は変更しない）
+        sorted_incomes = np.sort(np.maximum(incomes_array, 0.0))
 
-        sum_income = np.sum(incomes_array)
+        sum_income = sorted_incomes.sum()
         if sum_income == 0:
             return 0.0
 
-        # ソート
-        sorted_incomes = np.sort(incomes_array)
-        n = len(sorted_incomes)
+        n = sorted_incomes.size
 
         # Gini係数の計算（NumPy最適化版）
-        # G = (2 * Σ(i * y_i)) / (n * Σy_i) - (n+1)/n
-        # インデックス配列 [1, 2, 3, ..., n] を生成
+        # G = (2 * Σ(i * y_i) - (n+1) * Σy_i) / (n * Σy_i)
+        # インデックス配列 [1, 2, 3, ..., n] との内積で Σ(i * y_i) を計算
         indices = np.arange(1, n + 1, dtype=np.float64)
+        gini = (2.0 * np.dot(indices, sorted_incomes) - (n + 1) * sum_income) / (
+            n * sum_income
+        )
 
-        # ベクトル演算で計算（Python loopを回避）
-        gini = (2 * np.sum(indices * sorted_incomes)) / (n * sum_income) - (n + 1) / n
-
-        return max(0.0, min(1.0, gini))
+        return max(0.0, min(1.0, float(gini)))
 
     @staticmethod
     def calculate_job_vacancy_rate(total_jobs: int, filled_jobs: int) -> float:
@@ -433,6 +532,7 @@ def calculate_effective_labor(
 
     NumPy最適化版: ベクトル演算で高速化（Phase 10.5）
     各労働者のスキルと求められるスキルのマッチング度を考慮
+    （スキル行列を組み立ててcalculate_effective_labor_batch()で計算）
 
     Args:
         workers: 労働者のリスト [{skill_name: level, ...}, ...]
@@ -448,30 +548,50 @@ def calculate_effective_labor(
         # スキル要件がない場合は労働者数として計算
         return float(len(workers))
 
-    # スキル要件のリストを作成
+    # スキル要件の順に、労働者×スキルの行列を作成
     required_skills = list(skill_requirements.keys())
-    required_levels = np.array(
-        [skill_requirements[skill] for skill in required_skills], dtype=np.float64
+    required_levels = np.fromiter(
+        (skill_requirements[skill] for skill in required_skills),
+        dtype=np.float64,
+        count=len(required_skills),
     )
+    skill_levels = np.fromiter(
+        (
+            worker_skills.get(skill, 0.0)
+            for worker_skills in workers
+            for skill in required_skills
+        ),
+        dtype=np.float64,
+        count=len(workers) * len(required_skills),
+    ).reshape(len(workers), len(required_skills))
 
-    # 各労働者の効率を計算
-    efficiencies = []
-    for worker_skills in workers:
-        # 労働者のスキルレベルを抽出
-        actual_levels = np.array(
-            [worker_skills.get(skill, 0.0) for skill in required_skills],
-            dtype=np.float64,
-        )
+    return calculate_effective_labor_batch(skill_levels, required_levels)
 
-        # スキルマッチング効率を計算（ベクトル演算）
-        # 各スキルの比率を計算（上限1.0）
-        skill_ratios = np.minimum(
-            1.0, actual_levels / np.maximum(0.01, required_levels)
-        )
 
-        # 平均効率
-        efficiency = np.mean(skill_ratios) if len(skill_ratios) > 0 else 0.5
-        efficiencies.append(efficiency)
+def calculate_effective_labor_batch(
+    skill_levels: np.ndarray, required_levels: np.ndarray
+) -> float:
+    """
+    スキル行列から実効労働量を計算
+
+    各労働者の効率 = 要求スキルごとの比率（上限1.0）の平均
+    実効労働量 = 全労働者の効率の合計
+
+    Args:
+        skill_levels: (労働者数, スキル数)のスキルレベル行列
+        required_levels: スキルごとの要求レベル（skill_levelsの列と同じ順序）
+
+    Returns:
+        実効労働量（要求スキルがない場合は労働者数）
+    """
+    skill_levels = np.asarray(skill_levels, dtype=np.float64)
+    if skill_levels.shape[0] == 0:
+        return 0.0
+
+    required_levels = np.asarray(required_levels, dtype=np.float64)
+    if required_levels.size == 0:
+        return float(skill_levels.shape[0])
 
-    # NumPy配列に変換して合計を計算
-    return float(np.sum(efficiencies))
+    # 各スキルの比率（上限1.0）を労働者ごとに平均して合計
+    ratios = np.minimum(1.0, skill_levels / np.maximum(0.01, required_levels))
+    return float(ratios.mean(axis=1).sum())
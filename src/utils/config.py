@@ -19,6 +19,10 @@ class SimulationConfig(BaseModel):
     phase1_steps: int = Field(default=36, ge=1)
     phase2_steps: int = Field(default=144, ge=1)
     random_seed: int | None = 42
+    # 1回のLLM呼び出しにまとめる世帯・企業の数（1の場合はエージェントごとに呼び出し）
+    llm_batch_size: int = Field(default=1, ge=1)
+    # 並行に実行するエージェントごとのLLM呼び出し数（llm_batch_size=1の場合に使用）
+    llm_concurrency: int = Field(default=1, ge=1)
 
 
 class AgentsConfig(BaseModel):
@@ -33,8 +37,8 @@ class AgentsConfig(BaseModel):
         initial: int = Field(default=3, ge=1)
         max: int = Field(default=50, ge=1)
 
-    households: HouseholdsConfig = HouseholdsConfig()
-    firms: FirmsConfig = FirmsConfig()
+    households: HouseholdsConfig = Field(default_factory=HouseholdsConfig)
+    firms: FirmsConfig = Field(default_factory=FirmsConfig)
     government: int = 1
     central_bank: int = 1
 
@@ -56,7 +60,7 @@ class EconomyConfig(BaseModel):
             inflation_coefficient: float = 1.5
             output_coefficient: float = 0.5
 
-        taylor_rule: TaylorRuleConfig = TaylorRuleConfig()
+        taylor_rule: TaylorRuleConfig = Field(default_factory=TaylorRuleConfig)
 
     class TaxationConfig(BaseModel):
         vat_rate: float = Field(default=0.1, ge=0, le=1)
@@ -67,10 +71,10 @@ class EconomyConfig(BaseModel):
         ubi_amount: float = 500.0
         unemployment_benefit_rate: float = 0.5
 
-    production: ProductionConfig = ProductionConfig()
-    financial: FinancialConfig = FinancialConfig()
-    taxation: TaxationConfig = TaxationConfig()
-    welfare: WelfareConfig = WelfareConfig()
+    production: ProductionConfig = Field(default_factory=ProductionConfig)
+    financial: FinancialConfig = Field(default_factory=FinancialConfig)
+    taxation: TaxationConfig = Field(default_factory=TaxationConfig)
+    welfare: WelfareConfig = Field(default_factory=WelfareConfig)
 
 
 class MarketsConfig(BaseModel):
@@ -79,6 +83,8 @@ class MarketsConfig(BaseModel):
     class LaborMarketConfig(BaseModel):
         matching_probability: float = Field(default=0.7, ge=0, le=1)
         minimum_wage: float = Field(default=1000, ge=0)
+        # 求人枠・求職者数がこれを超えたらオークション割当（Noneは逐次マッチングのみ）
+        auction_threshold: int | None = Field(default=None, ge=0)
 
     class GoodsMarketConfig(BaseModel):
         num_categories: int = Field(default=10, ge=1)
@@ -88,9 +94,9 @@ class MarketsConfig(BaseModel):
         deposit_rate_spread: float = -0.01
         loan_rate_spread: float = 0.02
 
-    labor: LaborMarketConfig = LaborMarketConfig()
-    goods: GoodsMarketConfig = GoodsMarketConfig()
-    financial: FinancialMarketConfig = FinancialMarketConfig()
+    labor: LaborMarketConfig = Field(default_factory=LaborMarketConfig)
+    goods: GoodsMarketConfig = Field(default_factory=GoodsMarketConfig)
+    financial: FinancialMarketConfig = Field(default_factory=FinancialMarketConfig)
 
 
 class GeographyConfig(BaseModel):
@@ -117,6 +123,16 @@ class LoggingConfig(BaseModel):
     output_dir: str = "experiments/logs"
 
 
+class LLMCacheConfig(BaseModel):
+    """LLMレスポンスキャッシュ設定"""
+
+    enabled: bool = False
+    max_entries: int = Field(default=1024, ge=1)
+    ttl: float | None = 3600.0  # 有効期限（秒）
+    cache_dir: str | None = ".cache/llm"  # SQLite永続化先（Noneでメモリのみ）
+    max_temperature: float = 0.0  # この温度以下の呼び出しのみキャッシュ
+
+
 class VisualizationConfig(BaseModel):
     """可視化設定"""
 
@@ -129,14 +145,15 @@ class VisualizationConfig(BaseModel):
 class SimCityConfig(BaseModel):
     """SimCity全体設定"""
 
-    simulation: SimulationConfig = SimulationConfig()
-    agents: AgentsConfig = AgentsConfig()
-    economy: EconomyConfig = EconomyConfig()
-    markets: MarketsConfig = MarketsConfig()
-    geography: GeographyConfig = GeographyConfig()
-    data: DataConfig = DataConfig()
-    logging: LoggingConfig = LoggingConfig()
-    visualization: VisualizationConfig = VisualizationConfig()
+    simulation: SimulationConfig = Field(default_factory=SimulationConfig)
+    agents: AgentsConfig = Field(default_factory=AgentsConfig)
+    economy: EconomyConfig = Field(default_factory=EconomyConfig)
+    markets: MarketsConfig = Field(default_factory=MarketsConfig)
+    geography: GeographyConfig = Field(default_factory=GeographyConfig)
+    data: DataConfig = Field(default_factory=DataConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    visualization: VisualizationConfig = Field(default_factory=VisualizationConfig)
+    llm_cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
 
 
 class LLMConfig(BaseModel):
@@ -153,6 +170,8 @@ class LLMConfig(BaseModel):
         max_retries: int = 3
         retry_delay: float = 1.0
         timeout: int = 30
+        request_timeout: float | None = None  # Noneの場合はtimeoutの1.5倍
+        max_concurrent: int = 20
 
     class VLMConfig(BaseModel):
         model: str = "gpt-4o-mini"
@@ -166,8 +185,8 @@ class LLMConfig(BaseModel):
         system_prompt_template: str = ""
         user_prompt_template: str = ""
 
-    openai: OpenAIConfig = OpenAIConfig()
-    vlm: VLMConfig = VLMConfig()
+    openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
+    vlm: VLMConfig = Field(default_factory=VLMConfig)
     agents: dict[str, AgentLLMConfig] = {}
 
 
@@ -193,6 +212,47 @@ def load_yaml(file_path: str | Path) -> dict[str, Any]:
         return yaml.safe_load(f)
 
 
+# 検証済み設定のキャッシュ: (設定クラス名, 絶対パス) -> (更新時刻, 設定)
+_CONFIG_CACHE: dict[tuple[str, str], tuple[int, BaseModel]] = {}
+
+
+def _load_validated(config_path: str | Path, model_cls: type[BaseModel]) -> BaseModel:
+    """
+    YAMLを読み込んで検証した設定を取得（ファイルの更新時刻が同じ間はキャッシュ）
+
+    呼び出し側が設定を書き換えてもキャッシュに影響しないよう、
+    毎回ディープコピーを返す（YAML解析・検証より大幅に安い）。
+
+    Args:
+        config_path: YAMLファイルのパス
+        model_cls: 検証に使う設定クラス
+
+    Returns:
+        検証済み設定オブジェクト
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        ValidationError: 設定が不正な場合
+    """
+    path = Path(config_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    key = (model_cls.__name__, str(path.resolve()))
+    mtime = path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, model_cls(**load_yaml(path)))
+        _CONFIG_CACHE[key] = cached
+
+    return cached[1].model_copy(deep=True)
+
+
+def clear_config_cache():
+    """設定キャッシュをクリア"""
+    _CONFIG_CACHE.clear()
+
+
 def load_config(config_path: str | Path) -> SimCityConfig:
     """
     シミュレーション設定を読み込む
@@ -206,10 +266,8 @@ def load_config(config_path: str | Path) -> SimCityConfig:
     Raises:
         ValidationError: 設定が不正な場合
     """
-    config_dict = load_yaml(config_path)
-
     try:
-        return SimCityConfig(**config_dict)
+        return _load_validated(config_path, SimCityConfig)
     except ValidationError as e:
         print(f"Configuration validation error: {e}")
         raise
@@ -228,10 +286,8 @@ def load_llm_config(config_path: str | Path) -> LLMConfig:
     Raises:
         ValidationError: 設定が不正な場合
     """
-    config_dict = load_yaml(config_path)
-
     try:
-        return LLMConfig(**config_dict)
+        return _load_validated(config_path, LLMConfig)
     except ValidationError as e:
         print(f"LLM configuration validation error: {e}")
         raise
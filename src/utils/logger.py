@@ -16,16 +16,25 @@ def setup_logger(
     rotation: str = "10 MB",
     retention: str = "7 days",
     enable_console: bool = True,
+    enqueue: bool = True,
 ) -> None:
     """
     ロガーのセットアップ
 
+    enqueue=Trueの場合、整形と書き込みはloguruのバックグラウンドスレッドで行われ、
+    ログ呼び出しはキューへの追加だけで返る。終了時はloguruのatexit処理で
+    キューが書き出されるが、実行中にログファイルを読む場合などは
+    先にlogger.complete()で書き込み完了を待つこと。
+    ローテーションしたファイルのzip圧縮もこのワーカースレッド上で行われるため、
+    ログ呼び出し側のスレッドは止まらない。
+
     Args:
         log_level: ログレベル (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: ログファイルのパス (Noneの場合はファイル出力なし)
         rotation: ログローテーション条件
         retention: ログ保持期間
         enable_console: コンソール出力を有効化
+        enqueue: 書き込みをバックグラウンドスレッドで行う
     """
     # デフォルトハンドラを削除
     logger.remove()
@@ -47,6 +56,7 @@ def setup_logger(
                 "<level>{message}</level>"
             ),
             colorize=True,
+            enqueue=enqueue,
         )
 
     # ファイル出力の設定
@@ -67,6 +77,7 @@ def setup_logger(
             retention=retention,
             compression="zip",
             encoding="utf-8",
+            enqueue=enqueue,
         )
 
         logger.info(f"Logger initialized with file output: {log_path}")
@@ -97,12 +108,11 @@ class LoggerContext:
 
     def __init__(self, temp_level: str):
         self.temp_level = temp_level
-        self.original_level = None
+        self._handler_id: int | None = None
 
     def __enter__(self):
-        # 現在のログレベルを保存
-        # loguruは動的にレベルを変更できないため、新しいハンドラを追加
-        logger.add(
+        # loguruは既存ハンドラのレベルを変更できないため、一時的なハンドラを追加
+        self._handler_id = logger.add(
             sys.stderr,
             level=self.temp_level,
             format="<level>{level}: {message}</level>",
@@ -110,5 +120,7 @@ class LoggerContext:
         return logger
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # 元のハンドラに戻す（簡略化のため、ここでは省略）
-        pass
+        # 追加したハンドラだけを外し、元のハンドラ構成に戻す
+        if self._handler_id is not None:
+            logger.remove(self._handler_id)
+            self._handler_id = None
@@ -0,0 +1,197 @@
+"""
+Serialization utilities for SimCity
+
+JSONの高速シリアライズを提供（orjsonがあれば使用、なければ標準jsonにフォールバック）
+JSONLの列単位の読み込み、スカラー指標の列指向（Parquet）チャンク出力（pyarrowが必要）
+"""
+
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjsonはオプション依存
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrowはオプション依存（Parquet出力時のみ必要）
+    pa = None
+    pq = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    標準でシリアライズできない型の変換
+
+    NumPy配列・スカラー、tolist()を持つオブジェクト（HistorySeries等）に対応
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    オブジェクトをJSONバイト列に変換
+
+    Args:
+        obj: シリアライズ対象
+        indent: Trueの場合、2スペースでインデント
+
+    Returns:
+        UTF-8エンコードされたJSONバイト列
+    """
+    if orjson is not None:
+        # 標準jsonと同様に非文字列キー（int等）を許容
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+
+    return json.dumps(
+        obj,
+        default=_default,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    JSONバイト列（または文字列）をオブジェクトに変換
+
+    Args:
+        data: JSONデータ
+
+    Returns:
+        デシリアライズされたオブジェクト
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_jsonl_columns(path: str | Path) -> dict[str, list[Any]]:
+    """
+    1行1レコードのJSONL（Simulation.run(results_path=...)の出力）を列ごとに読み込む
+
+    Args:
+        path: JSONLファイルのパス
+
+    Returns:
+        キー→値のリスト（レコードにないキーはNone）
+    """
+    columns: dict[str, list[Any]] = {}
+    num_rows = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for key, value in loads(line).items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * num_rows
+                column.append(value)
+            num_rows += 1
+            # このレコードに含まれなかったキーを揃える
+            for column in columns.values():
+                if len(column) < num_rows:
+                    column.append(None)
+    return columns
+
+
+class ParquetChunkWriter:
+    """
+    スカラー指標を列指向のParquetチャンクとして書き出すライター
+
+    flush_every行分の値をキーごとのNumPy配列に溜め、満杯になるたびに
+    hist_<chunk>.parquetとして書き出す（保持するのは直近のチャンクのみ）。
+    出力先に既存のチャンクがある場合は、最大の番号の次から書き出す
+    （再開した実行でも既存のチャンクを上書きしない）。
+    長時間実行の結果をpandas等で列単位に高速に読み込めるようにする。
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        keys: Sequence[str],
+        flush_every: int = 100,
+    ):
+        """
+        Args:
+            output_dir: チャンクの出力先ディレクトリ
+            keys: 記録する指標のキー（列）
+            flush_every: 1チャンクあたりの行数
+
+        Raises:
+            ImportError: pyarrowがインストールされていない場合
+        """
+        if pq is None:
+            raise ImportError("ParquetChunkWriter requires pyarrow")
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.chunks_written = 0
+        self._next_chunk = self._find_next_chunk()
+
+        self._steps = np.empty(flush_every, dtype=np.int64)
+        self._buffers = {key: np.empty(flush_every) for key in keys}
+        self._size = 0
+
+    def _find_next_chunk(self) -> int:
+        """出力先の既存チャンクの最大番号+1を返す（チャンクがなければ0）"""
+        last = -1
+        for path in self.output_dir.glob("hist_*.parquet"):
+            suffix = path.stem[len("hist_") :]
+            if suffix.isdigit():
+                last = max(last, int(suffix))
+        return last + 1
+
+    def append(self, step: int, values: dict[str, float]):
+        """
+        1ステップ分の指標を追加（バッファが満杯になったら書き出す）
+
+        Args:
+            step: ステップ番号
+            values: 指標の辞書（keysにないキーは無視、欠損はNaN）
+        """
+        row = self._size
+        self._steps[row] = step
+        for key, buffer in self._buffers.items():
+            buffer[row] = values.get(key, np.nan)
+        self._size += 1
+        if self._size == self.flush_every:
+            self.flush()
+
+    def flush(self) -> Path | None:
+        """
+        溜まっている行をチャンクファイルに書き出す
+
+        Returns:
+            書き出したファイルのパス（空の場合はNone）
+        """
+        if self._size == 0:
+            return None
+
+        size = self._size
+        columns = {"step": self._steps[:size]}
+        columns.update({key: buffer[:size] for key, buffer in self._buffers.items()})
+        path = self.output_dir / f"hist_{self._next_chunk:05d}.parquet"
+        pq.write_table(pa.Table.from_pydict(columns), path)
+
+        self.chunks_written += 1
+        self._next_chunk += 1
+        self._size = 0
+        return path
@@ -14,9 +14,12 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import io  # noqa: E402
 import json  # noqa: E402
 import time  # noqa: E402
+import zlib  # noqa: E402
 
+import matplotlib.pyplot as plt  # noqa: E402
 import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 import streamlit as st  # noqa: E402
@@ -28,6 +31,11 @@ from src.utils.config import load_config  # noqa: E402
 from src.visualization.map_generator import MapGenerator  # noqa: E402
 from src.visualization.plots import EconomicPlots  # noqa: E402
 
+# 時系列グラフの最大描画点数・図を縮小するステップ数と、データテーブルの既定表示行数
+MAX_PLOT_POINTS = 500
+COMPACT_FIGURE_STEPS = 200
+TABLE_TAIL_ROWS = 200
+
 
 class SimCityDashboard:
     """
@@ -65,17 +73,20 @@ class SimCityDashboard:
             ["Overview", "City Map", "Economic Indicators", "Analysis"]
         )
 
+        # 概要タブはライブシミュレーションのステップ実行（アプリ全体の再実行）を担う。
+        # 他のタブはフラグメントとし、タブ内のウィジェット操作では
+        # そのタブだけを再実行する（設定はst.session_stateから読む）
         with tab1:
             self._render_overview()
 
         with tab2:
-            self._render_city_map()
+            st.fragment(self._render_city_map)()
 
         with tab3:
-            self._render_economic_indicators()
+            st.fragment(self._render_economic_indicators)()
 
         with tab4:
-            self._render_analysis()
+            st.fragment(self._render_analysis)()
 
     def _render_sidebar(self):
         """サイドバーを描画"""
@@ -489,39 +500,14 @@ class SimCityDashboard:
 
         st.divider()
 
-        # マップ表示
-        if map_type == "Building Types":
-            fig = self.map_generator.generate_building_type_map(
-                city_map, figsize=(10, 8)
-            )
-            st.pyplot(fig)
-
-        elif map_type == "Occupancy Heatmap":
-            fig = self.map_generator.generate_occupancy_heatmap(
-                city_map, figsize=(10, 8)
-            )
-            st.pyplot(fig)
-
-        elif map_type == "Density Map":
+        # マップ表示（描画済みPNGをキャッシュから取得）
+        building_type = "All"
+        if map_type == "Density Map":
             building_type = st.selectbox(
                 "Filter by building type:",
                 ["All", "Residential", "Commercial", "Public"],
             )
-
-            if building_type == "All":
-                fig = self.map_generator.generate_density_map(
-                    city_map, radius=5, figsize=(10, 8)
-                )
-            else:
-                bt = BuildingType[building_type.upper()]
-                fig = self.map_generator.generate_density_map(
-                    city_map, building_type=bt, radius=5, figsize=(10, 8)
-                )
-            st.pyplot(fig)
-
-        elif map_type == "Combined View":
-            fig = self.map_generator.generate_combined_view(city_map, figsize=(15, 5))
-            st.pyplot(fig)
+        st.image(_demo_city_map_image(grid_size, map_type, building_type))
 
     def _render_economic_indicators(self):
         """経済指標タブを描画"""
@@ -548,10 +534,16 @@ class SimCityDashboard:
             # 選択された指標のみ表示
             selected_data = {k: v for k, v in time_series.items() if k in indicators}
 
+            # 長いシミュレーションでは点数を間引き、図も小さくして描画を軽くする
+            steps = len(next(iter(selected_data.values())))
             fig = self.plots.plot_time_series(
-                selected_data, title="Economic Indicators Over Time", figsize=(12, 6)
+                selected_data,
+                title="Economic Indicators Over Time",
+                figsize=(8, 4) if steps > COMPACT_FIGURE_STEPS else (12, 6),
+                max_points=MAX_PLOT_POINTS,
             )
             st.pyplot(fig)
+            plt.close(fig)
 
         st.divider()
 
@@ -559,7 +551,11 @@ class SimCityDashboard:
         st.subheader("Data Table")
         df = pd.DataFrame(time_series)
         df.insert(0, "Step", range(len(df)))
-        st.dataframe(df, use_container_width=True)
+        if len(df) > TABLE_TAIL_ROWS and not st.checkbox("Show full history"):
+            st.caption(f"Showing the latest {TABLE_TAIL_ROWS} of {len(df)} steps")
+            st.dataframe(df.tail(TABLE_TAIL_ROWS), use_container_width=True)
+        else:
+            st.dataframe(df, use_container_width=True)
 
         # ダウンロードボタン
         csv = df.to_csv(index=False)
@@ -666,18 +662,13 @@ class SimCityDashboard:
             """
         )
 
-        # デモデータ生成
-        unemployment = np.linspace(0.03, 0.10, 30)
-        inflation = 0.05 - 0.3 * unemployment + np.random.randn(30) * 0.005
-
-        fig, stats = self.plots.plot_phillips_curve(
-            unemployment.tolist(), inflation.tolist(), figsize=(8, 6)
-        )
+        # デモデータの図と統計量（キャッシュ）
+        image, stats = _demo_analysis_figure("phillips")
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -701,18 +692,13 @@ class SimCityDashboard:
             """
         )
 
-        # デモデータ生成
-        unemployment_change = np.linspace(-0.02, 0.03, 30)
-        gdp_growth = 0.03 - 2.0 * unemployment_change + np.random.randn(30) * 0.01
-
-        fig, stats = self.plots.plot_okun_law(
-            unemployment_change.tolist(), gdp_growth.tolist(), figsize=(8, 6)
-        )
+        # デモデータの図と統計量（キャッシュ）
+        image, stats = _demo_analysis_figure("okun")
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -733,18 +719,13 @@ class SimCityDashboard:
             """
         )
 
-        # デモデータ生成
-        unemployment = np.linspace(0.03, 0.10, 30)
-        vacancy = 0.08 - 0.5 * unemployment + np.random.randn(30) * 0.005
-
-        fig, stats = self.plots.plot_beveridge_curve(
-            unemployment.tolist(), vacancy.tolist(), figsize=(8, 6)
-        )
+        # デモデータの図と統計量（キャッシュ）
+        image, stats = _demo_analysis_figure("beveridge")
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -767,18 +748,13 @@ class SimCityDashboard:
             """
         )
 
-        # デモデータ生成
-        income = np.linspace(20000, 100000, 50)
-        food_share = 0.5 - 0.08 * np.log(income / 20000) + np.random.randn(50) * 0.02
-
-        fig, stats = self.plots.plot_engel_curve(
-            income.tolist(), food_share.tolist(), figsize=(8, 6)
-        )
+        # デモデータの図と統計量（キャッシュ）
+        image, stats = _demo_analysis_figure("engel")
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -804,24 +780,14 @@ class SimCityDashboard:
             "Select good type:", ["Necessity (Food)", "Luxury (Jewelry)"]
         )
 
-        # デモデータ生成
-        prices = np.linspace(1.0, 3.0, 30)
-
-        if "Necessity" in good_type:
-            quantities = 100 * prices**-0.5 + np.random.randn(30) * 2
-            good_name = "Food (Necessity)"
-        else:
-            quantities = 100 * prices**-2.0 + np.random.randn(30) * 2
-            good_name = "Jewelry (Luxury)"
-
-        fig, stats = self.plots.plot_price_elasticity(
-            prices.tolist(), quantities.tolist(), good_name=good_name, figsize=(8, 6)
-        )
+        # デモデータの図と統計量（キャッシュ）
+        variant = "necessity" if "Necessity" in good_type else "luxury"
+        image, stats = _demo_analysis_figure("price_elasticity", variant)
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -839,17 +805,13 @@ class SimCityDashboard:
             """
         )
 
-        # デモデータ生成
-        income = np.random.lognormal(10.5, 0.5, 1000).tolist()
-
-        fig, stats = self.plots.plot_distribution(
-            income, title="Household Income Distribution", xlabel="Income ($)", bins=50
-        )
+        # デモデータの図と統計量（キャッシュ）
+        image, stats = _demo_analysis_figure("income_distribution")
 
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.pyplot(fig)
+            st.image(image)
 
         with col2:
             st.markdown("**Statistics**")
@@ -860,55 +822,210 @@ class SimCityDashboard:
             st.metric("Max", f"${stats['max']:,.0f}")
 
     def _create_demo_city_map(self, grid_size: int) -> CityMap:
-        """デモ用のCityMapを作成"""
-        city_map = CityMap(grid_size=grid_size)
+        """デモ用のCityMapを作成（グリッドサイズごとにキャッシュ）"""
+        return _create_demo_city_map(grid_size)
 
-        # ランダムに建物を配置
-        num_residential = int(grid_size * 0.3)
-        num_commercial = int(grid_size * 0.2)
-        num_public = int(grid_size * 0.05)
+    def _generate_demo_time_series(self, steps: int) -> dict:
+        """デモ用の時系列データを生成（ステップ数ごとにキャッシュ）"""
+        return _generate_demo_time_series(steps)
 
-        # 住宅
-        for _ in range(num_residential):
-            b = city_map.add_building(BuildingType.RESIDENTIAL, capacity=10)
-            if b:
-                # ランダムに居住者を追加
-                num_occupants = np.random.randint(0, b.capacity + 1)
-                for _j in range(num_occupants):
-                    b.add_occupant(np.random.randint(1000, 9999))
-
-        # 商業施設
-        for _ in range(num_commercial):
-            b = city_map.add_building(BuildingType.COMMERCIAL, capacity=20)
+
+@st.cache_resource(show_spinner=False)
+def _create_demo_city_map(grid_size: int) -> CityMap:
+    """
+    デモ用のCityMapを作成
+
+    Streamlitの再実行（ウィジェット操作）ごとに建物配置を作り直さないよう、
+    グリッドサイズごとに1つのCityMapを共有する（呼び出し側は読み取りのみ）。
+
+    Args:
+        grid_size: グリッドサイズ
+
+    Returns:
+        デモ用のCityMap
+    """
+    city_map = CityMap(grid_size=grid_size)
+
+    # ランダムに建物を配置
+    num_residential = int(grid_size * 0.3)
+    num_commercial = int(grid_size * 0.2)
+    num_public = int(grid_size * 0.05)
+
+    # 住宅・商業施設（ランダムに居住者/従業員を追加）
+    # 人数とIDは建物タイプごとにまとめて生成
+    for building_type, count, capacity in (
+        (BuildingType.RESIDENTIAL, num_residential, 10),
+        (BuildingType.COMMERCIAL, num_commercial, 20),
+    ):
+        occupant_counts = np.random.randint(0, capacity + 1, size=count).tolist()
+        occupant_ids = np.random.randint(1000, 9999, size=sum(occupant_counts)).tolist()
+        start = 0
+        for num_occupants in occupant_counts:
+            b = city_map.add_building(building_type, capacity=capacity)
             if b:
-                num_occupants = np.random.randint(0, b.capacity + 1)
-                for _j in range(num_occupants):
-                    b.add_occupant(np.random.randint(1000, 9999))
+                b.add_occupants(occupant_ids[start : start + num_occupants])
+            start += num_occupants
 
-        # 公共施設
-        for _ in range(num_public):
-            city_map.add_building(BuildingType.PUBLIC, capacity=50)
+    # 公共施設
+    for _ in range(num_public):
+        city_map.add_building(BuildingType.PUBLIC, capacity=50)
 
-        return city_map
+    return city_map
 
-    def _generate_demo_time_series(self, steps: int) -> dict:
-        """デモ用の時系列データを生成"""
-        gdp = 100 + np.cumsum(np.random.randn(steps) * 2)
-        unemployment = 0.05 + np.random.randn(steps) * 0.01
-        unemployment = np.clip(unemployment, 0.01, 0.15)
-        inflation = 0.02 + np.random.randn(steps) * 0.005
-        inflation = np.clip(inflation, -0.02, 0.10)
-        interest = 0.025 + np.random.randn(steps) * 0.002
-        interest = np.clip(interest, 0.0, 0.10)
-        wages = 50 + np.cumsum(np.random.randn(steps) * 0.5)
-
-        return {
-            "GDP": gdp.tolist(),
-            "Unemployment Rate": unemployment.tolist(),
-            "Inflation Rate": inflation.tolist(),
-            "Interest Rate": interest.tolist(),
-            "Wages": wages.tolist(),
-        }
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _generate_demo_time_series(steps: int) -> dict:
+    """
+    デモ用の時系列データを生成
+
+    Streamlitの再実行ごとに乱数を引き直さないよう、ステップ数ごとにキャッシュする
+    （cache_dataは呼び出しごとにコピーを返す）。
+
+    Args:
+        steps: ステップ数
+
+    Returns:
+        指標名 → 値のリストの辞書
+    """
+    gdp = 100 + np.cumsum(np.random.randn(steps) * 2)
+    unemployment = 0.05 + np.random.randn(steps) * 0.01
+    unemployment = np.clip(unemployment, 0.01, 0.15)
+    inflation = 0.02 + np.random.randn(steps) * 0.005
+    inflation = np.clip(inflation, -0.02, 0.10)
+    interest = 0.025 + np.random.randn(steps) * 0.002
+    interest = np.clip(interest, 0.0, 0.10)
+    wages = 50 + np.cumsum(np.random.randn(steps) * 0.5)
+
+    return {
+        "GDP": gdp.tolist(),
+        "Unemployment Rate": unemployment.tolist(),
+        "Inflation Rate": inflation.tolist(),
+        "Interest Rate": interest.tolist(),
+        "Wages": wages.tolist(),
+    }
+
+
+def _demo_rng(key: str) -> np.random.Generator:
+    """
+    デモデータ用の乱数生成器（キーごとに固定シード）
+
+    Pythonのhash()はプロセスごとに変わるため、CRC32でシードを決める。
+    """
+    return np.random.default_rng(zlib.crc32(key.encode("utf-8")))
+
+
+@st.cache_data(show_spinner=False)
+def _demo_analysis_figure(analysis: str, variant: str = "") -> tuple[bytes, dict]:
+    """
+    分析タブのデモデータを生成し、図をPNGに描画
+
+    データは分析ごとの固定シードで生成するため、再実行しても同じ図になり、
+    2回目以降は回帰計算とMatplotlibの描画を省略してキャッシュを返す。
+
+    Args:
+        analysis: 分析名（"phillips", "okun", "beveridge", "engel",
+            "price_elasticity", "income_distribution"）
+        variant: 分析内の選択肢（価格弾力性の"necessity"/"luxury"）
+
+    Returns:
+        (PNG画像のバイト列, 統計量の辞書) のタプル
+    """
+    rng = _demo_rng(f"{analysis}:{variant}")
+    plots = EconomicPlots()
+
+    if analysis == "phillips":
+        unemployment = np.linspace(0.03, 0.10, 30)
+        inflation = 0.05 - 0.3 * unemployment + rng.standard_normal(30) * 0.005
+        fig, stats = plots.plot_phillips_curve(
+            unemployment.tolist(), inflation.tolist(), figsize=(8, 6)
+        )
+    elif analysis == "okun":
+        unemployment_change = np.linspace(-0.02, 0.03, 30)
+        gdp_growth = 0.03 - 2.0 * unemployment_change + rng.standard_normal(30) * 0.01
+        fig, stats = plots.plot_okun_law(
+            unemployment_change.tolist(), gdp_growth.tolist(), figsize=(8, 6)
+        )
+    elif analysis == "beveridge":
+        unemployment = np.linspace(0.03, 0.10, 30)
+        vacancy = 0.08 - 0.5 * unemployment + rng.standard_normal(30) * 0.005
+        fig, stats = plots.plot_beveridge_curve(
+            unemployment.tolist(), vacancy.tolist(), figsize=(8, 6)
+        )
+    elif analysis == "engel":
+        income = np.linspace(20000, 100000, 50)
+        food_share = (
+            0.5 - 0.08 * np.log(income / 20000) + rng.standard_normal(50) * 0.02
+        )
+        fig, stats = plots.plot_engel_curve(
+            income.tolist(), food_share.tolist(), figsize=(8, 6)
+        )
+    elif analysis == "price_elasticity":
+        prices = np.linspace(1.0, 3.0, 30)
+        if variant == "necessity":
+            quantities = 100 * prices**-0.5 + rng.standard_normal(30) * 2
+            good_name = "Food (Necessity)"
+        else:
+            quantities = 100 * prices**-2.0 + rng.standard_normal(30) * 2
+            good_name = "Jewelry (Luxury)"
+        fig, stats = plots.plot_price_elasticity(
+            prices.tolist(), quantities.tolist(), good_name=good_name, figsize=(8, 6)
+        )
+    elif analysis == "income_distribution":
+        income = rng.lognormal(10.5, 0.5, 1000).tolist()
+        fig, stats = plots.plot_distribution(
+            income, title="Household Income Distribution", xlabel="Income ($)", bins=50
+        )
+    else:
+        raise ValueError(f"Unknown analysis: {analysis}")
+
+    return _figure_png(fig), stats
+
+
+@st.cache_data(show_spinner=False)
+def _demo_city_map_image(
+    grid_size: int, map_type: str, building_type: str = "All"
+) -> bytes:
+    """
+    デモ用CityMapの図をPNGに描画
+
+    CityMapはグリッドサイズごとに共有されているため、同じ組み合わせの
+    再実行ではMatplotlibの描画を省略してキャッシュを返す。
+
+    Args:
+        grid_size: グリッドサイズ
+        map_type: マップの種類（"Building Types", "Occupancy Heatmap",
+            "Density Map", "Combined View"）
+        building_type: 密度マップで対象とする建物タイプ（"All"は全建物）
+
+    Returns:
+        PNG画像のバイト列
+    """
+    city_map = _create_demo_city_map(grid_size)
+    map_generator = MapGenerator()
+
+    if map_type == "Building Types":
+        fig = map_generator.generate_building_type_map(city_map, figsize=(10, 8))
+    elif map_type == "Occupancy Heatmap":
+        fig = map_generator.generate_occupancy_heatmap(city_map, figsize=(10, 8))
+    elif map_type == "Density Map":
+        bt = None if building_type == "All" else BuildingType[building_type.upper()]
+        fig = map_generator.generate_density_map(
+            city_map, building_type=bt, radius=5, figsize=(10, 8)
+        )
+    elif map_type == "Combined View":
+        fig = map_generator.generate_combined_view(city_map, figsize=(15, 5))
+    else:
+        raise ValueError(f"Unknown map type: {map_type}")
+
+    return _figure_png(fig)
+
+
+def _figure_png(fig) -> bytes:
+    """図をPNGのバイト列に変換して閉じる"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
 
 
 def main():
@@ -37,6 +37,7 @@ class EconomicPlots:
         title: str = "Economic Indicators Over Time",
         figsize: tuple[int, int] = (12, 8),
         save_path: str | None = None,
+        max_points: int | None = None,
     ) -> plt.Figure:
         """
         複数指標の時系列プロット
@@ -46,6 +47,7 @@ class EconomicPlots:
             title: グラフタイトル
             figsize: 図のサイズ
             save_path: 保存先パス
+            max_points: 指標ごとの最大描画点数（超える場合は等間隔に間引く）
 
         Returns:
             matplotlib Figure
@@ -58,6 +60,11 @@ class EconomicPlots:
 
         for ax, (indicator, values) in zip(axes, data.items(), strict=False):
             steps = range(len(values))
+            if max_points is not None and len(values) > max_points:
+                # 横軸のステップ番号は元のまま残して間引く
+                stride = -(-len(values) // max_points)
+                steps = steps[::stride]
+                values = np.asarray(values)[::stride]
             ax.plot(steps, values, linewidth=2)
             ax.set_ylabel(indicator)
             ax.grid(True, alpha=0.3)
@@ -1,6 +1,19 @@
 """Pytest configuration for tests"""
 
+from types import SimpleNamespace
+
 import matplotlib
 
 # Use non-interactive backend for testing
 matplotlib.use("Agg")
+
+
+def fake_response(name: str, arguments: str):
+    """Build a minimal OpenAI chat completion carrying one function call"""
+    message = SimpleNamespace(
+        function_call=SimpleNamespace(name=name, arguments=arguments), content=None
+    )
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=message)],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
@@ -0,0 +1,68 @@
+"""
+Tests for AgentArrays
+
+エージェント属性SoAミラーの単体テスト
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.environment.agent_arrays import AgentArrays
+from src.models.data_models import EmploymentStatus
+
+
+def _household(income, consumption, food, total, status):
+    profile = SimpleNamespace(monthly_income=income, employment_status=status)
+    return SimpleNamespace(
+        profile=profile,
+        consumption=consumption,
+        food_spending=food,
+        total_spending=total,
+    )
+
+
+class TestAgentArrays:
+    """SoAミラーのテスト"""
+
+    def test_sync_households(self):
+        """家計属性が配列に反映される"""
+        arrays = AgentArrays(household_capacity=1)
+        households = [
+            _household(3000.0, 100.0, 30.0, 100.0, EmploymentStatus.EMPLOYED),
+            _household(0.0, 50.0, 25.0, 50.0, EmploymentStatus.UNEMPLOYED),
+            _household(2000.0, 80.0, 0.0, 0.0, EmploymentStatus.EMPLOYED),
+        ]
+
+        assert arrays.sync_households(households) == 3
+        assert arrays.household("monthly_income").tolist() == [3000.0, 0.0, 2000.0]
+        assert arrays.household("consumption").sum() == pytest.approx(230.0)
+        assert arrays.household("employed").sum() == 2
+
+    def test_sync_firms(self):
+        """企業属性が配列に反映される"""
+        arrays = AgentArrays(firm_capacity=4)
+        firms = [
+            SimpleNamespace(
+                profile=SimpleNamespace(capital=1000.0, job_openings=2),
+                investment=50.0,
+            ),
+            SimpleNamespace(
+                profile=SimpleNamespace(capital=500.0, job_openings=0),
+                investment=-10.0,
+            ),
+        ]
+
+        assert arrays.sync_firms(firms) == 2
+        assert arrays.firm("capital").tolist() == [1000.0, 500.0]
+        assert arrays.firm("investment").sum() == pytest.approx(40.0)
+        assert arrays.firm("job_openings").sum() == 2
+
+    def test_shrinking_population(self):
+        """世帯数が減った場合はビューも縮む"""
+        arrays = AgentArrays()
+        status = EmploymentStatus.EMPLOYED
+        arrays.sync_households([_household(1.0, 1.0, 0.0, 0.0, status)] * 3)
+        arrays.sync_households([_household(2.0, 1.0, 0.0, 0.0, status)])
+
+        assert arrays.household("monthly_income").tolist() == [2.0]
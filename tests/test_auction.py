@@ -0,0 +1,53 @@
+"""
+Tests for auction assignment
+
+オークション割当の単体テスト
+"""
+
+from itertools import permutations
+
+import numpy as np
+
+from src.environment.markets.auction import auction_assign
+
+
+def _total(benefit: np.ndarray, assignment: np.ndarray) -> float:
+    rows = np.flatnonzero(assignment >= 0)
+    return float(benefit[rows, assignment[rows]].sum())
+
+
+class TestAuctionAssign:
+    """オークション割当のテスト"""
+
+    def test_matches_brute_force_optimum(self):
+        """総利得が全探索の最適値からε×行数以内"""
+        rng = np.random.default_rng(0)
+        benefit = rng.random((4, 4))
+        eps = 1e-4
+
+        assignment = auction_assign(benefit, eps=eps)
+
+        optimum = max(
+            sum(benefit[i, j] for i, j in enumerate(perm))
+            for perm in permutations(range(4))
+        )
+        assert sorted(assignment.tolist()) == [0, 1, 2, 3]
+        assert _total(benefit, assignment) >= optimum - 4 * eps
+
+    def test_infeasible_pairs_left_unassigned(self):
+        """-infの組は割当せず、対象が足りない入札者は-1"""
+        benefit = np.array(
+            [
+                [1.0, -np.inf],
+                [0.9, -np.inf],
+                [-np.inf, -np.inf],
+            ]
+        )
+
+        assignment = auction_assign(benefit)
+
+        assert assignment.tolist() == [0, -1, -1]
+
+    def test_empty(self):
+        """空の行列"""
+        assert auction_assign(np.zeros((3, 0))).tolist() == [-1, -1, -1]
@@ -0,0 +1,37 @@
+"""Tests for config loading"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import config as config_module
+from src.utils.config import clear_config_cache, load_config
+
+
+class TestConfigCache:
+    def test_load_config_returns_independent_copies(self, tmp_path):
+        """Cached configs are copied per call and reloaded when the file changes"""
+        config_path = tmp_path / "simulation_config.yaml"
+        config_path.write_text("simulation:\n  max_steps: 12\n", encoding="utf-8")
+
+        first = load_config(config_path)
+        first.simulation.max_steps = 99
+        second = load_config(config_path)
+        assert second.simulation.max_steps == 12
+
+        config_path.write_text("simulation:\n  max_steps: 24\n", encoding="utf-8")
+        os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+        assert load_config(config_path).simulation.max_steps == 24
+
+    def test_clear_config_cache(self, tmp_path):
+        """clear_config_cache() drops every cached config"""
+        config_path = tmp_path / "simulation_config.yaml"
+        config_path.write_text("simulation:\n  max_steps: 12\n", encoding="utf-8")
+
+        load_config(config_path)
+        assert config_module._CONFIG_CACHE
+
+        clear_config_cache()
+        assert not config_module._CONFIG_CACHE
@@ -7,7 +7,11 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.visualization.dashboard import SimCityDashboard
+from src.visualization.dashboard import (
+    SimCityDashboard,
+    _demo_analysis_figure,
+    _demo_city_map_image,
+)
 
 
 class TestDashboard:
@@ -52,6 +56,51 @@ class TestDashboard:
         assert all(-0.02 <= v <= 0.10 for v in time_series["Inflation Rate"])
         assert all(0.0 <= v <= 0.10 for v in time_series["Interest Rate"])
 
+    def test_demo_data_is_cached(self, dashboard):
+        """Demo data is reused across reruns with the same parameters"""
+        assert dashboard._create_demo_city_map(grid_size=25) is (
+            dashboard._create_demo_city_map(grid_size=25)
+        )
+        assert dashboard._generate_demo_time_series(steps=30) == (
+            dashboard._generate_demo_time_series(steps=30)
+        )
+
+    @pytest.mark.parametrize(
+        "analysis,variant",
+        [
+            ("phillips", ""),
+            ("okun", ""),
+            ("beveridge", ""),
+            ("engel", ""),
+            ("price_elasticity", "necessity"),
+            ("price_elasticity", "luxury"),
+            ("income_distribution", ""),
+        ],
+    )
+    def test_demo_analysis_figure(self, analysis, variant):
+        """Analysis demos render to PNG with seeded, repeatable statistics"""
+        image, stats = _demo_analysis_figure(analysis, variant)
+
+        assert image.startswith(b"\x89PNG")
+        assert stats
+        assert _demo_analysis_figure(analysis, variant)[1] == stats
+
+    @pytest.mark.parametrize(
+        "map_type,building_type",
+        [
+            ("Building Types", "All"),
+            ("Occupancy Heatmap", "All"),
+            ("Density Map", "All"),
+            ("Density Map", "Residential"),
+            ("Combined View", "All"),
+        ],
+    )
+    def test_demo_city_map_image(self, map_type, building_type):
+        """City map views render to PNG"""
+        image = _demo_city_map_image(20, map_type, building_type)
+
+        assert image.startswith(b"\x89PNG")
+
     def test_create_multiple_city_maps(self, dashboard):
         """Test creating multiple city maps with different sizes"""
         sizes = [20, 30, 50]
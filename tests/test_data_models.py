@@ -0,0 +1,329 @@
+"""
+Tests for data models
+
+データモデルの単体テスト
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.agents.household import HouseholdProfileGenerator
+from src.models.data_models import (
+    HOUSEHOLD_HISTORY_KEYS,
+    SCALAR_HISTORY_KEYS,
+    EmploymentStatus,
+    FirmProfile,
+    GoodCategory,
+    HistoryMatrix,
+    HistorySeries,
+    HouseholdProfile,
+    MarketState,
+    SimulationState,
+)
+from src.utils.serialization import dumps
+
+
+class TestHistorySeries:
+    """NumPy履歴バッファのテスト"""
+
+    def test_append_and_list_compatibility(self):
+        """list互換のアクセス"""
+        series = HistorySeries(capacity=2)
+        for value in [1.0, 2.0, 3.0]:
+            series.append(value)
+
+        assert len(series) == 3
+        assert series[-1] == 3.0
+        assert series[-2:] == [2.0, 3.0]
+        assert series == [1.0, 2.0, 3.0]
+        assert list(series) == [1.0, 2.0, 3.0]
+
+    def test_values_view(self):
+        """配列ビューで集計できる"""
+        series = HistorySeries(capacity=10, values=[1.0, 2.0, 3.0])
+
+        assert isinstance(series.values, np.ndarray)
+        assert series.values.mean() == 2.0
+        assert np.array(series).tolist() == [1.0, 2.0, 3.0]
+
+    def test_extend_and_window(self):
+        """一括追加で容量を拡張し、直近の値をビューで取得できる"""
+        series = HistorySeries(capacity=2, values=[1.0])
+        series.extend([2.0, 3.0, 4.0])
+
+        assert series == [1.0, 2.0, 3.0, 4.0]
+        window = series.window(2)
+        assert window.tolist() == [3.0, 4.0]
+        assert not window.flags.writeable
+        assert series.window(10).tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_copy_is_independent(self):
+        """コピーは元の系列と独立"""
+        series = HistorySeries(values=[1.0])
+        snapshot = series.copy()
+        series.append(2.0)
+
+        assert snapshot == [1.0]
+        assert series == [1.0, 2.0]
+
+
+class TestSimulationStateHistory:
+    """SimulationStateの履歴管理のテスト"""
+
+    def test_init_history(self):
+        """スカラー系列とprices/demandsの初期化"""
+        state = SimulationState()
+        state.init_history(capacity=5)
+
+        for key in SCALAR_HISTORY_KEYS:
+            assert isinstance(state.history[key], HistorySeries)
+            assert len(state.history[key]) == 0
+        for key in HOUSEHOLD_HISTORY_KEYS:
+            assert isinstance(state.history[key], HistoryMatrix)
+        assert state.history["prices"] == {}
+        assert state.history["demands"] == {}
+
+    def test_init_history_memmap(self, tmp_path):
+        """mmap_dir指定時はスカラー系列が.npyファイルに直接書き込まれる"""
+        state = SimulationState()
+        state.init_history(capacity=4, mmap_dir=tmp_path)
+        gdp = state.history["gdp"]
+        gdp.extend([100.0, 110.0])
+        gdp.flush()
+
+        assert gdp.is_memmap
+        stored = np.load(tmp_path / "gdp.npy")
+        assert stored.shape == (4,)
+        assert stored[: len(gdp)].tolist() == [100.0, 110.0]
+
+    def test_memmap_grows_with_file(self, tmp_path):
+        """容量を超えてもメモリマップを保ち、.npyファイルごと拡張される"""
+        state = SimulationState()
+        state.init_history(capacity=2, mmap_dir=tmp_path)
+        gdp = state.history["gdp"]
+        gdp.extend([1.0, 2.0])
+        gdp.append(3.0)
+        gdp.extend([4.0, 5.0, 6.0])
+        gdp.flush()
+
+        assert gdp.is_memmap
+        assert gdp == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        stored = np.load(tmp_path / "gdp.npy")
+        assert stored[: len(gdp)].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_load_history_reopens_memmap(self, tmp_path):
+        """mmap_dir指定で復元すると既存の.npyにマップし直して書き込みを続ける"""
+        state = SimulationState()
+        state.init_history(capacity=4, mmap_dir=tmp_path)
+        state.history["gdp"].extend([1.0, 2.0])
+        data = json.loads(json.dumps(state.to_dict()))
+
+        restored = SimulationState()
+        restored.load_history(data["history"], capacity=4, mmap_dir=tmp_path)
+        gdp = restored.history["gdp"]
+        gdp.append(3.0)
+        gdp.flush()
+
+        assert gdp.is_memmap
+        assert gdp == [1.0, 2.0, 3.0]
+        stored = np.load(tmp_path / "gdp.npy")
+        assert stored.shape == (4,)
+        assert stored[:3].tolist() == [1.0, 2.0, 3.0]
+
+    def test_history_roundtrip(self):
+        """JSON経由で保存・復元できる"""
+        state = SimulationState()
+        state.init_history(capacity=5)
+        state.history["gdp"].extend([100.0, 110.0])
+        state.history["prices"]["food"] = [1.0, 1.1]
+
+        data = json.loads(json.dumps(state.to_dict()))
+
+        restored = SimulationState()
+        restored.load_history(data["history"], capacity=5)
+
+        assert isinstance(restored.history["gdp"], HistorySeries)
+        assert restored.history["gdp"] == [100.0, 110.0]
+        assert restored.history["prices"] == {"food": [1.0, 1.1]}
+
+    def test_load_history_consume(self):
+        """consume=Trueでは変換済みの系列を入力から取り除く"""
+        history = {"gdp": [100.0, 110.0], "prices": {"food": [1.0]}}
+
+        state = SimulationState()
+        state.load_history(history, capacity=5, consume=True)
+
+        assert history == {}
+        assert state.history["gdp"] == [100.0, 110.0]
+        assert state.history["prices"] == {"food": [1.0]}
+
+    def test_history_arrays_serialize_like_lists(self):
+        """配列ビューのままでもlist変換時と同じJSONになる"""
+        state = SimulationState()
+        state.init_history(capacity=5)
+        state.history["gdp"].extend([100.0, 110.5])
+
+        as_arrays = state.to_dict(arrays=True)
+
+        assert isinstance(as_arrays["history"]["gdp"], np.ndarray)
+        assert dumps(as_arrays) == dumps(state.to_dict())
+
+
+class TestSimulationStateLookup:
+    """SimulationStateのID索引のテスト"""
+
+    def test_lookup_follows_list_changes(self):
+        """追加・リストの置き換え・要素の書き換えに追従する"""
+        generator = HouseholdProfileGenerator(random_seed=1)
+        first, second, third, fourth = generator.generate(count=4)
+        state = SimulationState(households=[first])
+
+        assert state.get_household(first.id) is first
+        assert state.get_household(second.id) is None
+
+        state.add_household(second)
+        state.households.append(third)
+        assert state.get_household(second.id) is second
+        assert state.get_household(third.id) is third
+
+        state.households[0] = fourth
+        assert state.get_household(fourth.id) is fourth
+        assert state.get_household(first.id) is None
+
+        state.households = [second]
+        assert state.get_household(third.id) is None
+        assert state.get_household(second.id) is second
+
+    def test_lookup_after_direct_remove_and_replace(self):
+        """索引を経由せずに削除・置き換えしても、位置のずれを検知して作り直す"""
+        generator = HouseholdProfileGenerator(random_seed=1)
+        first, second, third, fourth = generator.generate(count=4)
+        state = SimulationState(households=[first, second])
+        assert state.get_household(first.id) is first
+
+        # 長さが変わらない削除+追加（移動したIDの参照で索引を作り直す）
+        state.households.pop(0)
+        state.households.append(third)
+        assert state.get_household(second.id) is second
+        assert state.get_household(third.id) is third
+        assert state.get_household(first.id) is None
+
+        # 要素の置き換え
+        state.households[0] = fourth
+        assert state.get_household(second.id) is None
+        assert state.get_household(fourth.id) is fourth
+
+    def test_remove_and_replace_helpers(self):
+        """remove_*/replace_*は索引を更新する"""
+        generator = HouseholdProfileGenerator(random_seed=1)
+        first, second, third = generator.generate(count=3)
+        state = SimulationState(households=[first, second])
+        assert state.get_household(second.id) is second
+
+        assert state.remove_household(first.id) is first
+        assert state.remove_household(first.id) is None
+        assert state.households == [second]
+        assert state.get_household(second.id) is second
+
+        state.replace_household(0, third)
+        assert state.get_household(third.id) is third
+        assert state.get_household(second.id) is None
+
+    def test_firm_lookup(self):
+        """企業もIDで取得できる"""
+        firm = FirmProfile(
+            id=7, name="f", goods_type="food", goods_category=GoodCategory.FOOD
+        )
+        state = SimulationState()
+        state.add_firm(firm)
+
+        assert state.get_firm(7) is firm
+        assert state.get_firm(8) is None
+        assert state.remove_firm(7) is firm
+        assert state.get_firm(7) is None
+
+
+class TestStateFromDict:
+    """状態データクラスの辞書からの復元のテスト"""
+
+    def test_trusted_matches_validated(self):
+        """trusted=Trueでも通常の復元と同じ状態になる"""
+        market = MarketState(total_jobs=3, goods_prices={"food": 1.5})
+        data = json.loads(json.dumps(market.to_dict()))
+
+        assert MarketState.from_dict(data, trusted=True) == MarketState.from_dict(data)
+
+    def test_trusted_profiles_match_validated(self):
+        """世帯・企業プロファイルもtrusted=Trueで同じ値に復元される"""
+        household = HouseholdProfileGenerator(random_seed=1).generate(count=1)[0]
+        household_data = json.loads(json.dumps(household.to_dict()))
+        restored = HouseholdProfile.from_dict(household_data, trusted=True)
+
+        assert restored == HouseholdProfile.from_dict(household_data)
+        assert isinstance(restored.employment_status, EmploymentStatus)
+
+        firm = FirmProfile(
+            id=1, name="f", goods_type="food", goods_category=GoodCategory.FOOD
+        )
+        firm_data = json.loads(json.dumps(firm.to_dict()))
+
+        assert FirmProfile.from_dict(firm_data, trusted=True) == FirmProfile.from_dict(
+            firm_data
+        )
+
+    def test_invalid_enum_value_raises(self):
+        """列挙型にない値は従来通りValueError"""
+        firm = FirmProfile(
+            id=1, name="f", goods_type="food", goods_category=GoodCategory.FOOD
+        )
+        firm_data = firm.to_dict()
+        firm_data["goods_category"] = "unknown"
+
+        with pytest.raises(ValueError):
+            FirmProfile.from_dict(firm_data)
+
+
+class TestHistoryMatrix:
+    """世帯スナップショット行列のテスト"""
+
+    def test_ragged_rows(self):
+        """世帯数が変化しても行ごとにlistで取得できる"""
+        matrix = HistoryMatrix(capacity=1, width=2)
+        matrix.append([1.0, 2.0])
+        matrix.append(np.array([3.0, 4.0, 5.0]))
+
+        assert len(matrix) == 2
+        assert matrix[0] == [1.0, 2.0]
+        assert matrix[-1] == [3.0, 4.0, 5.0]
+        assert list(matrix) == [[1.0, 2.0], [3.0, 4.0, 5.0]]
+        assert matrix.counts.tolist() == [2, 3]
+        assert np.isnan(matrix.values[0, 2])
+
+    def test_roundtrip(self):
+        """listのlistから復元できる"""
+        rows = [[0.1, 0.2], [0.3]]
+        matrix = HistoryMatrix(rows=rows)
+
+        assert matrix == rows
+        assert json.loads(json.dumps(matrix.tolist())) == rows
+
+    def test_float32_rows_keep_short_decimals(self):
+        """float32で保持しても0〜1の短い小数はそのまま取り出せる"""
+        matrix = HistoryMatrix(dtype=np.float32)
+        matrix.append([0.2, 0.35, 1.0])
+
+        assert matrix.values.dtype == np.float32
+        assert matrix[0] == [0.2, 0.35, 1.0]
+
+    def test_household_incomes_keep_float64(self):
+        """所得はfloat64で保持し、大きな値でも精度を落とさない"""
+        state = SimulationState()
+        state.init_history(capacity=2, household_capacity=1)
+        state.history["household_incomes"].append([123456789.25])
+
+        assert state.history["household_incomes"].values.dtype == np.float64
+        assert state.history["household_incomes"][0] == [123456789.25]
+        assert state.history["food_expenditure_ratios"].values.dtype == np.float32
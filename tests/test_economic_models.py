@@ -4,6 +4,7 @@ Tests for economic models
 経済モデルの単体テスト
 """
 
+import numpy as np
 import pytest
 
 from src.models.economic_models import (
@@ -12,6 +13,7 @@ from src.models.economic_models import (
     TaxationSystem,
     TaylorRule,
     calculate_effective_labor,
+    calculate_effective_labor_batch,
 )
 
 
@@ -46,6 +48,21 @@ class TestProductionFunction:
         assert mpl > 0
         assert mpk > 0
 
+    def test_output_batch_matches_scalar(self):
+        """一括計算はスカラー版と同じ値（負の投入は0）"""
+        prod = ProductionFunction(alpha=0.33, tfp=1.0)
+        labor = np.array([10.0, 0.0, 3.5, -1.0, 8.0])
+        capital = np.array([100.0, 100.0, 0.0, 50.0, 2500.0])
+        tfp = np.array([1.0, 1.2, 0.8, 1.0, 1.5])
+
+        output = prod.calculate_output_batch(labor, capital, tfp)
+
+        expected = [
+            prod.calculate_output(lab, cap, a)
+            for lab, cap, a in zip(labor, capital, tfp, strict=True)
+        ]
+        assert output.tolist() == expected
+
 
 class TestTaxationSystem:
     """累進課税システムのテスト"""
@@ -77,6 +94,20 @@ class TestTaxationSystem:
         effective_rate = tax_system.calculate_effective_rate(30000)
         assert 0 < effective_rate < 0.1
 
+    def test_batch_matches_scalar(self):
+        """一括計算はスカラー版と同じ税額"""
+        tax_system = TaxationSystem(
+            [(20000, 0.1), (0, 0.0), (100000, 0.3), (50000, 0.2)]
+        )
+        incomes = np.array([-5.0, 0.0, 10000.0, 20000.0, 30000.0, 75000.5, 2e6])
+
+        taxes = tax_system.calculate_income_tax_batch(incomes)
+
+        assert taxes.tolist() == [
+            tax_system.calculate_income_tax(income) for income in incomes
+        ]
+        assert taxes[4] == pytest.approx(1000)
+
 
 class TestTaylorRule:
     """Taylor ruleのテスト"""
@@ -149,6 +180,15 @@ class TestMacroeconomicIndicators:
 
         # 1000+2000+3000 + 5000+3000 + 2000 = 16000
         assert gdp == 16000
+        assert (
+            MacroeconomicIndicators.calculate_gdp(
+                np.array(household_incomes, dtype=np.float64),
+                np.array(firm_outputs, dtype=np.float64),
+                government_spending,
+            )
+            == gdp
+        )
+        assert MacroeconomicIndicators.calculate_gdp([], [], -10.0) == 0.0
 
     def test_inflation_calculation(self):
         """インフレ率計算"""
@@ -163,6 +203,22 @@ class TestMacroeconomicIndicators:
         # 平均 5%
         assert inflation == pytest.approx(0.05)
 
+    def test_inflation_skips_unmatched_and_non_positive_prices(self):
+        """共通でない商品・前期価格0以下の商品は除外"""
+        prev_prices = {"food": 100, "clothing": 0, "housing": 50}
+        curr_prices = {"food": 110, "clothing": 20, "furniture": 30}
+
+        inflation = MacroeconomicIndicators.calculate_inflation(
+            curr_prices, prev_prices
+        )
+
+        assert inflation == pytest.approx(0.1)
+        assert MacroeconomicIndicators.calculate_inflation({"food": 1.0}, {}) == 0.0
+        assert (
+            MacroeconomicIndicators.calculate_inflation({"food": 1.0}, {"food": 0.0})
+            == 0.0
+        )
+
     def test_unemployment_rate(self):
         """失業率計算"""
         unemployment_rate = MacroeconomicIndicators.calculate_unemployment_rate(
@@ -185,6 +241,18 @@ class TestMacroeconomicIndicators:
         )
         assert 0 < gini_unequal < 1
 
+    def test_gini_coefficient_accepts_arrays(self):
+        """NumPy配列をそのまま渡せる（元の配列は変更しない）"""
+        incomes = np.array([1000.0, 2000.0, -50.0, 10000.0])
+
+        gini = MacroeconomicIndicators.calculate_gini_coefficient(incomes)
+
+        assert gini == pytest.approx(
+            MacroeconomicIndicators.calculate_gini_coefficient(incomes.tolist())
+        )
+        assert incomes[2] == -50.0
+        assert MacroeconomicIndicators.calculate_gini_coefficient(np.zeros(0)) == 0.0
+
 
 class TestEffectiveLabor:
     """実効労働量計算のテスト"""
@@ -219,6 +287,18 @@ class TestEffectiveLabor:
         # スキルレベルが要件より低い => 2.0より小さい
         assert 0 < effective_labor < 2.0
 
+    def test_batch_matrix(self):
+        """スキル行列版: 比率の上限1.0で平均し、全労働者で合計"""
+        skill_levels = np.array([[0.4, 1.0], [0.8, 0.1]])
+        required_levels = np.array([0.8, 0.2])
+
+        effective_labor = calculate_effective_labor_batch(skill_levels, required_levels)
+
+        # (0.5 + 1.0) / 2 + (1.0 + 0.5) / 2 = 1.5
+        assert effective_labor == pytest.approx(1.5)
+        assert calculate_effective_labor_batch(np.zeros((3, 0)), np.zeros(0)) == 3.0
+        assert calculate_effective_labor_batch(np.zeros((0, 2)), required_levels) == 0.0
+
 
 def test_data_models_serialization():
     """データモデルのシリアライズテスト"""
@@ -69,6 +69,21 @@ class TestBuilding:
         assert result is False
         assert len(building.occupants) == 2
 
+    def test_add_occupants(self):
+        building = Building(
+            building_id=1,
+            building_type=BuildingType.RESIDENTIAL,
+            location=(10, 20),
+            capacity=3,
+            occupants=[101],
+        )
+
+        # Duplicates are skipped and additions stop at capacity
+        added = building.add_occupants([101, 102, 102, 103, 104])
+        assert added == 2
+        assert building.occupants == [101, 102, 103]
+        assert building.add_occupants([105]) == 0
+
     def test_remove_occupant(self):
         building = Building(
             building_id=1,
@@ -86,6 +86,39 @@ class TestGoodsMarket:
         assert stats["total_transactions"] == 1
         assert stats["total_volume"] == 500.0  # 50 * 10.0
 
+    def test_market_prices_array(self, market):
+        listings = [
+            GoodListing(firm_id=1, good_id="food_basic", quantity=100, price=10.0),
+            GoodListing(firm_id=2, good_id="clothing_basic", quantity=50, price=20.0),
+        ]
+        orders = [
+            GoodOrder(
+                household_id=101, good_id="food_basic", quantity=50, max_price=12.0
+            ),
+            GoodOrder(
+                household_id=102, good_id="clothing_basic", quantity=30, max_price=25.0
+            ),
+        ]
+        market.match(listings, orders)
+
+        good_ids, prices = market.get_market_prices_array()
+
+        assert dict(zip(good_ids, prices, strict=True)) == market.get_market_prices()
+        # 取引がない間は同じ配列を再利用
+        assert market.get_market_prices_array()[0] is good_ids
+
+        market.match(
+            [GoodListing(firm_id=1, good_id="food_basic", quantity=10, price=14.0)],
+            [
+                GoodOrder(
+                    household_id=101, good_id="food_basic", quantity=10, max_price=15.0
+                )
+            ],
+        )
+
+        assert market.get_market_prices()["food_basic"] == 12.0
+        assert market.get_market_prices_array()[0] is not good_ids
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
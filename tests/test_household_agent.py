@@ -2,6 +2,7 @@
 Tests for HouseholdAgent and HouseholdProfileGenerator
 """
 
+import random
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -144,6 +145,20 @@ class TestHouseholdProfileGenerator:
             elif profile.education_level == EducationLevel.GRADUATE:
                 assert 4 <= skill_count <= 5
 
+    def test_seeded_generation_leaves_global_random_state(self):
+        """シード指定の生成は再現可能で、グローバルな乱数状態を変更しない"""
+        random.seed(0)
+        np.random.seed(0)
+        expected = (random.random(), np.random.random())
+
+        random.seed(0)
+        np.random.seed(0)
+        first = HouseholdProfileGenerator(random_seed=7).generate(count=3, seed=11)
+        second = HouseholdProfileGenerator().generate(count=3, seed=11)
+
+        assert (random.random(), np.random.random()) == expected
+        assert [p.to_dict() for p in first] == [p.to_dict() for p in second]
+
 
 class TestHouseholdAgent:
     """HouseholdAgentのテスト"""
@@ -295,6 +310,17 @@ class TestHouseholdAgent:
             assert "action" in memory
             assert "arguments" in memory
 
+    def test_record_purchase_food_spending(self, sample_profile, mock_llm):
+        """食料カテゴリの財のみ食料支出に計上される"""
+        agent = HouseholdAgent(profile=sample_profile, llm_interface=mock_llm)
+
+        agent.record_purchase("food_basic", quantity=2.0, price=10.0)
+        agent.record_purchase("clothing_casual", quantity=1.0, price=30.0)
+
+        assert agent.total_spending == 50.0
+        assert agent.food_spending == 20.0
+        assert agent.purchased_goods == {"food_basic": 2.0, "clothing_casual": 1.0}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -14,6 +14,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,9 +30,10 @@ from src.environment.markets.financial_market import (
 )
 from src.environment.markets.goods_market import GoodListing, GoodOrder, GoodsMarket
 from src.environment.markets.labor_market import JobPosting, JobSeeker, LaborMarket
-from src.environment.simulation import Simulation
+from src.environment.simulation import Simulation, _sample_rows_without_replacement
 from src.models.data_models import EmploymentStatus
 from src.utils.config import load_config
+from src.utils.serialization import load_jsonl_columns
 
 
 class TestMarketIntegration:
@@ -256,6 +258,18 @@ class TestMarketIntegration:
         assert len(labor_matches) >= 0
         assert len(loan_results) == len(test_firms)
 
+    def test_fallback_listing_sample(self):
+        """Test per-household listing samples are distinct and cover all listings"""
+        rng = np.random.default_rng(0)
+        choices = _sample_rows_without_replacement(rng, 7, 2000, 5)
+
+        assert choices.shape == (2000, 5)
+        assert all(len(set(row)) == 5 for row in choices.tolist())
+        assert set(np.unique(choices).tolist()) == set(range(7))
+        # When k equals the population, every row is a permutation
+        full = _sample_rows_without_replacement(rng, 3, 10, 3)
+        assert np.sort(full, axis=1).tolist() == [[0, 1, 2]] * 10
+
 
 class TestSimulationExecution:
     """Test simulation execution over multiple steps"""
@@ -373,6 +387,63 @@ class TestSimulationExecution:
         # Policy rate
         assert indicators["policy_rate"] >= 0
 
+    def test_consumption_budgets(self):
+        """Test vectorized consumption budgets follow the buffer-stock rules"""
+        incomes = np.array([1000.0, 1000.0, 1000.0, 0.0, 0.0])
+        cash = np.array([5000.0, 500.0, 2000.0, 1000.0, 50.0])
+
+        budgets = Simulation._consumption_budgets(incomes, cash)
+
+        # 85% / 75% / 80% of income, 30% of cash without income, none below 100
+        assert budgets.tolist() == pytest.approx([850.0, 750.0, 800.0, 300.0, 0.0])
+
+    def test_indicators_reuse_last_step(self, simulation_with_data):
+        """Test get_indicators/get_metrics return the indicators of the last step"""
+        sim = simulation_with_data
+
+        step_indicators = sim.step()
+        indicators = sim.get_indicators()
+        metrics = sim.get_metrics()
+
+        assert indicators == step_indicators
+        assert indicators is not step_indicators
+        assert metrics["gdp"] == sim.state.history["gdp"][-1]
+        assert metrics["inflation"] == sim.state.history["inflation"][-1]
+        assert "average_income" in metrics
+
+        # step()の戻り値を変更しても保持された指標は変わらない
+        step_indicators["gdp"] = -123.0
+        assert sim.get_indicators()["gdp"] == sim.state.history["gdp"][-1]
+
+        # 同じステップ内の再呼び出しはメモ化された結果のコピー
+        metrics["gdp"] = -1.0
+        assert sim.get_metrics()["gdp"] == sim.state.history["gdp"][-1]
+        sim.step()
+        assert sim.get_metrics()["gdp"] == sim.state.history["gdp"][-1]
+
+    def test_inflow_households_get_unique_ids(self, simulation_with_data):
+        """Test households added after initialization do not reuse IDs"""
+        sim = simulation_with_data
+
+        sim.add_households(2)
+        sim.step()
+
+        ids = [h.profile.id for h in sim.households]
+        assert len(ids) == len(set(ids))
+        assert all(sim._households_by_id[i].profile.id == i for i in ids)
+
+    def test_market_snapshot_tracks_matching(self, simulation_with_data):
+        """Test the market snapshot is shared until the goods market is matched"""
+        sim = simulation_with_data
+
+        snapshot = sim._market_snapshot()
+        assert sim._market_snapshot() is snapshot
+
+        sim.step()
+        prices, demands = sim._market_snapshot()
+        assert prices == sim.goods_market.get_market_prices()
+        assert demands == sim.goods_market.get_market_demands()
+
     def test_simulation_reset(self, simulation_with_data):
         """Test simulation reset functionality"""
         sim = simulation_with_data
@@ -563,6 +634,72 @@ class TestStatePersistence:
             # Cleanup
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_run_streams_indicators_and_saves_results(self, simulation_with_data):
+        """Test JSONL streaming in run() and save_results output"""
+        sim = simulation_with_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            returned = sim.run(
+                steps=3,
+                results_path=output_dir / "indicators.jsonl",
+                return_list=False,
+            )
+            assert returned is None
+            sim.save_results(output_dir)
+
+            lines = (output_dir / "indicators.jsonl").read_text().splitlines()
+            assert [json.loads(line)["step"] for line in lines] == [1, 2, 3]
+            columns = load_jsonl_columns(output_dir / "indicators.jsonl")
+            assert columns["step"] == [1, 2, 3]
+            assert columns["gdp"] == sim.state.history["gdp"].tolist()
+
+            with open(output_dir / "results.json", encoding="utf-8") as f:
+                results = json.load(f)
+            assert results["history"]["gdp"] == sim.state.history["gdp"].tolist()
+
+            with open(output_dir / "summary.json", encoding="utf-8") as f:
+                summary = json.load(f)
+            assert summary["steps"] == 3
+
+            assert summary["avg_gdp"] == pytest.approx(
+                sum(results["history"]["gdp"]) / 3
+            )
+
+            # Household snapshots go to .npy only when left out of the JSON
+            assert not (output_dir / "household_incomes.npy").exists()
+            split_dir = output_dir / "split"
+            sim.save_results(split_dir, embed_household_history=False)
+            incomes = np.load(split_dir / "household_incomes.npy")
+            assert incomes.shape[0] == 3
+            with open(split_dir / "results.json", encoding="utf-8") as f:
+                assert "household_incomes" not in json.load(f)["history"]
+
+    def test_run_writes_parquet_chunks(self, simulation_with_data):
+        """Test columnar Parquet chunks written by run()"""
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        sim = simulation_with_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sim.run(steps=3, parquet_dir=temp_dir, flush_every=2)
+
+            chunks = sorted(Path(temp_dir).glob("hist_*.parquet"))
+            assert [chunk.name for chunk in chunks] == [
+                "hist_00000.parquet",
+                "hist_00001.parquet",
+            ]
+            frame = pd.concat(pd.read_parquet(chunk) for chunk in chunks)
+            assert frame["step"].tolist() == [1, 2, 3]
+            assert frame["gdp"].tolist() == sim.state.history["gdp"].tolist()
+
+            # A resumed run continues the numbering instead of overwriting
+            sim.run(steps=1, parquet_dir=temp_dir, flush_every=2)
+            chunks = sorted(Path(temp_dir).glob("hist_*.parquet"))
+            assert chunks[-1].name == "hist_00002.parquet"
+            frame = pd.concat(pd.read_parquet(chunk) for chunk in chunks)
+            assert frame["step"].tolist() == [1, 2, 3, 4]
+
 
 class TestGeographyIntegration:
     """Test geography system integration"""
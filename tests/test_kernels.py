@@ -0,0 +1,59 @@
+"""
+Tests for simulation numeric kernels
+
+指標計算カーネルの単体テスト
+"""
+
+import numpy as np
+import pytest
+
+from src.environment._kernels import (
+    _gini_price_index_loop,
+    _gini_price_index_numpy,
+    gini_price_index,
+    warmup_kernels,
+)
+from src.models.economic_models import MacroeconomicIndicators
+
+
+@pytest.mark.parametrize(
+    "kernel", [gini_price_index, _gini_price_index_loop, _gini_price_index_numpy]
+)
+class TestGiniPriceIndex:
+    """Gini係数・平均価格カーネルのテスト"""
+
+    def test_gini_matches_reference(self, kernel):
+        """Gini係数が既存実装と一致"""
+        incomes = np.array([1000.0, 2000.0, 3000.0, 10000.0, -50.0])
+        empty = np.zeros(0)
+
+        gini, _, _, _ = kernel(incomes, empty, empty, np.zeros(0, dtype=bool))
+
+        expected = MacroeconomicIndicators.calculate_gini_coefficient(incomes.tolist())
+        assert gini == pytest.approx(expected)
+
+    def test_common_goods_average(self, kernel):
+        """共通財のみで平均価格を計算"""
+        prices = np.array([10.0, 20.0, 99.0])
+        base_prices = np.array([5.0, 10.0, 0.0])
+        mask = np.array([True, True, False])
+
+        _, current_avg, base_avg, count = kernel(np.zeros(0), prices, base_prices, mask)
+
+        assert count == 2
+        assert current_avg == pytest.approx(15.0)
+        assert base_avg == pytest.approx(7.5)
+
+    def test_no_common_goods(self, kernel):
+        """共通財がない場合"""
+        values = np.array([1.0])
+
+        gini, _, _, count = kernel(values, values, values, np.array([False]))
+
+        assert gini == 0.0
+        assert count == 0
+
+
+def test_warmup_kernels():
+    """ウォームアップ呼び出しが例外なく完了する"""
+    warmup_kernels()
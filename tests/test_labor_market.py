@@ -273,6 +273,18 @@ class TestLaborMarket:
         assert len(matches) == 0
         assert market.rejected_by_distance > 0
 
+    def test_auction_matching(self, sample_postings, sample_seekers):
+        """閾値を超えた場合はオークション割当で求人枠を超えずにマッチング"""
+        market = LaborMarket(matching_probability=1.0, auction_threshold=0)
+
+        matches = market.match(sample_postings, sample_seekers)
+
+        # 101・103の留保賃金を満たすのは企業1（2枠）のみのため、102は企業2へ
+        matched = {m.household_id: m.firm_id for m in matches}
+        assert matched == {101: 1, 102: 2, 103: 1}
+        assert all(p.num_openings == 0 for p in sample_postings)
+        assert market.get_statistics()["total_matches"] == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,128 @@
+"""Tests for LLM response cache"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.cache import LLMResponseCache
+from src.llm.llm_interface import LLMInterface
+from tests.conftest import fake_response
+
+FUNCTIONS = [{"name": "decide", "parameters": {"type": "object", "properties": {}}}]
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class TestLLMResponseCache:
+    def test_key_depends_on_request(self):
+        key = LLMResponseCache.make_key("m", MESSAGES, FUNCTIONS, 0.0)
+
+        assert key == LLMResponseCache.make_key("m", MESSAGES, FUNCTIONS, 0.0)
+        assert key != LLMResponseCache.make_key("m", MESSAGES, FUNCTIONS, 0.7)
+        assert key != LLMResponseCache.make_key("other", MESSAGES, FUNCTIONS, 0.0)
+
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        for key in ["a", "b", "c"]:
+            cache.set(key, {"function_name": key, "arguments": {}})
+
+        assert cache.get("a") is None
+        assert cache.get("c")["function_name"] == "c"
+        assert cache.get_stats()["entries"] == 2
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(ttl=-1.0)
+        cache.set("a", {"function_name": "a", "arguments": {}})
+
+        assert cache.get("a") is None
+
+    def test_persistent_cache(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=tmp_path)
+        cache.set("a", {"function_name": "a", "arguments": {"x": 1}})
+
+        reloaded = LLMResponseCache(cache_dir=tmp_path)
+
+        assert reloaded.get("a") == {"function_name": "a", "arguments": {"x": 1}}
+
+
+class TestLLMInterfaceResponseCache:
+    def test_cached_call_skips_api(self):
+        llm = LLMInterface(
+            api_key="test", temperature=0.0, response_cache=LLMResponseCache()
+        )
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.return_value = fake_response(
+            "decide", '{"amount": 1}'
+        )
+
+        first = llm.function_call("system", "user", FUNCTIONS)
+        second = llm.function_call("system", "user", FUNCTIONS)
+
+        assert llm.client.chat.completions.create.call_count == 1
+        assert second["cached"] is True
+        assert second["arguments"] == first["arguments"] == {"amount": 1}
+        # レスポンスオブジェクトは保持せず使用量のみ返す
+        assert "raw_response" not in first
+        assert first["usage"] == {"prompt_tokens": 10, "completion_tokens": 5}
+
+    def test_sampled_call_not_cached(self):
+        llm = LLMInterface(
+            api_key="test", temperature=0.7, response_cache=LLMResponseCache()
+        )
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.return_value = fake_response("decide", "{}")
+
+        llm.function_call("system", "user", FUNCTIONS)
+        llm.function_call("system", "user", FUNCTIONS)
+
+        assert llm.client.chat.completions.create.call_count == 2
+
+
+class TestPromptCacheKey:
+    def test_prompt_cache_key_sent_as_extra_body(self):
+        llm = LLMInterface(api_key="test")
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.return_value = fake_response("decide", "{}")
+
+        llm.function_call("system", "user", FUNCTIONS, prompt_cache_key="household")
+
+        kwargs = llm.client.chat.completions.create.call_args.kwargs
+        assert kwargs["extra_body"] == {"prompt_cache_key": "household"}
+        assert kwargs["messages"][0] == {"role": "system", "content": "system"}
+
+    def test_no_extra_body_without_key(self):
+        llm = LLMInterface(api_key="test")
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.return_value = fake_response("decide", "{}")
+
+        llm.function_call("system", "user", FUNCTIONS)
+
+        assert "extra_body" not in llm.client.chat.completions.create.call_args.kwargs
+
+    def test_cached_tokens_are_tracked(self):
+        llm = LLMInterface(api_key="test")
+        response = fake_response("decide", "{}")
+        response.usage.prompt_tokens_details = SimpleNamespace(cached_tokens=8)
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.return_value = response
+
+        llm.function_call("system", "user", FUNCTIONS, prompt_cache_key="household")
+
+        summary = llm.get_cost_summary()
+        assert summary["total_cached_tokens"] == 8
+        assert summary["cached_token_ratio"] == 0.8
+
+
+class TestStaticPromptCache:
+    def test_static_content_cache_is_bounded_lru(self):
+        llm = LLMInterface(api_key="test", max_prompt_cache_entries=2)
+        llm.cache_static_content("a", "A")
+        llm.cache_static_content("b", "B")
+        assert llm.get_cached_static_content("a") == "A"  # aを最近使用に
+        llm.cache_static_content("c", "C")
+
+        assert llm.get_cached_static_content("b") is None
+        assert llm.get_cached_static_content("a") == "A"
+        assert llm.get_cache_stats()["static_content_cached"] == 2
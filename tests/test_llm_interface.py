@@ -0,0 +1,244 @@
+"""Tests for LLMInterface"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import openai
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.llm_interface import LLMInterface
+from tests.conftest import fake_response
+
+FUNCTIONS = [{"name": "decide", "parameters": {"type": "object", "properties": {}}}]
+
+
+class TestBatchFunctionCall:
+    def _llm(self, *responses):
+        llm = LLMInterface(api_key="test")
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.side_effect = list(responses)
+        return llm
+
+    @staticmethod
+    def _batch_response(decisions):
+        return fake_response("submit_decisions", json.dumps({"decisions": decisions}))
+
+    def test_single_call_for_batch(self):
+        llm = self._llm(
+            self._batch_response(
+                [
+                    {"agent": 2, "function_name": "decide", "arguments": {"x": 2}},
+                    {"agent": 1, "function_name": "decide", "arguments": {"x": 1}},
+                ]
+            )
+        )
+
+        results = llm.batch_function_call("system", ["a", "b"], FUNCTIONS)
+
+        assert [r["arguments"] for r in results] == [{"x": 1}, {"x": 2}]
+        assert llm.client.chat.completions.create.call_count == 1
+        kwargs = llm.client.chat.completions.create.call_args.kwargs
+        assert kwargs["functions"][0]["name"] == "submit_decisions"
+
+    def test_missing_decision_is_retried(self):
+        llm = self._llm(
+            self._batch_response(
+                [{"agent": 1, "function_name": "decide", "arguments": {"x": 1}}]
+            ),
+            fake_response("decide", '{"x": 2}'),
+        )
+
+        results = llm.batch_function_call("system", ["a", "b"], FUNCTIONS)
+
+        assert [r["arguments"] for r in results] == [{"x": 1}, {"x": 2}]
+        retry_kwargs = llm.client.chat.completions.create.call_args.kwargs
+        assert retry_kwargs["messages"][1]["content"] == "b"
+
+
+class TestConcurrentFunctionCalls:
+    def test_concurrency_is_limited(self):
+        llm = LLMInterface(api_key="test")
+        state = {"active": 0, "peak": 0}
+
+        async def create(**kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return fake_response("decide", "{}")
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [
+            {"system_prompt": "s", "user_prompt": f"u{i}", "functions": FUNCTIONS}
+            for i in range(6)
+        ]
+
+        responses = llm.run_function_calls(requests, max_concurrency=2)
+
+        assert [r["function_name"] for r in responses] == ["decide"] * 6
+        assert state["peak"] == 2
+        # 同じイベントループを再利用して繰り返し呼び出せる
+        assert len(llm.run_function_calls(requests[:1])) == 1
+
+    def test_concurrency_defaults_to_max_concurrent(self):
+        llm = LLMInterface(api_key="test", max_concurrent=3)
+        state = {"active": 0, "peak": 0}
+
+        async def create(**kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return fake_response("decide", "{}")
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [
+            {"system_prompt": "s", "user_prompt": f"u{i}", "functions": FUNCTIONS}
+            for i in range(8)
+        ]
+
+        responses = llm.run_function_calls(requests)
+
+        assert len(responses) == 8
+        assert state["peak"] == 3
+        assert LLMInterface(api_key="test").max_concurrent == 20
+
+    def test_straggler_is_cancelled_after_request_timeout(self):
+        llm = LLMInterface(api_key="test", request_timeout=0.05, max_retries=1)
+
+        async def create(**kwargs):
+            if kwargs["messages"][1]["content"] == "slow":
+                await asyncio.sleep(10)
+            return fake_response("decide", "{}")
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [
+            {"system_prompt": "s", "user_prompt": prompt, "functions": FUNCTIONS}
+            for prompt in ["fast", "slow"]
+        ]
+
+        responses = llm.run_function_calls(requests)
+
+        assert responses[0]["function_name"] == "decide"
+        assert responses[1]["function_name"] is None
+        assert responses[1]["error"] == "TimeoutError"
+
+    def test_request_timeout_defaults_to_api_timeout(self):
+        llm = LLMInterface(api_key="test", timeout=0.04, max_retries=1)
+        assert llm.request_timeout == pytest.approx(0.06)
+
+        async def create(**kwargs):
+            if kwargs["messages"][1]["content"] == "hang":
+                await asyncio.Event().wait()
+            return fake_response("decide", "{}")
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [
+            {"system_prompt": "s", "user_prompt": prompt, "functions": FUNCTIONS}
+            for prompt in ["a", "hang", "b"]
+        ]
+
+        responses = llm.run_function_calls(requests)
+
+        assert [r["function_name"] for r in responses] == ["decide", None, "decide"]
+        assert responses[1] == {
+            "function_name": None,
+            "arguments": {},
+            "error": "TimeoutError",
+        }
+
+    def test_hung_attempt_is_retried_within_its_own_deadline(self):
+        llm = LLMInterface(api_key="test", request_timeout=0.05, max_retries=2)
+        llm.retry_delay = 0.0
+        attempts = []
+
+        async def create(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                await asyncio.Event().wait()
+            return fake_response("decide", "{}")
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [{"system_prompt": "s", "user_prompt": "u", "functions": FUNCTIONS}]
+
+        responses = llm.run_function_calls(requests)
+
+        assert len(attempts) == 2
+        assert responses[0]["function_name"] == "decide"
+
+    def test_sdk_retries_are_disabled(self):
+        llm = LLMInterface(api_key="test")
+        assert llm.client.max_retries == 0
+        assert llm.async_client.max_retries == 0
+
+    def test_requests_are_scheduled_in_chunks(self):
+        llm = LLMInterface(api_key="test")
+        state = {"active": 0, "peak": 0}
+
+        async def create(**kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return fake_response("decide", json.dumps({"u": kwargs["messages"][1]}))
+
+        llm.async_client = MagicMock()
+        llm.async_client.chat.completions.create = AsyncMock(side_effect=create)
+        requests = [
+            {"system_prompt": "s", "user_prompt": f"u{i}", "functions": FUNCTIONS}
+            for i in range(5)
+        ]
+
+        responses = asyncio.run(llm.batch_function_calls(requests, chunk_size=2))
+
+        assert state["peak"] == 2
+        assert [r["arguments"]["u"]["content"] for r in responses] == [
+            f"u{i}" for i in range(5)
+        ]
+
+
+class TestRetryBackoff:
+    @staticmethod
+    def _status_error(error_class, status, headers=None):
+        response = SimpleNamespace(
+            status_code=status, headers=headers or {}, request=None
+        )
+        return error_class("error", response=response, body=None)
+
+    def test_bad_request_is_not_retried(self):
+        llm = LLMInterface(api_key="test", max_retries=3)
+        llm.client = MagicMock()
+        llm.client.chat.completions.create.side_effect = self._status_error(
+            openai.BadRequestError, 400
+        )
+
+        with pytest.raises(openai.BadRequestError):
+            llm.function_call("system", "user", FUNCTIONS)
+        assert llm.client.chat.completions.create.call_count == 1
+        # 同期呼び出しも試行ごとにrequest_timeoutで打ち切る
+        kwargs = llm.client.chat.completions.create.call_args.kwargs
+        assert kwargs["timeout"] == llm.request_timeout
+
+    def test_rate_limit_backoff_honors_retry_after(self):
+        llm = LLMInterface(api_key="test", max_retries=3)
+        llm.retry_delay = 0.5
+        error = self._status_error(
+            openai.RateLimitError, 429, headers={"retry-after": "3"}
+        )
+
+        assert llm._retry_wait(0, error) == 3.0
+        # 2回目の試行後はretry_delay * 2 にジッタ（最大同量）を加えた待機
+        assert 1.0 <= llm._retry_wait(1, RuntimeError("timeout")) <= 2.0
+        # 最終試行の後は再試行しない
+        assert llm._retry_wait(2, error) is None
@@ -44,6 +44,17 @@ class TestEconomicPlots:
 
         plt.close(fig)
 
+    def test_plot_time_series_downsampled(self, plots):
+        """Test that long series are thinned while keeping step numbers"""
+        fig = plots.plot_time_series({"GDP": list(range(1000))}, max_points=300)
+
+        x, y = fig.axes[0].lines[0].get_data()
+        assert len(x) <= 300
+        assert list(x[:2]) == [0, 4]
+        assert list(y) == list(x)
+
+        plt.close(fig)
+
     def test_plot_time_series_with_save(self, plots, sample_time_series, tmp_path):
         """Test time series plotting with file save"""
         save_path = tmp_path / "time_series.png"